@@ -73,6 +73,14 @@ Key functions
 
    shorthand for :func:`merit_factors.quantization_noise_gain`
 
+.. function:: quantization_noise_gain_many()
+
+   shorthand for :func:`merit_factors.quantization_noise_gain_many`
+
+.. class:: DesignExecutor()
+
+   shorthand for :class:`executor.DesignExecutor`
+
 
 Submodules
 ----------
@@ -99,6 +107,9 @@ Submodules
 :mod:`pydsm.NTFdesign.helpers`
   Helper functions
 
+:mod:`pydsm.NTFdesign.executor`
+  Pool of worker processes for serving NTF designs
+
 
 Legacy submodule
 ----------------
@@ -116,12 +127,21 @@ Deprecated submodules
 """
 
 
-from .merit_factors import quantization_noise_gain
-from .minmax import ntf_fir_minmax
-from .delsig import ntf_schreier, ntf_chebyshev, ntf_clans
-from .psychoacoustic import ntf_dunn, ntf_fir_audio_weighting
-from .weighting import (ntf_fir_weighting, ntf_hybrid_weighting,
-                        mult_weightings)
+# Key functions are imported from their submodules on first access
+from .._lazy import lazy_attributes
+__getattr__, __dir__, __all__ = lazy_attributes(
+    __name__,
+    ['delsig', 'weighting', 'minmax', 'psychoacoustic', 'merit_factors',
+     'helpers', 'executor', 'legacy', 'filter_based'],
+    {'.merit_factors': ['quantization_noise_gain',
+                        'quantization_noise_gain_many'],
+     '.minmax': ['ntf_fir_minmax'],
+     '.delsig': ['ntf_schreier', 'ntf_chebyshev', 'ntf_clans'],
+     '.psychoacoustic': ['ntf_dunn', 'ntf_fir_audio_weighting'],
+     '.weighting': ['ntf_fir_weighting', 'ntf_hybrid_weighting',
+                    'mult_weightings'],
+     '.executor': ['DesignExecutor']})
+del lazy_attributes
 
 from .._pytesttester import PytestTester
 test = PytestTester(__name__)
@@ -117,6 +117,47 @@ class Benchmark_ntf_fir_weighting(object):
         benchmark.extra_info['Constraints delta'] = pe
         benchmark.extra_info['Quantization noise'] = mf
 
+    def benchmark_ntf_fir_weighting_cvxpy_clarabel(self, benchmark):
+        try:
+            import cvxpy     # analysis:ignore
+            import clarabel     # analysis:ignore
+        except:
+            pytest.skip("Modeler 'cvxpy' or solver 'clarabel' not installed")
+        ntf = benchmark(ntf_fir_weighting,
+                        self.order, self.hz, self.H_inf,
+                        modeler='cvxpy', show_progress=False,
+                        cvxpy_opts={'solver': 'clarabel'})
+        mf = quantization_noise_gain(ntf, self.hz)
+        vv = np.abs(evalTF(ntf, np.exp(2j*np.pi*self.ff)))
+        pe = np.max(vv)-self.H_inf
+        benchmark.extra_info['Constraints delta'] = pe
+        benchmark.extra_info['Quantization noise'] = mf
+
+    def benchmark_ntf_fir_weighting_cvxpy_dual(self, benchmark):
+        try:
+            import cvxpy     # analysis:ignore
+        except:
+            pytest.skip("Modeler 'cvxpy' not installed")
+        ntf = benchmark(ntf_fir_weighting,
+                        self.order, self.hz, self.H_inf,
+                        modeler='cvxpy', show_progress=False,
+                        formulation='dual')
+        mf = quantization_noise_gain(ntf, self.hz)
+        vv = np.abs(evalTF(ntf, np.exp(2j*np.pi*self.ff)))
+        pe = np.max(vv)-self.H_inf
+        benchmark.extra_info['Constraints delta'] = pe
+        benchmark.extra_info['Quantization noise'] = mf
+
+    def benchmark_ntf_fir_weighting_native(self, benchmark):
+        ntf = benchmark(ntf_fir_weighting,
+                        self.order, self.hz, self.H_inf,
+                        modeler='native', show_progress=False)
+        mf = quantization_noise_gain(ntf, self.hz)
+        vv = np.abs(evalTF(ntf, np.exp(2j*np.pi*self.ff)))
+        pe = np.max(vv)-self.H_inf
+        benchmark.extra_info['Constraints delta'] = pe
+        benchmark.extra_info['Quantization noise'] = mf
+
     def benchmark_ntf_fir_weighting_picos(self, benchmark):
         try:
             import picos     # analysis:ignore
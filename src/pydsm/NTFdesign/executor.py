@@ -0,0 +1,227 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2026, Sergio Callegari
+# All rights reserved.
+
+# This file is part of PyDSM.
+
+# PyDSM is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# PyDSM is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with PyDSM.  If not, see <https://www.gnu.org/licenses/>.
+
+u"""
+Pool of warm NTF design workers (:mod:`pydsm.NTFdesign.executor`)
+=================================================================
+
+This module provides an executor running NTF design functions on a
+persistent pool of worker processes. The workers import the modeling
+libraries and the design code once, when they start, so that the
+design requests submitted to them do not pay for it.
+
+.. currentmodule:: pydsm.NTFdesign.executor
+
+
+Classes
+-------
+
+.. autosummary::
+   :toctree: generated/
+
+   DesignExecutor   -- Executor for NTF design on warm worker processes
+"""
+
+from __future__ import division, print_function
+
+import os
+import sys
+import importlib
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+__all__ = ["DesignExecutor"]
+
+
+# Modules imported by the workers for each modeler
+_MODELER_MODULES = {
+    'cvxpy': ['cvxpy', 'cvxopt'],
+    'cvxpy_old': ['cvxopt', 'pydsm.cvxpy_tdr'],
+    'picos': ['picos', 'cvxopt'],
+    'native': []}
+
+# Design modules imported by the workers for any modeler
+_DESIGN_MODULES = ['pydsm.delsig', 'pydsm.NTFdesign.weighting',
+                   'pydsm.NTFdesign.minmax', 'pydsm.NTFdesign.psychoacoustic',
+                   'pydsm.NTFdesign.merit_factors']
+
+
+def _init_worker(modules):
+    # Worker initializer, importing the modules
+    for m in modules:
+        importlib.import_module(m)
+
+
+def _loaded(modules):
+    # Tell which of the modules are loaded in the worker
+    return [m in sys.modules for m in modules]
+
+
+class DesignExecutor(object):
+    u"""
+    Executor for NTF design on a pool of warm worker processes.
+
+    The worker processes are started when the executor is created and
+    are kept alive until it is shut down. Each worker imports the
+    modeling library of choice and the PyDSM design modules once, so
+    that the design functions submitted to the executor run with warm
+    module level state (imported solvers, cached frequency grids, etc.).
+
+    Parameters
+    ----------
+    max_workers : int, optional
+        number of worker processes. Defaults to the number of processors.
+    modeler : string or list of strings, optional
+        modeler(s) whose libraries the workers import. Any of
+        ``cvxpy``, ``cvxpy_old``, ``picos`` and ``native``. Defaults to
+        ``cvxpy_old``, the default modeler of the FIR NTF designers.
+    max_pending : int, optional
+        maximum number of designs that can be queued or running at the
+        same time. When it is reached, :meth:`submit` blocks until a
+        design completes, so that clients cannot grow the queue without
+        bound. Defaults to twice the number of workers.
+    preload : list of strings, optional
+        names of further modules to import in the workers.
+    mp_context : multiprocessing context, optional
+        context used to start the workers. Defaults to the platform
+        default.
+
+    Notes
+    -----
+    The functions submitted to the executor and their arguments must be
+    picklable. The PyDSM design functions are, as long as they are passed
+    weighting functions defined at module level.
+
+    The executor can be used as a context manager, shutting down the
+    workers on exit.
+
+    Examples
+    --------
+    >>> from pydsm.NTFdesign import DesignExecutor, ntf_fir_minmax
+    >>> with DesignExecutor(2) as ex:                     # doctest: +SKIP
+    ...     ff = [ex.submit(ntf_fir_minmax, 12, 64, H_inf,
+    ...                     show_progress=False)
+    ...           for H_inf in (1.5, 2., 2.5)]
+    ...     ntfs = [f.result() for f in ff]
+    """
+
+    def __init__(self, max_workers=None, modeler='cvxpy_old',
+                 max_pending=None, preload=(), mp_context=None):
+        if isinstance(modeler, str):
+            modeler = [modeler]
+        modules = []
+        for m in modeler:
+            if m not in _MODELER_MODULES:
+                raise ValueError('Unsupported modeling backend {}'.format(m))
+            modules += _MODELER_MODULES[m]
+        modules += _DESIGN_MODULES+list(preload)
+        self.modules = modules
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        self.max_workers = max_workers
+        self._executor = ProcessPoolExecutor(
+            max_workers, mp_context=mp_context, initializer=_init_worker,
+            initargs=(modules,))
+        if max_pending is None:
+            max_pending = 2*self.max_workers
+        self.max_pending = max_pending
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self.warmup()
+
+    def warmup(self):
+        """
+        Make sure that all the workers are started and initialized.
+
+        Called on creation and blocking until the workers are ready.
+        """
+        ff = [self.submit(_loaded, self.modules)
+              for i in range(min(self.max_workers, self.max_pending))]
+        for f in ff:
+            f.result()
+
+    def submit(self, design_fn, *args, **kwargs):
+        """
+        Schedule a design on the workers.
+
+        Parameters
+        ----------
+        design_fn : callable
+            the design function, e.g. :func:`pydsm.NTFdesign.ntf_fir_minmax`.
+        *args, **kwargs :
+            arguments for the design function.
+
+        Returns
+        -------
+        future : concurrent.futures.Future
+            future for the result of the design.
+
+        Notes
+        -----
+        Blocks while there are ``max_pending`` designs queued or running.
+        """
+        self._slots.acquire()
+        try:
+            future = self._executor.submit(design_fn, *args, **kwargs)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda f: self._slots.release())
+        return future
+
+    def map(self, design_fn, *iterables):
+        """
+        Run a design for each set of arguments.
+
+        Parameters
+        ----------
+        design_fn : callable
+            the design function.
+        *iterables :
+            iterables providing the positional arguments of the design
+            function, as in the builtin :func:`map`.
+
+        Returns
+        -------
+        results : iterator
+            iterator over the results, in the order of the arguments.
+        """
+        ff = [self.submit(design_fn, *a) for a in zip(*iterables)]
+        return (f.result() for f in ff)
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        """
+        Shut down the workers.
+
+        Parameters
+        ----------
+        wait : bool, optional
+            whether to wait for the pending designs. Defaults to True.
+        cancel_futures : bool, optional
+            whether to cancel the designs that are not yet running.
+            Defaults to False.
+        """
+        self._executor.shutdown(wait=wait, cancel_futures=cancel_futures)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.shutdown()
+        return False
@@ -36,16 +36,26 @@ Functions
 
    maxflat_fir_zeros     -- Zeros of maxflat FIR transfer function
    spread_fir_uc_zeros   -- Zeros spread on unit circle according to cost
+
+
+Classes
+-------
+
+.. autosummary::
+   :toctree: generated/
+
+   FirNTF                -- FIR NTF with lazily computed zeros
 """
 
 
 from __future__ import division
 
 import numpy as np
+from functools import lru_cache
 from scipy.optimize import minimize
-from ..utilities import digested_options
+from ..utilities import digested_options, _parallel_map, _uc_zero_pairs
 
-__all__ = ["maxflat_fir_zeros", "spread_fir_uc_zeros"]
+__all__ = ["maxflat_fir_zeros", "spread_fir_uc_zeros", "FirNTF"]
 
 
 def maxflat_fir_zeros(order, alpha):
@@ -81,6 +91,37 @@ def maxflat_fir_zeros(order, alpha):
     return p
 
 
+@lru_cache(maxsize=None)
+def _leggauss(order):
+    # Gauss-Legendre nodes and weights, computed once per order
+    x, wx = np.polynomial.legendre.leggauss(order)
+    x.flags.writeable = False
+    wx.flags.writeable = False
+    return x, wx
+
+
+def _uc_noise_gain(xx, order, OSR, w=None, points=128):
+    """
+    In-band noise power gain of a FIR NTF with zeros on the unit circle.
+
+    The zeros are at exp(+/-1j*xx), plus one at z=1 if the order is odd.
+    The gain is computed by a Gauss-Legendre rule on [0, 0.5/OSR], with the
+    NTF magnitude evaluated for all the nodes at once, and returned with
+    its gradient with respect to xx. If w is given, it is a weighting
+    function accepting arrays of frequencies.
+    """
+    x, wx = _leggauss(points)
+    ff = 0.25/OSR*(x+1)
+    wx = 0.25/OSR*wx
+    if w is not None:
+        wx = wx*np.asarray(w(ff), dtype=float)
+    om = 2*np.pi*ff[:, np.newaxis]
+    h2, dl = _uc_zero_pairs(om, xx)
+    if order % 2 != 0:
+        h2 = h2*(2-2*np.cos(om[:, 0]))
+    return 2*wx.dot(h2), 2*(wx*h2).dot(dl)
+
+
 def spread_fir_uc_zeros(order, OSR, cf, cf_args=[], cf_kwargs={}, **options):
     """
     Compute the best spreading of zerors on the unit circle.
@@ -99,10 +140,14 @@ def spread_fir_uc_zeros(order, OSR, cf, cf_args=[], cf_kwargs={}, **options):
         the transfer function order
     OSR : float
         the oversampling ratio
-    cf : function
+    cf : function or None
         cost function for the optimization. Takes a transfer
         function in zpk form as the first argument plus more
-        arguments as required
+        arguments as required. If None, the cost is the in-band
+        quantization noise power gain, computed in a vectorized way and
+        with its exact gradient. In this case, a weighting function
+        accepting arrays of frequencies can be passed as the ``w`` entry
+        of ``cf_kwargs``.
     cf_args: list
         positional args of function ``cf``
     cf_kwargs: dict
@@ -115,6 +160,26 @@ def spread_fir_uc_zeros(order, OSR, cf, cf_args=[], cf_kwargs={}, **options):
 
     Other parameters
     ----------------
+    cf_jac : function, optional
+        gradient hook for the cost function. Takes the same arguments as
+        ``cf`` and returns the derivatives of the cost with respect to the
+        angles of the zeros in the upper half plane, in the order in which
+        they appear in the transfer function. If None (default), the
+        gradient is approximated by finite differences, unless ``cf`` is
+        None.
+    multistart : int, optional
+        number of optimizations to run from different initial zero
+        placements. The first one starts from zeros uniformly spread in the
+        signal band, the other ones from random placements. The best result
+        is kept. Defaults to 1.
+    seed : int or None, optional
+        seed for the generation of the random initial placements. Defaults
+        to 0, so that the results are deterministic.
+    workers : int or None, optional
+        number of threads used to run the optimizations in multistart mode.
+        Defaults to 1. If None, as many threads as processors are used.
+        The threads provide concurrency, not a speedup, unless ``cf``
+        spends most of its time in code releasing the GIL.
     L-BFGS-B_opts : dictionary, optional
         Parameters passed to the ``F-BFGS-B``
         optimizer. Allowed options are:
@@ -141,12 +206,15 @@ def spread_fir_uc_zeros(order, OSR, cf, cf_args=[], cf_kwargs={}, **options):
     The system is implicitly assumed to be low-pass. Hence, the zeros
     are spread on the unit circle in the [0, pi/OSR] range.
 
+    The optimization is practiced on the logarithm of the cost function.
+
     See Also
     --------
     scipy.optimize.minimize :  for the parameters passed to the ``L-BFGS-B``
         minimizer
     """
     def dof2zeros(xx):
+        zeros = np.zeros(order, dtype=complex)
         zeros[0:xl] = np.exp(1j*xx)
         zeros[xl:2*xl] = zeros[0:xl].conj()
         if order % 2 != 0:
@@ -157,20 +225,127 @@ def spread_fir_uc_zeros(order, OSR, cf, cf_args=[], cf_kwargs={}, **options):
         return np.log10(cf((dof2zeros(xx), np.zeros(order), 1),
                            *cf_args, **cf_kwargs))
 
+    def mf_jac(xx):
+        ntf = (dof2zeros(xx), np.zeros(order), 1)
+        c = cf(ntf, *cf_args, **cf_kwargs)
+        g = np.asarray(opts['cf_jac'](ntf, *cf_args, **cf_kwargs))
+        return np.log10(c), g/(c*np.log(10))
+
+    def mf_builtin(xx):
+        c, g = _uc_noise_gain(xx, order, OSR, **cf_kwargs)
+        return np.log10(c), g/(c*np.log(10))
+
+    def run(x0):
+        return minimize(fun, x0, jac=jac, method='l-bfgs-b',
+                        options=opts["L_BFGS_B_opts"],
+                        bounds=[(0, np.pi/OSR)] * xl)
+
     # Manage optional parameters
     opts = digested_options(options, spread_fir_uc_zeros.default_options,
-                            [], ['L_BFGS_B_opts'])
+                            ['cf_jac', 'multistart', 'seed', 'workers'],
+                            ['L_BFGS_B_opts'])
+    if cf is None:
+        fun, jac = mf_builtin, True
+    elif opts['cf_jac'] is not None:
+        fun, jac = mf_jac, True
+    else:
+        fun, jac = mf, None
     xl = order // 2
-    zeros = np.zeros(order, dtype=complex)
-    xx = minimize(mf, np.linspace(np.pi/OSR/order, np.pi/OSR, xl),
-                  method='l-bfgs-b', options=opts["L_BFGS_B_opts"],
-                  bounds=[(0, np.pi/OSR)] * xl).x
-    return dof2zeros(xx)
-
-spread_fir_uc_zeros.default_options = {"L_BFGS_B_opts":
+    rng = np.random.default_rng(opts['seed'])
+    starts = [np.linspace(np.pi/OSR/order, np.pi/OSR, xl)]
+    starts += [np.sort(rng.uniform(0, np.pi/OSR, xl))
+               for i in range(opts['multistart']-1)]
+    results = _parallel_map(run, [(x0,) for x0 in starts], opts['workers'])
+    best = min(results, key=lambda r: r.fun)
+    return dof2zeros(best.x)
+
+spread_fir_uc_zeros.default_options = {"cf_jac": None,
+                                       "multistart": 1,
+                                       "seed": 0,
+                                       "workers": 1,
+                                       "L_BFGS_B_opts":
                                        {"ftol": 2.220446049250313e-09,
                                         "gtol": 1e-05,
                                         "maxcor": 10,
                                         "maxiter": 15000,
                                         "maxfun": 15000,
                                         "eps": 1E-8}}
+
+
+class FirNTF(object):
+    """
+    FIR NTF with lazily computed zeros.
+
+    The NTF is stored as its impulse response. The object can be indexed
+    and unpacked as ``(z, p, k)``, but the zeros are only computed when
+    they are first accessed. Code working on the coefficients can thus
+    skip the root finding and the associated loss of precision
+    altogether.
+
+    The object is not a tuple. Functions that recognize the NTF format
+    by the type of their argument, such as the modulator simulators and
+    the weighting helpers, must be passed the ``zpk`` or ``ba``
+    attribute.
+
+    Parameters
+    ----------
+    ir : array_like
+        the NTF impulse response
+
+    Attributes
+    ----------
+    ir : ndarray
+        the NTF impulse response
+    order : int
+        the NTF order
+    ba : tuple
+        the NTF in ba form
+    zpk : tuple
+        the NTF in zpk form
+    """
+    __slots__ = ('ir', '_zeros')
+
+    def __init__(self, ir):
+        self.ir = np.asarray(ir, dtype=float).reshape(-1)
+        self._zeros = None
+
+    @property
+    def order(self):
+        return self.ir.size-1
+
+    @property
+    def ba(self):
+        a = np.zeros_like(self.ir)
+        a[0] = 1.
+        return (self.ir.copy(), a)
+
+    @property
+    def zpk(self):
+        if self._zeros is None:
+            self._zeros = np.roots(self.ir)
+        return (self._zeros, np.zeros(self.order), self.ir[0])
+
+    def __len__(self):
+        return 3
+
+    def __getitem__(self, key):
+        return self.zpk[key]
+
+    def __iter__(self):
+        return iter(self.zpk)
+
+    def __repr__(self):
+        return 'FirNTF({!r})'.format(self.ir)
+
+
+def _fir_ntf_output(ir, output):
+    # Format an FIR NTF impulse response as requested by output
+    if output == 'zpk':
+        return FirNTF(ir).zpk
+    elif output == 'ba':
+        return FirNTF(ir).ba
+    elif output == 'fir':
+        return np.asarray(ir, dtype=float).reshape(-1)
+    elif output == 'lazy':
+        return FirNTF(ir)
+    raise ValueError('Unsupported output format {}'.format(output))
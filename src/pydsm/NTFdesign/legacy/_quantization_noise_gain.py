@@ -21,7 +21,7 @@
 from __future__ import division, print_function
 
 import numpy as np
-from ...ir import impulse_response
+from ...ir import impulse_response, impulse_responses
 import scipy.signal as signal
 
 __all__ = ["quantization_noise_gain_by_conv"]
@@ -58,10 +58,10 @@ def quantization_noise_gain_by_conv(NTF, H, H_type='zpk', db=80):
     The computation is practiced as the sum of the squared entries
     in the impulse response of the cascaded filter NTF*H
     """
-    h1_ir = impulse_response(NTF, db=db)
     if H_type == 'zpk' or H_type == 'ba':
-        h2_ir = impulse_response(H, db=db)
+        h1_ir, h2_ir = impulse_responses([NTF, H], db=db)
     elif H_type == 'imp':
+        h1_ir = impulse_response(NTF, db=db)
         h2_ir = H
     else:
         raise ValueError("Incorrect filter type specification")
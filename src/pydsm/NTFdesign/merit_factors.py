@@ -35,16 +35,256 @@ Functions
    :toctree: generated/
 
    quantization_noise_gain  -- NTF quantization noise power gain
+   quantization_noise_gain_many -- Noise power gain of many NTFs at once
 """
 
 from __future__ import division, print_function
 
 import numpy as np
+import scipy.signal as sp
 from scipy.integrate import quad
-from ..delsig import evalTF
+import scipy.linalg as la
+from ..delsig import evalTF, evalTFBatch, ucGrid
 from ..utilities import digested_options
+from .helpers import FirNTF, _leggauss
 
-__all__ = ["quantization_noise_gain"]
+__all__ = ["quantization_noise_gain", "quantization_noise_gain_many"]
+
+
+def _cascade_acorr(z, p, k, lags):
+    """
+    Autocorrelation of the impulse response of a stable zpk DT system.
+
+    The system is realized as a cascade of first order sections
+    D_i+C_i/(z-p_i), each pole p_i being associated to the zero z_i, or to
+    no zero if z_i is infinite. Each section is scaled to a unit peak gain
+    on the unit circle, to keep the state variables well scaled. The state
+    matrix is lower triangular, so that the discrete Lyapunov equation for
+    the controllability gramian is solved row by row by triangular solves.
+    Returns the autocorrelation at lags 0...lags, or None if the system is
+    not stable.
+    """
+    n = len(p)
+    if n == 0:
+        return np.concatenate(([np.abs(k)**2], np.zeros(lags)))
+    if np.any(np.abs(p) >= 1):
+        return None
+    fin = np.isfinite(z)
+    zf = np.where(fin, z, 0.)
+    # Section scaling from peak gains on a coarse grid and at the poles
+    uc = np.concatenate((np.broadcast_to(ucGrid(256, 0., 1.), (n, 256)),
+                         np.exp(1j*np.angle(p))[:, np.newaxis]), axis=1)
+    num = np.where(fin[:, np.newaxis], uc-zf[:, np.newaxis], 1.)
+    d = 1./np.max(np.abs(num/(uc-p[:, np.newaxis])), axis=1)
+    Ds = np.where(fin, d, 0.)
+    Cs = np.where(fin, d*(p-zf), d)
+    # State space realization of the cascade
+    A = np.diag(p)
+    B = np.zeros(n, dtype=complex)
+    B[0] = 1.
+    for i in range(1, n):
+        A[i, :i-1] = Ds[i-1]*A[i-1, :i-1]
+        A[i, i-1] = Cs[i-1]
+        B[i] = Ds[i-1]*B[i-1]
+    C = np.append(Ds[-1]*A[-1, :-1], Cs[-1])
+    D = Ds[-1]*B[-1]
+    k = k/np.prod(d)
+    # Solve P = A P A^H + B B^H
+    P = np.zeros((n, n), dtype=complex)
+    AH = A.conj().T
+    for i in range(n):
+        rhs = A[i, :i].dot(P[:i]).dot(AH)+B[i]*B.conj()
+        P[i] = la.solve_triangular(np.eye(n)-A[i, i]*A.conj(), rhs,
+                                   lower=True)
+    r = np.empty(lags+1, dtype=complex)
+    r[0] = np.abs(D)**2+C.dot(P).dot(C.conj())
+    v = B*np.conj(D)+A.dot(P).dot(C.conj())
+    for m in range(1, lags+1):
+        r[m] = C.dot(v)
+        v = A.dot(v)
+    return np.abs(k)**2*r
+
+
+def _pair_roots(zz, pp):
+    """
+    Pair poles to zeros for the realization as first order sections.
+
+    Poles at the origin are dropped, since they do not change the magnitude
+    on the unit circle. Each remaining pole is paired to the closest zero,
+    starting from the poles closest to the unit circle. Returns the zeros
+    and the poles of the sections, poles closest to the origin first, with
+    infinite zeros for the poles left without a zero, and the list of the
+    zeros left unpaired.
+    """
+    zz = np.asarray(zz, dtype=complex).reshape(-1)
+    pp = np.asarray(pp, dtype=complex).reshape(-1)
+    pp = pp[pp != 0]
+    pp = pp[np.argsort(-np.abs(pp))]
+    zl = list(zz)
+    zp = np.empty(len(pp), dtype=complex)
+    for i, p in enumerate(pp):
+        if zl:
+            zp[i] = zl.pop(np.argmin(np.abs(np.asarray(zl)-p)))
+        else:
+            zp[i] = np.inf
+    return zp[::-1], pp[::-1], zl
+
+
+def _fir_coeffs(ntf):
+    # Impulse response of a FIR NTF, or None if the NTF is not FIR
+    if isinstance(ntf, FirNTF):
+        return ntf.ir
+    if len(ntf) == 2:
+        b, a = (np.atleast_1d(np.asarray(x, dtype=float)) for x in ntf)
+        if np.all(a[1:] == 0):
+            return b/a[0]
+    return None
+
+
+def _exact_gain(ntf, w):
+    """
+    Integral of |NTF|**2 |W|**2 over the whole unit circle.
+
+    The poles of the NTF and of the weighting filter are paired to their
+    zeros by :func:`_pair_roots` and the resulting sections are realized in
+    state space. The zeros left unpaired, namely the FIR part of the
+    cascade, are kept in polynomial form b, so that the integral is computed
+    as b'Rb, with R the Toeplitz autocorrelation matrix of the impulse
+    response of the state space system. A FIR NTF is directly taken as a
+    polynomial, without finding its roots. Returns None if the computation
+    is not possible.
+    """
+    b = _fir_coeffs(ntf)
+    if b is not None:
+        zn, pn, kn = [], [], 1.
+    else:
+        b = np.ones(1)
+        zn, pn, kn = ntf if len(ntf) == 3 else sp.tf2zpk(*ntf)
+    zw, pw, kw = w
+    zp, pp, zl = _pair_roots(
+        np.concatenate([np.asarray(x, dtype=complex).reshape(-1)
+                        for x in (zn, zw)]),
+        np.concatenate([np.asarray(x, dtype=complex).reshape(-1)
+                        for x in (pn, pw)]))
+    b = np.real_if_close(np.convolve(b, np.poly(zl)))
+    r = _cascade_acorr(zp, pp, kn*kw, len(b)-1)
+    if r is None:
+        return None
+    rb = np.correlate(b, b, 'full')[len(b)-1:]
+    return np.real(rb[0]*r[0]+2*np.sum(rb[1:]*np.conj(r[1:])))
+
+
+def _weighting_acorr(w, n):
+    """
+    Autocorrelation of the impulse response of a weighting filter.
+
+    The weighting filter w is in zpk form. Returns the first n lags, that
+    are also the integrals of |W|**2 cos(2 pi k f) over the unit circle,
+    or None if the filter is not stable.
+    """
+    zw, pw, kw = w
+    zp, pp, zl = _pair_roots(zw, pw)
+    bw = np.atleast_1d(np.real_if_close(np.poly(zl)))
+    nw = len(bw)
+    r = _cascade_acorr(zp, pp, kw, n+nw-2)
+    if r is None:
+        return None
+    # Include the polynomial part of the weighting in the autocorrelation
+    r = np.concatenate((np.conj(r[:0:-1]), r))
+    rw = np.convolve(r, np.correlate(bw, bw, 'full'))
+    return np.real(rw[len(rw)//2:len(rw)//2+n])
+
+
+def _exact_gain_fir_stack(bb, w):
+    """
+    Integrals of |NTF|**2 |W|**2 over the unit circle for many FIR NTFs.
+
+    The rows of bb are the NTF impulse responses. The autocorrelation of
+    the impulse response of the weighting filter is computed once, so that
+    the integrals are obtained as a single matrix-vector product with the
+    autocorrelations of the rows of bb. Returns None if the weighting
+    filter is not stable.
+    """
+    n = bb.shape[1]
+    rw = _weighting_acorr(w, n)
+    if rw is None:
+        return None
+    nfft = 2**int(np.ceil(np.log2(2*n-1)))
+    rb = np.fft.irfft(np.abs(np.fft.rfft(bb, nfft))**2, nfft)[:, :n]
+    return rb[:, 0]*np.real(rw[0])+2*rb[:, 1:].dot(np.real(rw[1:]))
+
+
+def _fixed_rule(g, a, b, points, order, panels, max_panels, rtol,
+                norm=None):
+    """
+    Integrate g from a to b with a composite Gauss-Legendre rule.
+
+    The number of panels is doubled until two successive estimates agree
+    within rtol. Panel edges include the given points, to deal with
+    discontinuities. The function g can return arrays with shape
+    (m,)+f.shape to compute m integrals at once. In this case, the m
+    estimates must agree one by one, or, if norm is 'max', their largest
+    difference is compared to the largest estimate. Returns None if
+    convergence is not achieved.
+    """
+    x, wx = _leggauss(order)
+    extra = [] if points is None else [f for f in points if a < f < b]
+    # Every panel is split at each refinement, including those delimited
+    # by the given points
+    base = np.union1d(np.linspace(a, b, panels+1), extra)
+    split = 1
+    last = None
+    while panels*split <= max_panels:
+        edges = np.append(
+            (base[:-1, np.newaxis] +
+             np.outer(np.diff(base), np.arange(split)/split)).reshape(-1), b)
+        h = 0.5*np.diff(edges)
+        ff = (0.5*(edges[:-1]+edges[1:]))[:, np.newaxis]+np.outer(h, x)
+        val = np.sum(h*g(ff).dot(wx), axis=-1)
+        if last is not None:
+            if norm == 'max':
+                done = np.max(np.abs(val-last)) <= rtol*np.max(np.abs(val))
+            else:
+                done = np.all(np.abs(val-last) <= rtol*np.abs(val))
+            if done:
+                return val
+        last = val
+        split *= 2
+    return None
+
+
+def _unit_weighting(f):
+    # Flat weighting, applicable to arrays
+    return 1. if np.isscalar(f) else np.ones(np.shape(f))
+
+
+def _weighting(w):
+    """
+    Normalize a weighting specification.
+
+    Returns a weighting function and the weighting filter in zpk form, or
+    None in place of the latter if the weighting is not given by a filter.
+    """
+    if w is None:
+        return _unit_weighting, ([], [], 1.)
+    elif type(w) is tuple and 2 <= len(w) <= 3:
+        h = w
+        return ((lambda f: np.abs(evalTF(h, np.exp(2j*np.pi*f)))**2),
+                h if len(h) == 3 else sp.tf2zpk(*h))
+    return w, None
+
+
+def _vectorized(w):
+    # Make a weighting function safely applicable to arrays
+    def vw(f):
+        try:
+            v = np.asarray(w(f), dtype=float)
+            if v.shape == f.shape:
+                return v
+        except (TypeError, ValueError):
+            pass
+        return np.vectorize(w, otypes=[float])(f)
+    return vw
 
 
 def quantization_noise_gain(NTF, w=None, bounds=(0, 0.5), avg=False,
@@ -75,12 +315,28 @@ def quantization_noise_gain(NTF, w=None, bounds=(0, 0.5), avg=False,
 
     Other parameters
     ----------------
+    method : string, optional
+        How the integral is computed. One of ``quad`` (adaptive quadrature
+        with ``scipy.integrate.quad``), ``exact`` (H2 norm computation, see
+        the notes), ``fixed`` (vectorized composite Gauss-Legendre rule) or
+        ``auto`` (default). With ``auto``, the exact computation is used
+        whenever possible, otherwise the fixed rule is used if the NTF is
+        rational and the weighting is not a callable. In all other cases,
+        or if the fixed rule does not converge, adaptive quadrature is used.
     quad_opts : dictionary, optional
         Parameters to be passed to the ``quad`` function used internally as
         an integrator. Allowed options are ``epsabs``, ``epsrel``, ``limit``,
         ``points``. Do not use other options since they could break the
         integrator in unexpected ways. Defaults can be set by changing the
         function ``default_options`` attribute.
+    fixed_opts : dictionary, optional
+        Parameters for the fixed rule. Allowed options are ``order`` (number
+        of Gauss-Legendre nodes per panel), ``panels`` (initial number of
+        panels), ``max_panels`` (max number of panels) and ``rtol`` (relative
+        tolerance). The number of panels is doubled until two successive
+        estimates agree within ``rtol``. The ``points`` entry of
+        ``quad_opts`` is also honored, placing panel edges at those
+        frequencies.
 
     Notes
     -----
@@ -97,25 +353,187 @@ def quantization_noise_gain(NTF, w=None, bounds=(0, 0.5), avg=False,
     In case the weighting function has discontinuities, report them to the
     integrator via the ``quad_points`` parameter.
 
+    When the NTF and the weighting are rational, stable transfer functions
+    and the bounds are (0, 1/2), the integral is the squared H2 norm of the
+    cascade of the NTF and the weighting filter. This is computed exactly
+    by solving a discrete Lyapunov equation, which is much faster and more
+    accurate than numerical integration.
+
     See Also
     --------
     scipy.integrate.quad : for the meaning of the integrator parameters.
     """
-    # Manage parameters
-    if w is None:
-        w = lambda f: 1.
-    elif type(w) is tuple and 2 <= len(w) <= 3:
-        h = w
-        w = lambda f: np.abs(evalTF(h, np.exp(2j*np.pi*f)))**2
     # Manage optional parameters
     opts = digested_options(options, quantization_noise_gain.default_options,
-                            [], ['quad_opts'])
-    # Compute
+                            ['method'], ['quad_opts', 'fixed_opts'])
+    method = opts['method']
+    if method not in ('auto', 'quad', 'exact', 'fixed'):
+        raise ValueError('Unsupported integration method {}'.format(method))
+    # Manage parameters
+    try:
+        ntf_rational = len(NTF) in (2, 3)
+    except TypeError:
+        ntf_rational = False
+    w, w_zpk = _weighting(w)
     c = 1/(bounds[1]-bounds[0]) if avg else 2.
+    # Compute
+    if method in ('auto', 'exact'):
+        if (ntf_rational and w_zpk is not None and
+                tuple(bounds) == (0, 0.5)):
+            val = _exact_gain(NTF, w_zpk)
+            if val is not None:
+                return c*val/2.
+        if method == 'exact':
+            raise ValueError('Exact computation requires stable rational NTF '
+                             'and weighting and full band bounds')
+    if method == 'fixed' or (method == 'auto' and ntf_rational and
+                             w_zpk is not None):
+        wv = _vectorized(w)
+        val = _fixed_rule(
+            lambda f: np.abs(evalTF(NTF, np.exp(2j*np.pi*f)))**2*wv(f),
+            bounds[0], bounds[1], opts['quad_opts']['points'],
+            **opts['fixed_opts'])
+        if val is not None:
+            return c*val
     return c*quad(lambda f: np.abs(evalTF(NTF, np.exp(2j*np.pi*f)))**2*w(f),
                   bounds[0], bounds[1], **opts["quad_opts"])[0]
 
 quantization_noise_gain.default_options = {"quad_opts": {"epsabs": 1E-14,
                                                          "epsrel": 1E-9,
                                                          "limit": 100,
-                                                         "points": None}}
+                                                         "points": None},
+                                           "fixed_opts": {"order": 16,
+                                                          "panels": 16,
+                                                          "max_panels": 4096,
+                                                          "rtol": 1E-10},
+                                           "method": "auto"}
+
+
+def quantization_noise_gain_many(ntfs, w=None, bounds=(0, 0.5), avg=False,
+                                 **options):
+    r"""
+    Compute the quantization noise power gain of many NTFs at once.
+
+    This is equivalent to calling :func:`quantization_noise_gain` for each
+    NTF, but the weighting is evaluated only once, either through its exact
+    form or on a grid shared by all the NTFs, and the noise gains are
+    computed in a vectorized way.
+
+    Parameters
+    ----------
+    ntfs : list or ndarray
+        The NTFs. Either a list of NTFs in zpk or ba form or as
+        :class:`pydsm.NTFdesign.helpers.FirNTF` objects, or a 2D array
+        whose rows are the impulse responses of FIR NTFs.
+    w : callable with argument f in [0,1/2] or None or tuple
+        noise weighting, as in :func:`quantization_noise_gain`
+    bounds : 2 elements tuple, optional
+        the frequency range where the noise gain is computed. Defaults to
+        (0, 0.5)
+    avg: bool, optional
+        If True, rather than returning the overall noise gains, the
+        function returns the average noise gains over the bandwidth.
+
+    Returns
+    -------
+    a : ndarray
+        noise power gains, one per NTF
+
+    Other parameters
+    ----------------
+    method : string, optional
+        How the integrals are computed. One of ``exact``, ``fixed``,
+        ``quad`` or ``auto`` (default), as in
+        :func:`quantization_noise_gain`. With ``auto``, the exact
+        computation is used whenever possible, otherwise the fixed rule is
+        used with a frequency grid shared by all the NTFs, also when the
+        weighting is a callable. Adaptive quadrature, practiced one NTF at a
+        time, is used only if the fixed rule does not converge.
+    quad_opts : dictionary, optional
+        Parameters for the ``quad`` integrator, as in
+        :func:`quantization_noise_gain`.
+    fixed_opts : dictionary, optional
+        Parameters for the fixed rule, as in
+        :func:`quantization_noise_gain`. Convergence is required for all the
+        NTFs.
+
+    Notes
+    -----
+    In the exact computation, FIR NTFs are never converted to zpk form, so
+    that the noise gains of all of them are obtained from a single
+    autocorrelation of the weighting filter impulse response.
+
+    A callable weighting function is called with arrays of frequencies. If
+    this fails, it is called one frequency at a time.
+    """
+    # Manage optional parameters
+    opts = digested_options(options,
+                            quantization_noise_gain_many.default_options,
+                            ['method'], ['quad_opts', 'fixed_opts'])
+    method = opts['method']
+    if method not in ('auto', 'quad', 'exact', 'fixed'):
+        raise ValueError('Unsupported integration method {}'.format(method))
+    # Manage parameters
+    if isinstance(ntfs, np.ndarray) and ntfs.ndim == 2:
+        ntfs = [FirNTF(ir) for ir in ntfs]
+    ntfs = list(ntfs)
+    w_orig = w
+    w, w_zpk = _weighting(w)
+    c = 1/(bounds[1]-bounds[0]) if avg else 2.
+    out = np.full(len(ntfs), np.nan)
+    todo = np.arange(len(ntfs))
+    # Compute
+    if method in ('auto', 'exact'):
+        if w_zpk is not None and tuple(bounds) == (0, 0.5):
+            firs = [_fir_coeffs(ntf) for ntf in ntfs]
+            idx = [i for i, b in enumerate(firs) if b is not None]
+            if idx:
+                n = max([len(firs[i]) for i in idx])
+                bb = np.zeros((len(idx), n))
+                for j, i in enumerate(idx):
+                    bb[j, :len(firs[i])] = firs[i]
+                val = _exact_gain_fir_stack(bb, w_zpk)
+                if val is not None:
+                    out[idx] = c*val/2.
+            for i in todo[np.isnan(out)]:
+                val = _exact_gain(ntfs[i], w_zpk)
+                if val is not None:
+                    out[i] = c*val/2.
+            todo = todo[np.isnan(out)]
+        if method == 'exact' and len(todo) > 0:
+            raise ValueError('Exact computation requires stable rational NTFs '
+                             'and weighting and full band bounds')
+    if len(todo) == 0:
+        return out
+    tfs = [ntfs[i] for i in todo]
+    for i, ntf in enumerate(tfs):
+        if isinstance(ntf, FirNTF):
+            tfs[i] = ntf.ba
+    if method in ('auto', 'fixed'):
+        wv = _vectorized(w)
+        zpk_idx = [i for i, tf in enumerate(tfs) if len(tf) == 3]
+        ba_idx = [i for i, tf in enumerate(tfs) if len(tf) == 2]
+
+        def g(f):
+            z = np.exp(2j*np.pi*f)
+            m2 = np.empty((len(tfs),)+f.shape)
+            for idx in (zpk_idx, ba_idx):
+                if idx:
+                    m2[idx] = np.abs(evalTFBatch([tfs[i] for i in idx],
+                                                 z, mode='sections'))**2
+            return m2*wv(f)
+        val = _fixed_rule(g, bounds[0], bounds[1],
+                          opts['quad_opts']['points'], **opts['fixed_opts'])
+        if val is not None:
+            out[todo] = c*val
+            return out
+    for i, tf in zip(todo, tfs):
+        out[i] = quantization_noise_gain(tf, w_orig, bounds, avg,
+                                         method='quad',
+                                         quad_opts=opts['quad_opts'])
+    return out
+
+quantization_noise_gain_many.default_options = {
+    "quad_opts": quantization_noise_gain.default_options["quad_opts"].copy(),
+    "fixed_opts": quantization_noise_gain.default_options["fixed_opts"].copy(),
+    "method": "auto"}
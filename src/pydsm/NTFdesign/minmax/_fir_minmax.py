@@ -24,6 +24,7 @@ import numpy as np
 from warnings import warn
 from ...exceptions import PyDsmDeprecationWarning
 from ...utilities import digested_options
+from ..helpers import _fir_ntf_output
 
 __all__ = ['ntf_fir_minmax', 'synthesize_ntf_minmax']
 
@@ -57,8 +58,9 @@ def ntf_fir_minmax(order=32, osr=32, H_inf=1.5, f0=0, zf=False,
 
     Returns
     -------
-    ntf : tuple
-        noise transfer function in zpk form.
+    ntf : tuple, ndarray or FirNTF
+        noise transfer function, by default in zpk form (see the
+        ``output`` option).
 
     cvxpy_opts : dictionary, optional
        A dictionary of options to use with the ``cvxpy`` modeling library.
@@ -69,7 +71,9 @@ def ntf_fir_minmax(order=32, osr=32, H_inf=1.5, f0=0, zf=False,
            ``chol`` kkt solver.
            Leave this at the default False setting, to avoid errors.
        ``solver`` (string)
-           The solver backend to use. Either `cvxopt` or `scs`
+           The solver backend to use. Either `cvxopt`, `scs` or
+           `clarabel`. The name of any other conic solver installed for
+           ``cvxpy`` is also accepted.
 
     cvxopt_opts : dict, optional
         A dictionary of options for the ``cvxopt`` optimizer.
@@ -106,6 +110,56 @@ def ntf_fir_minmax(order=32, osr=32, H_inf=1.5, f0=0, zf=False,
        Do not use other options since they could break ``scs`` in
        unexpected ways. These options can be passed when using the
        ``cvxpy`` modeler with the ``scs`` backend.
+    clarabel_opts : dict, optional
+        A dictionary of options for the ``clarabel`` optimizer. Allowed
+        options include:
+
+        ``max_iter`` (int)
+            Maximum number of iterations
+        ``tol_gap_abs`` (real)
+            Absolute duality gap tolerance
+        ``tol_gap_rel`` (real)
+            Relative duality gap tolerance
+        ``tol_feas`` (real)
+            Feasibility check tolerance
+
+        These options can be passed when using the ``cvxpy`` modeler with
+        the ``clarabel`` backend.
+    solver_opts : dict, optional
+        A dictionary of options passed verbatim to any other solver selected
+        via the ``solver`` entry of ``cvxpy_opts``.
+    output : string, optional
+        Format of the returned NTF. Either ``zpk`` (default), ``ba``,
+        ``fir`` for the NTF impulse response, or ``lazy`` for a
+        :class:`pydsm.NTFdesign.helpers.FirNTF` object computing the NTF
+        zeros only when they are accessed. The formats other than ``zpk``
+        avoid a root finding that is expensive and numerically delicate at
+        high orders.
+    formulation : string, optional
+        How the frequency domain constraints are expressed. Either ``kyp``
+        (default), using the generalized KYP lemma to obtain LMIs, or
+        ``grid``, enforcing the constraints on an adaptively refined
+        frequency grid, so that the problem becomes a second order cone
+        program. The ``grid`` formulation is only available with the
+        ``cvxpy`` modeler and is much faster for high orders.
+    grid_opts : dict, optional
+        A dictionary of options for the ``grid`` formulation. Allowed
+        options include:
+
+        ``points`` (int)
+            Number of initial grid points in each signal band
+        ``hinf_points`` (int)
+            Number of initial grid points for the Lee criterion on the
+            whole frequency axis
+        ``dense_points`` (int)
+            Number of points of the dense grid used to look for constraint
+            violations at each refinement step
+        ``verify_points`` (int)
+            Number of points of the final verification grid
+        ``maxiter`` (int)
+            Maximum number of refinement steps
+        ``tol`` (real)
+            Relative tolerance on the constraint violations
 
     Notes
     -----
@@ -122,15 +176,15 @@ def ntf_fir_minmax(order=32, osr=32, H_inf=1.5, f0=0, zf=False,
 
     For more information on the ``CVXOPT`` optimizer parameters, see
     the corresponding documentation. Similarly, for more infomration
-    on the ``scs`` optimizer see its documentation. Finally, for more
-    iniformation on the parameters controlling the optimization
-    modeler and frontend ``cvxpy``, see its documentation.
+    on the ``scs`` and ``clarabel`` optimizers see their documentation.
+    Finally, for more iniformation on the parameters controlling the
+    optimization modeler and frontend ``cvxpy``, see its documentation.
 
     """
     # Manage optional parameters
     opts = digested_options(
         options, ntf_fir_minmax.default_options,
-        ['show_progress', 'modeler'], [], False)
+        ['show_progress', 'modeler', 'formulation', 'output'], [], False)
     dig_opts = {'show_progress': opts['show_progress'],
                 'cvxpy_opts': {},
                 'cvxpy_tdr_opts': {},
@@ -149,10 +203,25 @@ def ntf_fir_minmax(order=32, osr=32, H_inf=1.5, f0=0, zf=False,
             dig_opts['cvxpy_opts'].update(digested_options(
                 options, ntf_fir_minmax.default_options,
                 [], ['scs_opts'], False)['scs_opts'])
+        elif opts['cvxpy_opts']['solver'] == 'clarabel':
+            dig_opts['cvxpy_opts'].update(digested_options(
+                options, ntf_fir_minmax.default_options,
+                [], ['clarabel_opts'], False)['clarabel_opts'])
+        else:
+            dig_opts['cvxpy_opts'].update(digested_options(
+                options, ntf_fir_minmax.default_options,
+                [], ['solver_opts'], False)['solver_opts'])
         opts['cvxpy_opts'].pop('override_kktsolver')
         dig_opts['cvxpy_opts'].update(opts['cvxpy_opts'])
-        from ._fir_minmax_cvxpy import (
-            ntf_fir_from_digested as _ntf_fir_from_digested)
+        if opts['formulation'] == 'grid':
+            dig_opts.update(digested_options(
+                options, ntf_fir_minmax.default_options,
+                [], ['grid_opts'], False))
+            from ._fir_minmax_grid_cvxpy import (
+                ntf_fir_from_digested as _ntf_fir_from_digested)
+        else:
+            from ._fir_minmax_cvxpy import (
+                ntf_fir_from_digested as _ntf_fir_from_digested)
     elif opts['modeler'] == 'cvxpy_old':
         dig_opts['cvxpy_tdr_opts'].update(digested_options(
             options, ntf_fir_minmax.default_options,
@@ -168,6 +237,15 @@ def ntf_fir_minmax(order=32, osr=32, H_inf=1.5, f0=0, zf=False,
     else:
         raise ValueError('Unsupported modeling backend {}'.format(
             opts['modeler']))
+    if opts['formulation'] not in ('kyp', 'grid'):
+        raise ValueError('Unsupported formulation {}'.format(
+            opts['formulation']))
+    if opts['formulation'] == 'grid' and opts['modeler'] != 'cvxpy':
+        raise ValueError('The grid formulation is only supported by the '
+                         'cvxpy modeler')
+    if opts['output'] not in ('zpk', 'ba', 'fir', 'lazy'):
+        raise ValueError('Unsupported output format {}'.format(
+            opts['output']))
     digested_options(options, {})
     if np.isscalar(f0):
         f0 = [f0]
@@ -177,7 +255,7 @@ def ntf_fir_minmax(order=32, osr=32, H_inf=1.5, f0=0, zf=False,
         raise ValueError('Incorrect multiband specification')
     # Do the computation
     ntf_ir = _ntf_fir_from_digested(order, osr, H_inf, f0, zf, **dig_opts)
-    return (np.roots(ntf_ir), np.zeros(order), 1.)
+    return _fir_ntf_output(ntf_ir, opts['output'])
 
 ntf_fir_minmax.default_options = {"cvxpy_opts": {'override_kktsolver': False,
                                                  'solver': 'cvxopt'},
@@ -190,8 +268,21 @@ ntf_fir_minmax.default_options = {"cvxpy_opts": {'override_kktsolver': False,
                                                'alpha': 1.8,
                                                'normalize': True,
                                                'use_indirect': False},
+                                  'clarabel_opts': {'max_iter': 200,
+                                                    'tol_gap_abs': 1e-8,
+                                                    'tol_gap_rel': 1e-8,
+                                                    'tol_feas': 1e-8},
+                                  'solver_opts': {},
+                                  'grid_opts': {'points': 64,
+                                                'hinf_points': 256,
+                                                'dense_points': 2048,
+                                                'verify_points': 16384,
+                                                'maxiter': 50,
+                                                'tol': 1e-6},
                                   'show_progress': True,
-                                  'modeler': 'cvxpy_old'}
+                                  'modeler': 'cvxpy_old',
+                                  'formulation': 'kyp',
+                                  'output': 'zpk'}
 
 
 # Following part is deprecated
@@ -65,6 +65,10 @@ def ntf_fir_from_digested(order, osrs, H_inf, f0s, zf, **opts):
         opts['cvxpy_opts']['solver'] = cvxpy.CVXOPT
     elif opts['cvxpy_opts']['solver'] == 'scs':
         opts['cvxpy_opts']['solver'] = cvxpy.SCS
+    elif opts['cvxpy_opts']['solver'] == 'clarabel':
+        opts['cvxpy_opts']['solver'] = cvxpy.CLARABEL
+    else:
+        opts['cvxpy_opts']['solver'] = opts['cvxpy_opts']['solver'].upper()
 
     # State space representation of NTF
     A = np.eye(order, order, 1)
@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2026, Sergio Callegari
+# All rights reserved.
+
+# This file is part of PyDSM.
+
+# PyDSM is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# PyDSM is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with PyDSM.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Frequency-gridded formulation of the minmax FIR NTF design problem.
+
+Rather than expressing the in-band and out-of-band magnitude constraints
+through the generalized KYP lemma, the constraints are enforced on a grid
+of frequencies, so that the problem becomes a second order cone program.
+The grid is refined adaptively, adding the frequencies where the
+constraints are found to be violated on a denser grid, until a final
+verification pass finds no violation.
+"""
+
+from __future__ import division, print_function
+
+import numpy as np
+import cvxpy
+from warnings import warn
+from ...exceptions import PyDsmApproximationWarning
+
+
+def _band_edges(f0, osr):
+    # Signal band as in the KYP formulation, namely omega0 +/- pi/osr
+    if f0 == 0:
+        return 0., 0.5/osr
+    return max(f0-0.5/osr, 0.), min(f0+0.5/osr, 0.5)
+
+
+def _freq_matrices(ff, order):
+    # Real and imaginary parts of exp(-2j*pi*f*n), n=0...order
+    ww = 2*np.pi*np.outer(ff, np.arange(order+1))
+    return np.cos(ww), -np.sin(ww)
+
+
+def _magnitude_bound(b, ff, bound):
+    # SOC constraints |H(exp(2j*pi*f))| <= bound for f in ff
+    Cr, Ci = _freq_matrices(ff, b.shape[0]-1)
+    return cvxpy.SOC(bound*np.ones(len(ff)),
+                     cvxpy.vstack([Cr @ b, Ci @ b]), axis=0)
+
+
+def _violations(h, bands, bound, points):
+    """
+    Locate the frequencies where |H| exceeds bound.
+
+    The magnitude response is evaluated on a uniform grid of the given
+    number of points for each band. The grid is then densified around each
+    violating local maximum, to return an accurate estimate of the peak
+    location.
+    """
+    order = len(h)-1
+    ff_out = []
+    for f1, f2 in bands:
+        ff = np.linspace(f1, f2, points)
+        df = ff[1]-ff[0]
+        Cr, Ci = _freq_matrices(ff, order)
+        mag = np.hypot(Cr.dot(h), Ci.dot(h))
+        padded = np.concatenate(([-np.inf], mag, [-np.inf]))
+        peaks = np.nonzero((padded[1:-1] >= padded[:-2]) &
+                           (padded[1:-1] >= padded[2:]) &
+                           (mag > bound))[0]
+        for i in peaks:
+            fl = np.linspace(max(ff[i]-df, f1), min(ff[i]+df, f2), 17)
+            Cr, Ci = _freq_matrices(fl, order)
+            ff_out.append(fl[np.argmax(np.hypot(Cr.dot(h), Ci.dot(h)))])
+    return np.asarray(ff_out)
+
+
+def ntf_fir_from_digested(order, osrs, H_inf, f0s, zf, **opts):
+    """
+    Synthesize FIR NTF with minmax approach from predigested specification
+
+    Version for the cvxpy modeler using the gridded SOCP formulation.
+    """
+    verbose = opts['show_progress']
+    gopts = opts['grid_opts']
+    if opts['cvxpy_opts']['solver'] == 'cvxopt':
+        opts['cvxpy_opts']['solver'] = cvxpy.CVXOPT
+    elif opts['cvxpy_opts']['solver'] == 'scs':
+        opts['cvxpy_opts']['solver'] = cvxpy.SCS
+    elif opts['cvxpy_opts']['solver'] == 'clarabel':
+        opts['cvxpy_opts']['solver'] = cvxpy.CLARABEL
+    else:
+        opts['cvxpy_opts']['solver'] = opts['cvxpy_opts']['solver'].upper()
+    tol = gopts['tol']
+
+    bands = [_band_edges(f0, osr) for f0, osr in zip(f0s, osrs)]
+    # Initial grids for the in-band and the Lee constraints
+    fb = np.concatenate([np.linspace(f1, f2, gopts['points'])
+                         for f1, f2 in bands])
+    if H_inf < np.inf:
+        fh = np.linspace(0., 0.5, gopts['hinf_points'])
+    else:
+        fh = np.zeros(0)
+
+    # b contains the NTF impulse response, t bounds the in-band peak
+    b = cvxpy.Variable(order+1, name='b')
+    t = cvxpy.Variable(name='t')
+    F = [b[0] == 1]
+    if zf:
+        for f0 in f0s:
+            Cr, Ci = _freq_matrices([f0], order)
+            F += [Cr @ b == 0]
+            if f0 != 0:
+                F += [Ci @ b == 0]
+
+    verify = False
+    for itn in range(gopts['maxiter']):
+        constraints = F + [_magnitude_bound(b, fb, t)]
+        if len(fh) > 0:
+            constraints += [_magnitude_bound(b, fh, H_inf)]
+        p = cvxpy.Problem(cvxpy.Minimize(t), constraints)
+        p.solve(verbose=False, **opts['cvxpy_opts'])
+        h = np.asarray(b.value).reshape(-1)
+        points = gopts['verify_points'] if verify else gopts['dense_points']
+        new_fb = _violations(h, bands, t.value*(1+tol), points)
+        if H_inf < np.inf:
+            new_fh = _violations(h, [(0., 0.5)], H_inf*(1+tol), points)
+        else:
+            new_fh = np.zeros(0)
+        if verbose:
+            print('Grid iteration {}: peak {:.6g}, {} + {} frequencies '
+                  'added{}'.format(itn+1, t.value, len(new_fb), len(new_fh),
+                                   ' (verification)' if verify else ''))
+        if len(new_fb) == 0 and len(new_fh) == 0:
+            if verify:
+                break
+            # Final verification pass on a denser grid
+            verify = True
+        else:
+            fb = np.concatenate((fb, new_fb))
+            fh = np.concatenate((fh, new_fh))
+    else:
+        warn('Grid refinement iteration limit exceeded.',
+             PyDsmApproximationWarning)
+    return h
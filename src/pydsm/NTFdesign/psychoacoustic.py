@@ -40,6 +40,15 @@ Functions
     ntf_fir_audio_weighting  -- FIR NTF design with psychoacustic weighting
 
 
+Classes
+-------
+
+.. autosummary::
+   :toctree: generated/
+
+    AudioWeighting           -- noise weighting from an audio weighting
+
+
 Deprecated functions
 --------------------
 
@@ -62,7 +71,7 @@ from ..exceptions import PyDsmDeprecationWarning
 
 __all__ = ["dunn_optzeros", "dunn_optzeros_cplx", "synthesize_ntf_dunn",
            "synthesize_ntf_from_audio_weighting",
-           "ntf_dunn", "ntf_fir_audio_weighting"]
+           "ntf_dunn", "ntf_fir_audio_weighting", "AudioWeighting"]
 
 
 def dunn_optzeros(n):
@@ -192,6 +201,70 @@ def ntf_dunn(order=3, osr=64, H_inf=1.5):
     return synthesizeNTF(order, osr, dunn_optzeros_cplx(order, osr), H_inf, 0)
 
 
+class AudioWeighting(object):
+    """
+    Noise weighting function obtained from an audio weighting function.
+
+    The audio weighting, expressed as a function of the frequency in Hz,
+    is remapped on the normalized frequencies of a modulator, zeroed
+    outside the audio band and clipped from below.
+
+    Parameters
+    ----------
+    audio_weighting : callable or string
+        audio weighting function, taking a frequency in Hz and expressing
+        the weighting at that frequency in terms of acoustic power, or one
+        of ``a``, ``b``, ``c``, ``d`` and ``f`` for the functions in the
+        :mod:`pydsm.audio_weightings` module.
+    osr : float
+        the oversampling ratio
+    audio_band : float, optional
+        the signal band, from 0 to audio_band Hz. Defaults to 22.05 kHz.
+    max_attn : float, optional
+        the weighting is never less than this attenuation (in dB).
+        Defaults to 120 dB.
+
+    Attributes
+    ----------
+    breakpoints : ndarray
+        normalized frequencies where the weighting is discontinuous,
+        namely the edge of the audio band.
+
+    Notes
+    -----
+    The object is callable with a normalized frequency, or an array of
+    them, as argument, and can be used wherever a noise weighting function
+    is expected. The audio weighting function is only evaluated within the
+    audio band, on whole arrays at once.
+    """
+
+    def __init__(self, audio_weighting, osr, audio_band=22.05E3,
+                 max_attn=120):
+        if not callable(audio_weighting):
+            if audio_weighting not in ('a', 'b', 'c', 'd', 'f'):
+                raise ValueError('Unsupported audio weighting {}'.format(
+                    audio_weighting))
+            audio_weighting = getattr(audio_weightings,
+                                      audio_weighting+'_weighting')
+        self.audio_weighting = audio_weighting
+        self.osr = osr
+        self.audio_band = audio_band
+        self.max_attn = max_attn
+        self.breakpoints = np.asarray([0.5/osr])
+
+    def __call__(self, f):
+        if np.ndim(f) == 0:
+            # Scalar quadratures call with one frequency at a time
+            fx = f*self.audio_band*2*self.osr
+            w = self.audio_weighting(fx) if fx <= self.audio_band else 0
+            return max(w, undbp(-self.max_attn))
+        fx = np.asarray(f, dtype=float)*self.audio_band*2*self.osr
+        w = np.zeros_like(fx)
+        inband = fx <= self.audio_band
+        w[inband] = self.audio_weighting(fx[inband])
+        return np.maximum(w, undbp(-self.max_attn))
+
+
 def ntf_fir_audio_weighting(
         order, osr,
         audio_weighting='f',
@@ -256,6 +329,11 @@ def ntf_fir_audio_weighting(
         Do not use other options since they could break ``CVXOPT`` in
         unexpected ways. Defaults can be set by changing the function
         ``default_options`` attribute.
+    integrator : string, optional
+        How the integrals defining the quadratic form are computed, as in
+        :func:`pydsm.NTFdesign.weighting.q0_weighting`. Defaults to
+        ``fixed``, evaluating the weighting function on whole arrays of
+        frequencies.
     quad_opts : dictionary, optional
         Parameters to be passed to the :func:`scipy.integrate.quad` function
         used internally as an integrator. Allowed options are ``epsabs``,
@@ -272,28 +350,14 @@ def ntf_fir_audio_weighting(
     For more information on the ``CVXOPT`` optimizer parameters, see
     the corresponding documentation.
     """
-    if not callable(audio_weighting):
-        if audio_weighting == 'f':
-            audio_weighting = audio_weightings.f_weighting
-        elif audio_weighting == 'a':
-            audio_weighting = audio_weightings.a_weighting
-        elif audio_weighting == 'b':
-            audio_weighting = audio_weightings.b_weighting
-        elif audio_weighting == 'c':
-            audio_weighting = audio_weightings.c_weighting
-        elif audio_weighting == 'd':
-            audio_weighting = audio_weightings.d_weighting
-
-    def w(f):
-        ma = undbp(-max_attn)
-        fx = f*audio_band*2*osr
-        w = audio_weighting(fx) if fx <= audio_band else 0
-        return max(w, ma)
-
+    w = AudioWeighting(audio_weighting, osr, audio_band, max_attn)
+    options.setdefault('integrator',
+                       ntf_fir_audio_weighting.default_options['integrator'])
     return ntf_fir_weighting(order, w, H_inf, normalize, **options)
 
 ntf_fir_audio_weighting.default_options = \
     ntf_fir_weighting.default_options.copy()
+ntf_fir_audio_weighting.default_options['integrator'] = 'fixed'
 
 
 # Following part is deprecated
@@ -105,6 +105,45 @@ class TestNTF_Hybrid:
         np.testing.assert_allclose(z, self.e_z, 5e-2)
         np.testing.assert_allclose(p, self.e_p, 3e-6)
 
+    def test_ntf_hybrid_cvxpy_clarabel(self):
+        try:
+            import cvxpy     # analysis:ignore
+            import clarabel     # analysis:ignore
+        except:
+            pytest.skip("Modeler 'cvxpy' or solver 'clarabel' not installed")
+        z, p, k = ntf_hybrid_weighting(self.order, self.w, H_inf=1.5,
+                                       poles=self.e_p,
+                                       show_progress=False,
+                                       modeler='cvxpy',
+                                       quad_opts={"points": [0.5/self.OSR]},
+                                       cvxpy_opts={"solver": "clarabel"},
+                                       clarabel_opts={"tol_gap_abs": 1E-12,
+                                                      "tol_gap_rel": 1E-12})
+        z = np.sort(z)
+        p = np.sort(p)
+        np.testing.assert_allclose(k, self.e_k, 1e-6)
+        np.testing.assert_allclose(z, self.e_z, 3e-4)
+        np.testing.assert_allclose(p, self.e_p, 3e-4)
+
+    def test_ntf_hybrid_cvxpy_dual(self):
+        try:
+            import cvxpy     # analysis:ignore
+        except:
+            pytest.skip("Modeler 'cvxpy' not installed")
+        z, p, k = ntf_hybrid_weighting(self.order, self.w, H_inf=1.5,
+                                       poles=self.e_p,
+                                       show_progress=False,
+                                       modeler='cvxpy',
+                                       formulation='dual',
+                                       quad_opts={"points": [0.5/self.OSR]},
+                                       cvxopt_opts={"reltol": 1E-14,
+                                                    "abstol": 2E-16})
+        z = np.sort(z)
+        p = np.sort(p)
+        np.testing.assert_allclose(k, self.e_k, 1e-6)
+        np.testing.assert_allclose(z, self.e_z, 3e-4)
+        np.testing.assert_allclose(p, self.e_p, 3e-4)
+
     def test_ntf_hybrid_picos(self):
         try:
             import picos     # analysis:ignore
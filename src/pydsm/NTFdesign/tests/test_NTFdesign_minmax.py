@@ -159,6 +159,99 @@ class TestSynthesizeNTFminmax:
         np.testing.assert_allclose(k, e_k, rtol=1e-6)
         np.testing.assert_allclose(z, e_z, rtol=1e-3, atol=3e-2)
 
+    def test_LP8_cvxpy_clarabel(self):
+        try:
+            import cvxpy     # analysis:ignore
+            import clarabel     # analysis:ignore
+        except:
+            pytest.skip("Modeler 'cvxpy' or solver 'clarabel' not installed")
+        z, p, k = ntf_fir_minmax(order=8, show_progress=False,
+                                 modeler='cvxpy',
+                                 cvxpy_opts={'solver': 'clarabel'})
+        e_k = 1
+        e_z = [990.349427225477e-003 + 69.0500612157020e-003j,
+               990.349427225477e-003 - 69.0500612157020e-003j,
+               166.532844346146e-003 + 591.251073811726e-003j,
+               166.532844346146e-003 - 591.251073811726e-003j,
+               -259.915617496087e-003 + 503.342225950477e-003j,
+               -259.915617496087e-003 - 503.342225950477e-003j,
+               -512.031157651993e-003 + 194.699627385223e-003j,
+               -512.031157651993e-003 - 194.699627385223e-003j]
+        e_z = np.sort(e_z)
+        z = np.sort(z)
+        np.testing.assert_allclose(k, e_k, rtol=1e-6)
+        np.testing.assert_allclose(z, e_z, rtol=1e-3)
+
+    def test_LP8_cvxpy_clarabel_fir(self):
+        try:
+            import cvxpy     # analysis:ignore
+            import clarabel     # analysis:ignore
+        except:
+            pytest.skip("Modeler 'cvxpy' or solver 'clarabel' not installed")
+        ir = ntf_fir_minmax(order=8, show_progress=False,
+                            modeler='cvxpy', output='fir',
+                            cvxpy_opts={'solver': 'clarabel'})
+        e_z = [990.349427225477e-003 + 69.0500612157020e-003j,
+               990.349427225477e-003 - 69.0500612157020e-003j,
+               166.532844346146e-003 + 591.251073811726e-003j,
+               166.532844346146e-003 - 591.251073811726e-003j,
+               -259.915617496087e-003 + 503.342225950477e-003j,
+               -259.915617496087e-003 - 503.342225950477e-003j,
+               -512.031157651993e-003 + 194.699627385223e-003j,
+               -512.031157651993e-003 - 194.699627385223e-003j]
+        np.testing.assert_allclose(ir, np.poly(e_z).real, atol=1e-3)
+
+    def test_LP8_cvxpy_grid(self):
+        try:
+            import cvxpy     # analysis:ignore
+            import clarabel     # analysis:ignore
+        except:
+            pytest.skip("Modeler 'cvxpy' or solver 'clarabel' not installed")
+        z, p, k = ntf_fir_minmax(order=8, show_progress=False,
+                                 modeler='cvxpy', formulation='grid',
+                                 cvxpy_opts={'solver': 'clarabel'})
+        e_k = 1
+        e_z = [990.349427225477e-003 + 69.0500612157020e-003j,
+               990.349427225477e-003 - 69.0500612157020e-003j,
+               166.532844346146e-003 + 591.251073811726e-003j,
+               166.532844346146e-003 - 591.251073811726e-003j,
+               -259.915617496087e-003 + 503.342225950477e-003j,
+               -259.915617496087e-003 - 503.342225950477e-003j,
+               -512.031157651993e-003 + 194.699627385223e-003j,
+               -512.031157651993e-003 - 194.699627385223e-003j]
+        e_z = np.sort(e_z)
+        z = np.sort(z)
+        np.testing.assert_allclose(k, e_k, rtol=1e-6)
+        np.testing.assert_allclose(z, e_z, rtol=1e-3)
+
+    def test_BP8_cvxpy_grid(self):
+        try:
+            import cvxpy     # analysis:ignore
+            import clarabel     # analysis:ignore
+        except:
+            pytest.skip("Modeler 'cvxpy' or solver 'clarabel' not installed")
+        z, p, k = ntf_fir_minmax(order=8, osr=32, f0=0.2, show_progress=False,
+                                 modeler='cvxpy', formulation='grid',
+                                 cvxpy_opts={'solver': 'clarabel'})
+        e_k = 1
+        e_z = [2.94348009789963e-01 + 9.14543800193135e-01j,
+               2.94348009789963e-01 - 9.14543800193135e-01j,
+               6.76745367518838e-01 + 0.00000000000000e+00j,
+               2.46816733211163e-01 + 5.50000475735513e-01j,
+               2.46816733211163e-01 - 5.50000475735513e-01j,
+               -4.58884378359569e-01 + 4.10643263860101e-01j,
+               -4.58884378359569e-01 - 4.10643263860101e-01j,
+               -5.91022020183929e-01 + 0.00000000000000e+00j]
+        e_z = np.sort(e_z)
+        z = np.sort(z)
+        np.testing.assert_allclose(k, e_k, rtol=1e-6)
+        np.testing.assert_allclose(z, e_z, rtol=1e-3)
+
+    def test_grid_wrong_modeler(self):
+        with pytest.raises(ValueError):
+            ntf_fir_minmax(order=8, show_progress=False,
+                           modeler='picos', formulation='grid')
+
     @pytest.mark.slow
     def test_LP8_cvxpy(self):
         try:
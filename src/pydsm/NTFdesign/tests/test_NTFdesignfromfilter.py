@@ -115,6 +115,53 @@ class TestNTF_Filter:
                                            "acceleration_lookback": 10})
         np.testing.assert_allclose(np.sort(ntf1[0]), self.z_e, rtol=1e-4)
 
+    def test_ntf_butt_bp8_cvxpy_dual(self):
+        try:
+            import cvxpy     # analysis:ignore
+        except:
+            pytest.skip("Modeler 'cvxpy' not installed")
+        ntf1 = ntf_fir_weighting(self.order, self.hz, modeler='cvxpy',
+                                 formulation='dual', show_progress=False)
+        np.testing.assert_allclose(np.sort(ntf1[0]), self.z_e, rtol=2e-4)
+
+    def test_ntf_butt_bp8_dual_wrong_modeler(self):
+        with pytest.raises(ValueError):
+            ntf_fir_weighting(self.order, self.hz, modeler='picos',
+                              formulation='dual', show_progress=False)
+
+    def test_ntf_butt_bp8_native(self):
+        ntf1 = ntf_fir_weighting(self.order, self.hz, modeler='native',
+                                 show_progress=False)
+        np.testing.assert_allclose(np.sort(ntf1[0]), self.z_e, rtol=2e-3)
+        mf1 = quantization_noise_gain(ntf1, self.hz)
+        mf_e = quantization_noise_gain((self.z_e, np.zeros(self.order), 1.),
+                                       self.hz)
+        np.testing.assert_allclose(mf1, mf_e, rtol=1e-4)
+
+    def test_ntf_butt_bp8_native_maxiter(self):
+        with pytest.raises(ValueError):
+            ntf_fir_weighting(self.order, self.hz, modeler='native',
+                              show_progress=False,
+                              native_opts={'maxiter': 0})
+
+    def test_ntf_butt_bp8_output(self):
+        ntf1 = ntf_fir_weighting(self.order, self.hz, modeler='native',
+                                 show_progress=False)
+        ir = ntf_fir_weighting(self.order, self.hz, modeler='native',
+                               show_progress=False, output='fir')
+        b, a = ntf_fir_weighting(self.order, self.hz, modeler='native',
+                                 show_progress=False, output='ba')
+        ntf2 = ntf_fir_weighting(self.order, self.hz, modeler='native',
+                                 show_progress=False, output='lazy')
+        np.testing.assert_allclose(ir, np.poly(ntf1[0]).real, atol=1e-9)
+        np.testing.assert_equal(b, ir)
+        np.testing.assert_equal(a, np.eye(1, self.order+1)[0])
+        np.testing.assert_equal(ntf2.ir, ir)
+        np.testing.assert_allclose(ntf2[0], ntf1[0])
+        with pytest.raises(ValueError):
+            ntf_fir_weighting(self.order, self.hz, modeler='native',
+                              show_progress=False, output='ss')
+
     def test_ntf_butt_bp8_picos(self):
         try:
             import picos     # analysis:ignore
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2026, Sergio Callegari
+# All rights reserved.
+
+# This file is part of PyDSM.
+
+# PyDSM is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# PyDSM is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with PyDSM.  If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import division, print_function
+
+import os
+import threading
+import multiprocessing
+import numpy as np
+from pydsm.NTFdesign import DesignExecutor, ntf_schreier, ntf_fir_minmax
+from pydsm.NTFdesign.executor import _loaded
+
+__all__ = ["TestDesignExecutor"]
+
+
+class TestDesignExecutor:
+
+    @classmethod
+    def setup_class(cls):
+        cls.ex = DesignExecutor(2, modeler='cvxpy_old', max_pending=3)
+
+    @classmethod
+    def teardown_class(cls):
+        cls.ex.shutdown()
+
+    def test_warm_workers(self):
+        ff = [self.ex.submit(_loaded, ['cvxopt', 'pydsm.cvxpy_tdr'])
+              for i in range(4)]
+        assert all([all(f.result()) for f in ff])
+        # Workers are persistent
+        pids = set([self.ex.submit(os.getpid).result() for i in range(8)])
+        assert len(pids) <= 2
+        assert os.getpid() not in pids
+
+    def test_service(self):
+        # Dummy service: concurrent clients asking for designs
+        orders = [3, 4, 5, 6, 7, 8]
+        results = {}
+
+        def client(order):
+            results[order] = self.ex.submit(ntf_schreier, order, 64,
+                                            1).result()
+
+        tt = [threading.Thread(target=client, args=(o,)) for o in orders]
+        for t in tt:
+            t.start()
+        for t in tt:
+            t.join()
+        for order in orders:
+            e_ntf = ntf_schreier(order, 64, 1)
+            for x, e_x in zip(results[order], e_ntf):
+                np.testing.assert_allclose(x, e_x)
+        ntf = self.ex.submit(ntf_fir_minmax, 8, show_progress=False,
+                             modeler='cvxpy_old').result()
+        e_ntf = ntf_fir_minmax(8, show_progress=False, modeler='cvxpy_old')
+        np.testing.assert_allclose(np.sort(ntf[0]), np.sort(e_ntf[0]))
+
+    def test_backpressure(self):
+        with multiprocessing.Manager() as manager:
+            release = manager.Event()
+            ff = [self.ex.submit(release.wait) for i in range(3)]
+            # All the slots are taken, so a further submission blocks
+            assert not self.ex._slots.acquire(blocking=False)
+            extra = []
+            t = threading.Thread(
+                target=lambda: extra.append(self.ex.submit(release.wait)))
+            t.start()
+            t.join(0.1)
+            assert t.is_alive() and not extra
+            assert not any(f.done() for f in ff)
+            # Completing the designs frees the slots
+            release.set()
+            t.join()
+            for f in ff+extra:
+                assert f.result()
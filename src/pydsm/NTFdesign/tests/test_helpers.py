@@ -22,10 +22,11 @@ from __future__ import division, print_function
 
 import numpy as np
 
-from pydsm.NTFdesign.helpers import spread_fir_uc_zeros
+from pydsm.NTFdesign.helpers import (spread_fir_uc_zeros, FirNTF,
+                                     _uc_noise_gain)
 from pydsm.NTFdesign.merit_factors import quantization_noise_gain
 from pydsm.relab import cplxpair
-from pydsm.delsig import ds_optzeros
+from pydsm.delsig import ds_optzeros, evalTF
 
 
 class TestNTFdesignHelpers:
@@ -43,3 +44,45 @@ class TestNTFdesignHelpers:
         zeros2 = np.exp(1j*np.pi*zeros2/OSR)
         zeros2 = cplxpair(zeros2)
         np.testing.assert_almost_equal(zeros1, zeros2, 4)
+
+    def test_uc_zeros_builtin(self):
+        order = 8
+        OSR = 32
+        zeros2 = cplxpair(np.exp(1j*np.pi*ds_optzeros(order)/OSR))
+        zeros1 = spread_fir_uc_zeros(order, OSR, None)
+        np.testing.assert_almost_equal(cplxpair(zeros1), zeros2, 4)
+        zeros1 = spread_fir_uc_zeros(order, OSR, None, multistart=3,
+                                     workers=2)
+        np.testing.assert_almost_equal(cplxpair(zeros1), zeros2, 4)
+
+    def test_uc_zeros_jac(self):
+        order = 6
+        OSR = 32
+
+        def cf(ntf):
+            xx = np.angle(ntf[0][:order//2])
+            return _uc_noise_gain(xx, order, OSR)[0]
+
+        def cf_jac(ntf):
+            xx = np.angle(ntf[0][:order//2])
+            return _uc_noise_gain(xx, order, OSR)[1]
+        zeros1 = spread_fir_uc_zeros(order, OSR, cf, cf_jac=cf_jac)
+        zeros2 = cplxpair(np.exp(1j*np.pi*ds_optzeros(order)/OSR))
+        np.testing.assert_almost_equal(cplxpair(zeros1), zeros2, 4)
+
+    def test_fir_ntf(self):
+        ir = np.asarray([1., -1.5, 0.75, -0.125])
+        ntf = FirNTF(ir)
+        assert ntf.order == 3
+        assert ntf._zeros is None
+        b, a = ntf.ba
+        np.testing.assert_equal(b, ir)
+        np.testing.assert_equal(a, [1., 0., 0., 0.])
+        # Zeros only computed on access, then cached
+        z, p, k = ntf
+        assert ntf._zeros is not None
+        assert ntf[0] is z
+        np.testing.assert_allclose(z, [0.5, 0.5, 0.5], atol=1e-4)
+        np.testing.assert_equal(p, np.zeros(3))
+        ff = np.exp(2j*np.pi*np.linspace(0, 0.5, 5))
+        np.testing.assert_allclose(evalTF(ntf, ff), evalTF((b, a), ff))
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2026, Sergio Callegari
+# All rights reserved.
+
+# This file is part of PyDSM.
+
+# PyDSM is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# PyDSM is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with PyDSM.  If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import division, print_function
+
+import numpy as np
+import scipy.signal as sp
+import pytest
+from pydsm.NTFdesign.merit_factors import (quantization_noise_gain,
+                                           quantization_noise_gain_many)
+from pydsm.NTFdesign.helpers import FirNTF
+from pydsm.delsig import synthesizeNTF
+
+__all__ = ["TestQuantizationNoiseGain"]
+
+
+class TestQuantizationNoiseGain:
+
+    @classmethod
+    def setup_class(cls):
+        cls.ntf = synthesizeNTF(5, 64, 1)
+        cls.hz = sp.butter(4, [0.01, 0.02], 'bandpass', output='zpk')
+        np.random.seed(0)
+        cls.fir = (np.hstack((1., 0.1*np.random.randn(60))),
+                   np.hstack((1., np.zeros(60))))
+
+    def test_exact(self):
+        for ntf, w in [(self.ntf, None), (self.ntf, self.hz),
+                       (self.fir, self.hz)]:
+            g1 = quantization_noise_gain(ntf, w, method='exact')
+            g2 = quantization_noise_gain(ntf, w, method='quad')
+            np.testing.assert_allclose(g1, g2, rtol=1e-8)
+
+    def test_exact_fir_impulse(self):
+        x = np.zeros(20000)
+        x[0] = 1.
+        y = sp.sosfilt(sp.zpk2sos(*self.hz),
+                       sp.lfilter(self.fir[0], 1., x))
+        g = quantization_noise_gain(self.fir, self.hz)
+        np.testing.assert_allclose(g, np.sum(y**2), rtol=1e-10)
+
+    def test_fixed(self):
+        for bounds, avg in [((0, 0.5/64), False), ((0, 0.1), True)]:
+            g1 = quantization_noise_gain(self.ntf, self.hz, bounds, avg,
+                                         method='fixed')
+            g2 = quantization_noise_gain(self.ntf, self.hz, bounds, avg,
+                                         method='quad')
+            np.testing.assert_allclose(g1, g2, rtol=1e-8)
+        g1 = quantization_noise_gain(self.ntf, lambda f: 1., (0, 0.01),
+                                     method='fixed')
+        g2 = quantization_noise_gain(self.ntf, None, (0, 0.01))
+        np.testing.assert_allclose(g1, g2, rtol=1e-10)
+
+    def test_unweighted_vectorized(self, monkeypatch):
+        # The flat weighting must not go through np.vectorize
+        def fail(*args, **kwargs):
+            raise AssertionError('np.vectorize called')
+        g1 = quantization_noise_gain(self.ntf, None, (0, 0.5/64),
+                                     method='quad')
+        monkeypatch.setattr(np, 'vectorize', fail)
+        g2 = quantization_noise_gain(self.ntf, None, (0, 0.5/64))
+        np.testing.assert_allclose(g2, g1, rtol=1e-8)
+
+    def test_wrong_method(self):
+        with pytest.raises(ValueError):
+            quantization_noise_gain(self.ntf, method='foo')
+        with pytest.raises(ValueError):
+            quantization_noise_gain(self.ntf, None, (0, 0.1),
+                                    method='exact')
+
+    def test_many(self):
+        ntfs = [synthesizeNTF(order, 64, 1) for order in [3, 4, 6]]
+        ntfs += [self.fir, FirNTF(self.fir[0])]
+        for bounds, avg in [((0, 0.5), False), ((0, 0.02), True)]:
+            g1 = quantization_noise_gain_many(ntfs, self.hz, bounds, avg)
+            g2 = [quantization_noise_gain(ntf, self.hz, bounds, avg,
+                                          method='fixed')
+                  for ntf in ntfs[:-1]]
+            np.testing.assert_allclose(g1[:-1], g2, rtol=1e-9)
+            np.testing.assert_allclose(g1[-1], g1[-2], rtol=1e-12)
+
+    def test_many_fir_stack(self):
+        bb = np.hstack((np.ones((20, 1)),
+                        0.1*np.random.RandomState(1).randn(20, 30)))
+        g1 = quantization_noise_gain_many(bb, self.hz)
+        g2 = [quantization_noise_gain((b, np.hstack((1., np.zeros(30)))),
+                                      self.hz, method='quad') for b in bb]
+        np.testing.assert_allclose(g1, g2, rtol=1e-8)
+        g1 = quantization_noise_gain_many(bb, lambda f: 1.+f, (0, 0.1))
+        g2 = [quantization_noise_gain((b, np.hstack((1., np.zeros(30)))),
+                                      lambda f: 1.+f, (0, 0.1))
+              for b in bb]
+        np.testing.assert_allclose(g1, g2, rtol=1e-8)
@@ -26,6 +26,8 @@ from pydsm.ir import impulse_response
 from pydsm.NTFdesign.legacy import q0_from_filter_ir
 from pydsm.NTFdesign.weighting import q0_weighting
 from pydsm.NTFdesign import quantization_noise_gain
+from pydsm.NTFdesign.psychoacoustic import AudioWeighting
+from pydsm.audio_weightings import digital_zpk
 import scipy.linalg as la
 
 __all__ = ["TestQ0"]
@@ -92,3 +94,34 @@ class TestQ0:
         fir_coeff = fir.reshape((1, 9))
         gain2 = fir_coeff.dot(Q).dot(fir_coeff.T)
         np.testing.assert_allclose(gain2, gain1)
+
+    def test_q0_integrators(self):
+        hz = signal.butter(3, 1./256, 'lowpass', output='zpk')
+        q0 = q0_weighting(12, hz)
+        for integrator in ['vector', 'fixed', 'exact']:
+            np.testing.assert_allclose(
+                q0_weighting(12, hz, integrator=integrator), q0,
+                rtol=0, atol=1E-10*np.max(np.abs(q0)))
+
+    def test_q0_audio_weighting(self):
+        w = AudioWeighting('f', 64)
+        ff = np.linspace(0, 0.5, 1000)
+        ww = w(ff)
+        np.testing.assert_allclose(ww, [w(f) for f in ff], rtol=1E-12)
+        assert ww[-1] == 1E-12
+        np.testing.assert_allclose(w.breakpoints, [0.5/64])
+        q0 = q0_weighting(12, w)
+        np.testing.assert_allclose(
+            q0_weighting(12, w, integrator='fixed'), q0,
+            rtol=0, atol=1E-10*np.max(np.abs(q0)))
+
+    def test_q0_exact_audio_weighting(self):
+        hz = digital_zpk('a', 2*16*22.05E3)
+        q0 = q0_weighting(12, hz)
+        np.testing.assert_allclose(
+            q0_weighting(12, hz, integrator='exact'), q0,
+            rtol=0, atol=1E-10*np.max(np.abs(q0)))
+        # Falls back to quadratures for weighting functions
+        w = AudioWeighting('a', 16)
+        np.testing.assert_array_equal(
+            q0_weighting(12, w, integrator='exact'), q0_weighting(12, w))
@@ -41,6 +41,9 @@ from ...delsig import evalTF, padr
 from warnings import warn
 from ...exceptions import PyDsmDeprecationWarning
 from ...utilities import digested_options
+from ..helpers import _fir_ntf_output
+from ..merit_factors import (_fixed_rule, _vectorized, _weighting,
+                             _weighting_acorr)
 import scipy.linalg as la
 
 __all__ = ["q0_from_noise_weighting", "q0_weighting",
@@ -97,16 +100,38 @@ def q0_weighting(P, w, **options):
 
     Other parameters
     ----------------
+    integrator : string, optional
+        How the integrals are computed. One of ``quad`` (default, scalar
+        adaptive quadratures, one per entry of q0), ``vector`` (a single
+        adaptive quadrature of the vector valued integrand, see
+        :func:`pydsm.ft.idtft_hermitian`) or ``fixed`` (composite
+        Gauss-Legendre rule, evaluating the weighting function on whole
+        arrays of frequencies). If the fixed rule does not converge,
+        the scalar quadratures are used. When the weighting is given by a
+        filter, ``exact`` computes q0 as the autocorrelation of the filter
+        impulse response, without any quadrature. For weighting functions
+        or unstable filters, ``exact`` falls back to the scalar
+        quadratures.
     quad_opts : dictionary, optional
         Parameters to be passed to the ``quad`` function used internally as
         an integrator. Allowed options are ``epsabs``, ``epsrel``, ``limit``,
         ``points``. Do not use other options since they could break the
         integrator in unexpected ways.
+    fixed_opts : dictionary, optional
+        Parameters for the fixed rule, as in
+        :func:`pydsm.NTFdesign.merit_factors.quantization_noise_gain`.
+        Convergence is checked on the largest entry of q0.
 
     Notes
     -----
     The Q matrix being synthesized has (P+1) times (P+1) entries.
 
+    If the weighting function has a ``breakpoints`` attribute, listing the
+    frequencies where it is discontinuous, and no ``points`` are given in
+    ``quad_opts``, they are passed to the integrator. The ``fixed``
+    integrator requires the weighting function to accept arrays of
+    frequencies to be efficient.
+
     Default values for the options not directly documented in the function
     call signature can be checked and updated by changing the function
     ``default_options`` attribute.
@@ -116,19 +141,71 @@ def q0_weighting(P, w, **options):
     scipy.integrate.quad : For the meaning of the integrator parameters.
     """
     # Manage parameters
-    if type(w) is tuple and 2 <= len(w) <= 3:
-        h = w
-        w = lambda f: np.abs(evalTF(h, np.exp(2j*np.pi*f)))**2
+    w, w_zpk = _weighting(w)
     # Manage optional parameters
     opts = digested_options(options, q0_weighting.default_options,
-                            [], ['quad_opts'])
+                            ['integrator'], ['quad_opts', 'fixed_opts'])
+    integrator = opts['integrator']
+    if integrator not in ('quad', 'vector', 'fixed', 'exact'):
+        raise ValueError('Unsupported integrator {}'.format(integrator))
+    quad_opts = opts['quad_opts']
+    if quad_opts['points'] is None and hasattr(w, 'breakpoints'):
+        quad_opts['points'] = [f for f in w.breakpoints if 0 < f < 0.5]
     # Do the computation
-    return idtft_hermitian(w, np.arange(P+1), **opts)
-
-q0_weighting.default_options = {"quad_opts": {"epsabs": 1E-14,
+    if integrator == 'exact':
+        if w_zpk is not None:
+            q0 = _weighting_acorr(w_zpk, P+1)
+            if q0 is not None:
+                return q0
+        integrator = 'quad'
+    if integrator == 'fixed':
+        tt = np.arange(P+1).reshape((P+1, 1, 1))
+        wv = _vectorized(w)
+        q0 = _fixed_rule(lambda f: 2*wv(f)*np.cos(2*np.pi*tt*f), 0., 0.5,
+                         quad_opts['points'], norm='max',
+                         **opts['fixed_opts'])
+        if q0 is not None:
+            return q0
+        integrator = 'quad'
+    # Scalar quadratures keep q0 bitwise reproducible, which matters to the
+    # tightly toleranced solvers that consume it
+    return idtft_hermitian(w, np.arange(P+1), method=integrator,
+                           quad_opts=quad_opts)
+
+q0_weighting.default_options = {"integrator": "quad",
+                                "quad_opts": {"epsabs": 1E-14,
                                               "epsrel": 1E-9,
                                               "limit": 100,
-                                              "points": None}}
+                                              "points": None},
+                                "fixed_opts": {"order": 16,
+                                               "panels": 16,
+                                               "max_panels": 4096,
+                                               "rtol": 1E-10}}
+
+
+def _q0_factor(q0, fix_pos=True, triangular=False):
+    """
+    Factor the Toeplitz matrix defined by q0.
+
+    Returns a matrix R such that R.T R = toeplitz(q0), so that the quadratic
+    form can be expressed as a norm. By default, R is the symmetric square
+    root obtained by an eigen-decomposition. If triangular is True, R is
+    the upper triangular Cholesky factor, which is cheaper to compute and
+    halves the number of non-zero entries passed to the modeler. The
+    symmetric square root is still used when the matrix is not numerically
+    positive definite.
+    """
+    Q = la.toeplitz(q0)
+    if triangular:
+        try:
+            return la.cholesky(Q)
+        except la.LinAlgError:
+            pass
+    d, v = np.linalg.eigh(Q)
+    if fix_pos:
+        d = d/np.max(d)
+        d[d < 0] = 0.
+    return v.dot(np.diag(np.sqrt(d))).dot(v.T)
 
 
 def ntf_fir_from_q0(q0, H_inf=1.5, normalize="auto", **options):
@@ -147,20 +224,30 @@ def ntf_fir_from_q0(q0, H_inf=1.5, normalize="auto", **options):
 
     Returns
     -------
-    ntf : ndarray
-        FIR NTF in zpk form
+    ntf : tuple, ndarray or FirNTF
+        FIR NTF, by default in zpk form (see the ``output`` option)
 
     Other parameters
     ----------------
     show_progress : bool, optional
         provide extended output.
+    output : string, optional
+        format of the returned NTF. Either ``zpk`` (default), ``ba``,
+        ``fir`` for the NTF impulse response, or ``lazy`` for a
+        :class:`pydsm.NTFdesign.helpers.FirNTF` object computing the NTF
+        zeros only when they are accessed. The formats other than ``zpk``
+        avoid a root finding that is expensive and numerically delicate at
+        high orders.
     fix_pos : bool, optional
         fix quadratic form for positive definiteness. Numerical noise
         may make it not positive definite leading to errors.
     modeler : string, optional
         modeling backend for the optimization problem. Currently, the
         ``cvxpy_old``, ``cvxpy`` and ``picos`` backends are supported.
-        Default is ``cvxpy_old``.
+        Default is ``cvxpy_old``. Alternatively, ``native`` selects a built-in
+        solver that does not rely on any modeling layer. It is meant for
+        fast designs, e.g., in loops, where the full rigor of a semidefinite
+        program is not needed, and reports the optimality gap it achieves.
     cvxpy_opts : dictionary, optional
        A dictionary of options to use with the ``cvxpy`` modeling library.
        Allowed options include:
@@ -171,7 +258,9 @@ def ntf_fir_from_q0(q0, H_inf=1.5, normalize="auto", **options):
            Leave this at the default True setting, to avoid paying a
            performance price.
        ``solver`` (string)
-           The solver backend to use. Either `cvxopt` or `scs`
+           The solver backend to use. Either `cvxopt`, `scs` or
+           `clarabel`. The name of any other conic solver installed for
+           ``cvxpy`` is also accepted.
 
     cvxopt_opts : dict, optional
         A dictionary of options for the ``cvxopt`` optimizer.
@@ -209,6 +298,48 @@ def ntf_fir_from_q0(q0, H_inf=1.5, normalize="auto", **options):
        Do not use other options since they could break ``scs`` in
        unexpected ways. These options can be passed when using the
        ``cvxpy`` modeler with the ``scs`` backend.
+    clarabel_opts : dict, optional
+        A dictionary of options for the ``clarabel`` optimizer. Allowed
+        options include:
+
+        ``max_iter`` (int)
+            Maximum number of iterations
+        ``tol_gap_abs`` (real)
+            Absolute duality gap tolerance
+        ``tol_gap_rel`` (real)
+            Relative duality gap tolerance
+        ``tol_feas`` (real)
+            Feasibility check tolerance
+
+        These options can be passed when using the ``cvxpy`` modeler with
+        the ``clarabel`` backend.
+    solver_opts : dict, optional
+        A dictionary of options passed verbatim to any other solver selected
+        via the ``solver`` entry of ``cvxpy_opts``.
+    formulation : string, optional
+        How the constraint on the NTF peak gain is expressed. Either ``kyp``
+        (default), using the bounded real lemma, or ``dual``, using the trace
+        parametrization of non-negative trigonometric polynomials and
+        solving the problem in its dual form. The latter is only available
+        with the ``cvxpy`` modeler and leads to much smaller problems for
+        high orders, particularly with the ``cvxopt`` backend.
+    native_opts : dict, optional
+        A dictionary of options for the ``native`` solver. Allowed options
+        include:
+
+        ``maxiter`` (int)
+            Maximum number of constraint exchange iterations, at least 1
+        ``tol`` (real)
+            Relative tolerance on the violation of the peak gain constraint
+        ``points`` (int or None)
+            Number of FFT points used to check the peak gain constraint.
+            If None, it is chosen based on the order
+        ``gap_tol`` (real)
+            Relative optimality gap above which a warning is issued
+        ``slsqp_maxiter`` (int)
+            Maximum number of iterations of the inner SLSQP solver
+        ``ftol`` (real)
+            Precision goal of the inner SLSQP solver
 
     Notes
     -----
@@ -223,7 +354,8 @@ def ntf_fir_from_q0(q0, H_inf=1.5, normalize="auto", **options):
     # Manage optional parameters
     opts = digested_options(
         options, ntf_fir_from_q0.default_options,
-        ['show_progress', 'fix_pos', 'modeler'], [], False)
+        ['show_progress', 'fix_pos', 'modeler', 'formulation', 'output'],
+        [], False)
     dig_opts = {'show_progress': opts['show_progress'],
                 'cvxpy_opts': {},
                 'cvxpy_tdr_opts': {},
@@ -242,8 +374,17 @@ def ntf_fir_from_q0(q0, H_inf=1.5, normalize="auto", **options):
             dig_opts['cvxpy_opts'].update(digested_options(
                 options, ntf_fir_from_q0.default_options,
                 [], ['scs_opts'], False)['scs_opts'])
+        elif opts['cvxpy_opts']['solver'] == 'clarabel':
+            dig_opts['cvxpy_opts'].update(digested_options(
+                options, ntf_fir_from_q0.default_options,
+                [], ['clarabel_opts'], False)['clarabel_opts'])
+        else:
+            dig_opts['cvxpy_opts'].update(digested_options(
+                options, ntf_fir_from_q0.default_options,
+                [], ['solver_opts'], False)['solver_opts'])
         opts['cvxpy_opts'].pop('override_kktsolver')
         dig_opts['cvxpy_opts'].update(opts['cvxpy_opts'])
+        dig_opts['formulation'] = opts['formulation']
         from ._fir_weighting_cvxpy import (
             ntf_fir_from_digested as _ntf_fir_from_digested)
     elif opts['modeler'] == 'cvxpy_old':
@@ -258,9 +399,24 @@ def ntf_fir_from_q0(q0, H_inf=1.5, normalize="auto", **options):
             [], ['cvxopt_opts'], False)['cvxopt_opts'])
         from ._fir_weighting_picos import (
             ntf_fir_from_digested as _ntf_fir_from_digested)
+    elif opts['modeler'] == 'native':
+        dig_opts.update(digested_options(
+            options, ntf_fir_from_q0.default_options,
+            [], ['native_opts'], False))
+        from ._fir_weighting_native import (
+            ntf_fir_from_digested as _ntf_fir_from_digested)
     else:
         raise ValueError('Unsupported modeling backend {}'.format(
             opts['modeler']))
+    if opts['formulation'] not in ('kyp', 'dual'):
+        raise ValueError('Unsupported formulation {}'.format(
+            opts['formulation']))
+    if opts['formulation'] == 'dual' and opts['modeler'] != 'cvxpy':
+        raise ValueError('The dual formulation is only supported by the '
+                         'cvxpy modeler')
+    if opts['output'] not in ('zpk', 'ba', 'fir', 'lazy'):
+        raise ValueError('Unsupported output format {}'.format(
+            opts['output']))
     digested_options(options, {})
     # Do the computation
     if normalize == 'auto':
@@ -268,16 +424,11 @@ def ntf_fir_from_q0(q0, H_inf=1.5, normalize="auto", **options):
     elif normalize is not None:
         q0 = q0*normalize
     order = q0.shape[0]-1
-    Q = la.toeplitz(q0)
-    d, v = np.linalg.eigh(Q)
-    if opts['fix_pos']:
-        d = d/np.max(d)
-        d[d < 0] = 0.
-    Qs = v.dot(np.diag(np.sqrt(d))).dot(v.T)
+    Qs = _q0_factor(q0, opts['fix_pos'], opts['formulation'] == 'dual')
     A = np.eye(order, order, 1)
     C = np.zeros((1, order))
     ntf_ir = _ntf_fir_from_digested(Qs, A, C, H_inf, **dig_opts)
-    return (np.roots(ntf_ir), np.zeros(order), 1.)
+    return _fir_ntf_output(ntf_ir, opts['output'])
 
 
 ntf_fir_from_q0.default_options = {"modeler": "cvxpy_old",
@@ -293,8 +444,21 @@ ntf_fir_from_q0.default_options = {"modeler": "cvxpy_old",
                                                 'normalize': True,
                                                 'use_indirect': False,
                                                 'acceleration_lookback': 0},
+                                   'clarabel_opts': {'max_iter': 200,
+                                                     'tol_gap_abs': 1e-8,
+                                                     'tol_gap_rel': 1e-8,
+                                                     'tol_feas': 1e-8},
+                                   'solver_opts': {},
+                                   'native_opts': {'maxiter': 50,
+                                                   'tol': 1e-6,
+                                                   'points': None,
+                                                   'gap_tol': 1e-6,
+                                                   'slsqp_maxiter': 500,
+                                                   'ftol': 1e-12},
                                    'show_progress': True,
-                                   'fix_pos': True}
+                                   'fix_pos': True,
+                                   'formulation': 'kyp',
+                                   'output': 'zpk'}
 
 
 def ntf_fir_weighting(order, w, H_inf=1.5,
@@ -321,20 +485,30 @@ def ntf_fir_weighting(order, w, H_inf=1.5,
 
     Returns
     -------
-    ntf : ndarray
-        FIR NTF in zpk form
+    ntf : tuple, ndarray or FirNTF
+        FIR NTF, by default in zpk form (see the ``output`` option)
 
     Other parameters
     ----------------
     show_progress : bool, optional
         provide extended output.
+    output : string, optional
+        format of the returned NTF. Either ``zpk`` (default), ``ba``,
+        ``fir`` for the NTF impulse response, or ``lazy`` for a
+        :class:`pydsm.NTFdesign.helpers.FirNTF` object computing the NTF
+        zeros only when they are accessed. The formats other than ``zpk``
+        avoid a root finding that is expensive and numerically delicate at
+        high orders.
     fix_pos : bool, optional
         fix quadratic form for positive definiteness. Numerical noise
         may make it not positive definite leading to errors.
     modeler : string, optional
         modeling backend for the optimization problem. Currently, the
         ``cvxpy_old``, ``cvxpy`` and ``picos`` backends are supported.
-        Default is ``cvxpy_old``.
+        Default is ``cvxpy_old``. Alternatively, ``native`` selects a built-in
+        solver that does not rely on any modeling layer. It is meant for
+        fast designs, e.g., in loops, where the full rigor of a semidefinite
+        program is not needed, and reports the optimality gap it achieves.
     cvxpy_opts : dictionary, optional
        A dictionary of options to use with the ``cvxpy`` modeling library.
        Allowed options include:
@@ -345,7 +519,9 @@ def ntf_fir_weighting(order, w, H_inf=1.5,
            Leave this at the default True setting, to avoid paying a
            performance price.
        ``solver`` (string)
-           The solver backend to use. Either `cvxopt` or `scs`
+           The solver backend to use. Either `cvxopt`, `scs` or
+           `clarabel`. The name of any other conic solver installed for
+           ``cvxpy`` is also accepted.
 
     cvxopt_opts : dict, optional
         A dictionary of options for the ``cvxopt`` optimizer.
@@ -382,11 +558,59 @@ def ntf_fir_weighting(order, w, H_inf=1.5,
        Do not use other options since they could break ``scs`` in
        unexpected ways. These options can be passed when using the
        ``cvxpy`` modeler with the ``scs`` backend.
+    clarabel_opts : dict, optional
+        A dictionary of options for the ``clarabel`` optimizer. Allowed
+        options include:
+
+        ``max_iter`` (int)
+            Maximum number of iterations
+        ``tol_gap_abs`` (real)
+            Absolute duality gap tolerance
+        ``tol_gap_rel`` (real)
+            Relative duality gap tolerance
+        ``tol_feas`` (real)
+            Feasibility check tolerance
+
+        These options can be passed when using the ``cvxpy`` modeler with
+        the ``clarabel`` backend.
+    solver_opts : dict, optional
+        A dictionary of options passed verbatim to any other solver selected
+        via the ``solver`` entry of ``cvxpy_opts``.
+    formulation : string, optional
+        How the constraint on the NTF peak gain is expressed. Either ``kyp``
+        (default), using the bounded real lemma, or ``dual``, using the trace
+        parametrization of non-negative trigonometric polynomials and
+        solving the problem in its dual form. The latter is only available
+        with the ``cvxpy`` modeler and leads to much smaller problems for
+        high orders, particularly with the ``cvxopt`` backend.
+    native_opts : dict, optional
+        A dictionary of options for the ``native`` solver. Allowed options
+        include:
+
+        ``maxiter`` (int)
+            Maximum number of constraint exchange iterations
+        ``tol`` (real)
+            Relative tolerance on the violation of the peak gain constraint
+        ``points`` (int or None)
+            Number of FFT points used to check the peak gain constraint.
+            If None, it is chosen based on the order
+        ``gap_tol`` (real)
+            Relative optimality gap above which a warning is issued
+        ``slsqp_maxiter`` (int)
+            Maximum number of iterations of the inner SLSQP solver
+        ``ftol`` (real)
+            Precision goal of the inner SLSQP solver
+    integrator : string, optional
+        How the matrix Q is computed from the weighting function, as in
+        :func:`q0_weighting`.
     quad_opts : dictionary, optional
         Parameters to be passed to the ``quad`` function used internally as
         an integrator. Allowed options are ``epsabs``, ``epsrel``, ``limit``,
         ``points``. Do not use other options since they could break the
         integrator in unexpected ways.
+    fixed_opts : dictionary, optional
+        Parameters for the ``fixed`` integrator, as in
+        :func:`q0_weighting`.
 
     Notes
     -----
@@ -414,10 +638,12 @@ def ntf_fir_weighting(order, w, H_inf=1.5,
     """
     # Manage optional parameters
     opts1 = digested_options(options, ntf_fir_weighting.default_options,
-                             [], ['quad_opts'], False)
+                             ['integrator'], ['quad_opts', 'fixed_opts'],
+                             False)
     opts2 = digested_options(
         options, ntf_fir_weighting.default_options,
-        ['show_progress', 'fix_pos', 'modeler'], [], False)
+        ['show_progress', 'fix_pos', 'modeler', 'formulation', 'output'],
+        [], False)
     if opts2['modeler'] == 'cvxpy':
         opts2.update(digested_options(
             options, ntf_fir_weighting.default_options,
@@ -430,13 +656,31 @@ def ntf_fir_weighting(order, w, H_inf=1.5,
             opts2.update(digested_options(
                 options, ntf_fir_weighting.default_options,
                 [], ['scs_opts'], False))
+        elif opts2['cvxpy_opts']['solver'] == 'clarabel':
+            opts2.update(digested_options(
+                options, ntf_fir_weighting.default_options,
+                [], ['clarabel_opts'], False))
+        else:
+            opts2.update(digested_options(
+                options, ntf_fir_weighting.default_options,
+                [], ['solver_opts'], False))
     elif opts2['modeler'] == 'cvxpy_old' or opts2['modeler'] == 'picos':
             opts2.update(digested_options(
                 options, ntf_fir_weighting.default_options,
                 [], ['cvxopt_opts'], False))
+    elif opts2['modeler'] == 'native':
+            opts2.update(digested_options(
+                options, ntf_fir_weighting.default_options,
+                [], ['native_opts'], False))
     else:
         raise ValueError('Unsupported modeling backend {}'.format(
             opts2['modeler']))
+    if opts2['formulation'] not in ('kyp', 'dual'):
+        raise ValueError('Unsupported formulation {}'.format(
+            opts2['formulation']))
+    if opts2['formulation'] == 'dual' and opts2['modeler'] != 'cvxpy':
+        raise ValueError('The dual formulation is only supported by the '
+                         'cvxpy modeler')
     digested_options(options, {})
     # Do the computation
     q0 = q0_weighting(order, w, **opts1)
@@ -497,7 +741,9 @@ def ntf_hybrid_weighting(order, w, H_inf=1.5, poles=[],
            Leave this at the default True setting, to avoid paying a
            performance price.
        ``solver`` (string)
-           The solver backend to use. Either `cvxopt` or `scs`
+           The solver backend to use. Either `cvxopt`, `scs` or
+           `clarabel`. The name of any other conic solver installed for
+           ``cvxpy`` is also accepted.
 
     cvxopt_opts : dict, optional
         A dictionary of options for the ``cvxopt`` optimizer.
@@ -534,11 +780,42 @@ def ntf_hybrid_weighting(order, w, H_inf=1.5, poles=[],
        Do not use other options since they could break ``scs`` in
        unexpected ways. These options can be passed when using the
        ``cvxpy`` modeler with the ``scs`` backend.
+    clarabel_opts : dict, optional
+        A dictionary of options for the ``clarabel`` optimizer. Allowed
+        options include:
+
+        ``max_iter`` (int)
+            Maximum number of iterations
+        ``tol_gap_abs`` (real)
+            Absolute duality gap tolerance
+        ``tol_gap_rel`` (real)
+            Relative duality gap tolerance
+        ``tol_feas`` (real)
+            Feasibility check tolerance
+
+        These options can be passed when using the ``cvxpy`` modeler with
+        the ``clarabel`` backend.
+    solver_opts : dict, optional
+        A dictionary of options passed verbatim to any other solver selected
+        via the ``solver`` entry of ``cvxpy_opts``.
+    formulation : string, optional
+        How the constraint on the NTF peak gain is expressed. Either ``kyp``
+        (default), using the bounded real lemma, or ``dual``, using the trace
+        parametrization of non-negative trigonometric polynomials and
+        solving the problem in its dual form. The latter is only available
+        with the ``cvxpy`` modeler and leads to much smaller problems for
+        high orders, particularly with the ``cvxopt`` backend.
+    integrator : string, optional
+        How the matrix Q is computed from the weighting function, as in
+        :func:`q0_weighting`.
     quad_opts : dictionary, optional
         Parameters to be passed to the ``quad`` function used internally as
         an integrator. Allowed options are ``epsabs``, ``epsrel``, ``limit``,
         ``points``. Do not use other options since they could break the
         integrator in unexpected ways.
+    fixed_opts : dictionary, optional
+        Parameters for the ``fixed`` integrator, as in
+        :func:`q0_weighting`.
 
     Notes
     -----
@@ -563,10 +840,11 @@ def ntf_hybrid_weighting(order, w, H_inf=1.5, poles=[],
     """
     # Manage optional parameters
     opts1 = digested_options(options, ntf_hybrid_weighting.default_options,
-                             [], ['quad_opts'], False)
+                             ['integrator'], ['quad_opts', 'fixed_opts'],
+                             False)
     opts2 = digested_options(
         options, ntf_hybrid_weighting.default_options,
-        ['show_progress', 'fix_pos', 'modeler'], [], False)
+        ['show_progress', 'fix_pos', 'modeler', 'formulation'], [], False)
     dig_opts = {'show_progress': opts2['show_progress'],
                 'cvxpy_opts': {},
                 'cvxpy_tdr_opts': {},
@@ -585,8 +863,17 @@ def ntf_hybrid_weighting(order, w, H_inf=1.5, poles=[],
             dig_opts['cvxpy_opts'].update(digested_options(
                 options, ntf_fir_from_q0.default_options,
                 [], ['scs_opts'], False)['scs_opts'])
+        elif opts2['cvxpy_opts']['solver'] == 'clarabel':
+            dig_opts['cvxpy_opts'].update(digested_options(
+                options, ntf_fir_from_q0.default_options,
+                [], ['clarabel_opts'], False)['clarabel_opts'])
+        else:
+            dig_opts['cvxpy_opts'].update(digested_options(
+                options, ntf_fir_from_q0.default_options,
+                [], ['solver_opts'], False)['solver_opts'])
         opts2['cvxpy_opts'].pop('override_kktsolver')
         dig_opts['cvxpy_opts'].update(opts2['cvxpy_opts'])
+        dig_opts['formulation'] = opts2['formulation']
         from ._fir_weighting_cvxpy import (
             ntf_fir_from_digested as _ntf_fir_from_digested)
     elif opts2['modeler'] == 'cvxpy_old':
@@ -604,6 +891,12 @@ def ntf_hybrid_weighting(order, w, H_inf=1.5, poles=[],
     else:
         raise ValueError('Unsupported modeling backend {}'.format(
             opts2['modeler']))
+    if opts2['formulation'] not in ('kyp', 'dual'):
+        raise ValueError('Unsupported formulation {}'.format(
+            opts2['formulation']))
+    if opts2['formulation'] == 'dual' and opts2['modeler'] != 'cvxpy':
+        raise ValueError('The dual formulation is only supported by the '
+                         'cvxpy modeler')
     digested_options(options, {})
     # Do the computation
     poles = np.asarray(poles).reshape(-1)
@@ -621,12 +914,7 @@ def ntf_hybrid_weighting(order, w, H_inf=1.5, poles=[],
     poles = padr(poles, order, 0)
     # Get denominator coefficients from a_1 to a_order (a_0 is 1)
     ar = np.poly(poles)[1:].real
-    Q = la.toeplitz(q0)
-    d, v = np.linalg.eigh(Q)
-    if opts2['fix_pos']:
-        d = d/np.max(d)
-        d[d < 0] = 0.
-    Qs = v.dot(np.diag(np.sqrt(d))).dot(v.T)
+    Qs = _q0_factor(q0, opts2['fix_pos'], opts2['formulation'] == 'dual')
     A = np.eye(order, order, 1)
     A[order-1] = -ar[::-1]
     C = -ar[::-1].reshape((1, order))
@@ -646,8 +934,14 @@ ntf_hybrid_weighting.default_options = {"modeler": "cvxpy_old",
                                                      'alpha': 1.8,
                                                      'normalize': True,
                                                      'use_indirect': False},
+                                        'clarabel_opts': {'max_iter': 200,
+                                                          'tol_gap_abs': 1e-8,
+                                                          'tol_gap_rel': 1e-8,
+                                                          'tol_feas': 1e-8},
+                                        'solver_opts': {},
                                         'show_progress': True,
-                                        'fix_pos': True}
+                                        'fix_pos': True,
+                                        'formulation': 'kyp'}
 ntf_hybrid_weighting.default_options.update(q0_weighting.default_options)
 
 
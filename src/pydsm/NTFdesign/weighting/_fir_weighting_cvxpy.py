@@ -19,6 +19,7 @@
 # along with PyDSM.  If not, see <https://www.gnu.org/licenses/>.
 
 import numpy as np
+import scipy.sparse as sp
 import cvxpy
 
 
@@ -33,6 +34,13 @@ def ntf_fir_from_digested(Qs, A, C, H_inf, **opts):
         opts['cvxpy_opts']['solver'] = cvxpy.CVXOPT
     elif opts['cvxpy_opts']['solver'] == 'scs':
         opts['cvxpy_opts']['solver'] = cvxpy.SCS
+    elif opts['cvxpy_opts']['solver'] == 'clarabel':
+        opts['cvxpy_opts']['solver'] = cvxpy.CLARABEL
+    else:
+        opts['cvxpy_opts']['solver'] = opts['cvxpy_opts']['solver'].upper()
+    if opts.get('formulation', 'kyp') == 'dual':
+        return _ntf_fir_from_digested_dual(Qs, A, C, H_inf, verbose,
+                                           opts['cvxpy_opts'])
     order = int(np.size(Qs, 0)-1)
     br = cvxpy.Variable((order, 1), name='br')
     b = cvxpy.vstack([np.array([[1]]), br])
@@ -50,3 +58,45 @@ def ntf_fir_from_digested(Qs, A, C, H_inf, **opts):
     p = cvxpy.Problem(target, constraints)
     p.solve(verbose=verbose, **opts['cvxpy_opts'])
     return np.hstack((1, np.asarray(br.value.T)[0]))
+
+
+def _ntf_fir_from_digested_dual(Qs, A, C, H_inf, verbose, cvxpy_opts):
+    """
+    Synthesize FIR NTF from predigested specification
+
+    Dual formulation, where the constraint on the NTF peak gain is
+    expressed through the trace parametrization of the non-negative
+    trigonometric polynomial H_inf**2*|a|**2-|b|**2, a being the NTF
+    denominator and b its numerator. The problem is solved in its dual
+    form, whose only matrix inequality depends on O(order) variables,
+    and the NTF is recovered from the multiplier of the inequality.
+
+    A is expected in companion form, as built by the front-ends.
+    """
+    order = int(np.size(Qs, 0)-1)
+    n = order+1
+    # NTF denominator, its autocorrelation and constant part of numerator
+    a = np.hstack((1., -A[order-1, ::-1]))
+    rho = np.correlate(a, a, 'full')[order:]
+    c0 = np.hstack((0., C[0, ::-1]+a[1:]))
+    # Symmetric Toeplitz matrix from its first row, as a sparse map
+    ii, jj = np.indices((n, n))
+    T_map = sp.csr_matrix((np.ones(n*n), ((ii*n+jj).ravel(),
+                                          np.abs(ii-jj).ravel())),
+                          shape=(n*n, n))
+    y = cvxpy.Variable(n, name='y')
+    u = cvxpy.Variable(n, name='u')
+    mu = cvxpy.Variable(name='mu')
+    omega = cvxpy.Variable((1, 1), name='omega')
+    w = cvxpy.reshape((mu*np.eye(n)[0]-Qs.T @ u)/2, (n, 1), order='F')
+    W = cvxpy.bmat([[cvxpy.reshape(T_map @ y, (n, n), order='F'), w],
+                    [w.T, omega]])
+    constraint = W >> 0
+    weights = np.hstack((rho[0], 2*rho[1:]))*H_inf**2
+    target = cvxpy.Maximize(u @ (Qs @ c0) - weights @ y -
+                            cvxpy.sum(omega) - mu)
+    p = cvxpy.Problem(target, [constraint, cvxpy.norm2(u) <= 1])
+    p.solve(verbose=verbose, **cvxpy_opts)
+    Z = constraint.dual_value
+    b = Z[:-1, -1]/Z[-1, -1]-c0
+    return np.hstack((1, b[1:]))
@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2026, Sergio Callegari
+# All rights reserved.
+
+# This file is part of PyDSM.
+
+# PyDSM is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# PyDSM is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with PyDSM.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Dedicated solver for the FIR NTF weighting problem.
+
+The problem min b'Qb subject to b[0] = 1 and |H(exp(j w))| <= H_inf for all
+w is solved without any modeling layer, by a constraint exchange method.
+The peak gain constraint is imposed at a finite set of frequencies and the
+resulting smooth problem is solved by SLSQP. The NTF magnitude is then
+evaluated on a dense grid by FFT and the local maxima exceeding the bound
+are added to the constraint set, until none is left.
+
+At the end, the Lagrange multipliers of the peak gain constraints are used
+to compute a lower bound on the optimum by weak duality, so that the
+quality of the solution can be certified by an optimality gap.
+"""
+
+from __future__ import division, print_function
+
+import numpy as np
+import scipy.linalg as la
+from scipy.optimize import minimize, nnls
+from warnings import warn
+from ...exceptions import PyDsmApproximationWarning
+
+
+def _fir_min_quadratic(M):
+    # Minimizer of b'Mb subject to b[0] = 1
+    x = la.lstsq(M[1:, 1:], -M[1:, 0])[0]
+    return np.hstack((1., x))
+
+
+def _gain_peaks(b, bound, points):
+    """
+    Locate local maxima of |H|**2 exceeding bound.
+
+    Returns the normalized frequencies of the maxima, refined by parabolic
+    interpolation on an FFT grid, and the peak value of |H|**2.
+    """
+    m = np.abs(np.fft.rfft(b, points))**2
+    p = np.concatenate(([-np.inf], m, [-np.inf]))
+    idx = np.nonzero((p[1:-1] >= p[:-2]) & (p[1:-1] >= p[2:]) &
+                     (m > bound))[0]
+    ff = idx.astype(float)
+    inner = (idx > 0) & (idx < len(m)-1)
+    i = idx[inner]
+    den = m[i-1]-2*m[i]+m[i+1]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        delta = np.where(den != 0, 0.5*(m[i-1]-m[i+1])/den, 0.)
+    ff[inner] += np.clip(delta, -0.5, 0.5)
+    return ff/points, np.max(m)
+
+
+def ntf_fir_from_digested(Qs, A, C, H_inf, **opts):
+    """
+    Synthesize FIR NTF from predigested specification
+
+    Version for the native solver. Only FIR NTFs are supported, namely A is
+    expected to be a shift matrix and C to be zero, as built by
+    ``ntf_fir_from_q0``.
+    """
+    verbose = opts['show_progress']
+    nopts = opts['native_opts']
+    tol = nopts['tol']
+    if nopts['maxiter'] < 1:
+        raise ValueError('At least one constraint exchange iteration '
+                         'is required')
+    Q = Qs.T.dot(Qs)
+    n = Q.shape[0]
+    points = nopts['points']
+    if points is None:
+        points = max(1024, int(2**np.ceil(np.log2(16*n))))
+    kk = np.arange(n)
+    g2 = H_inf**2
+    # Start from the feasible NTF H(z)=1 and a uniform frequency grid
+    b = np.zeros(n)
+    b[0] = 1.
+    ff = np.linspace(0., 0.5, 2*n)
+    nit = 0
+    for itn in range(nopts['maxiter']):
+        if itn > 0:
+            new_ff, _ = _gain_peaks(b, g2*(1+tol), points)
+            if len(new_ff) == 0:
+                break
+            ff = np.concatenate((ff, new_ff))
+        ww = 2*np.pi*np.outer(ff, kk)
+        Cm, Sm = np.cos(ww), np.sin(ww)
+        # Scale the objective so that it is about unity at the start point
+        scale = 1./b.dot(Q).dot(b)
+
+        def fun(x):
+            bb = np.hstack((1., x))
+            return scale*bb.dot(Q).dot(bb)
+
+        def jac(x):
+            bb = np.hstack((1., x))
+            return 2*scale*Q[1:, :].dot(bb)
+
+        def cfun(x):
+            bb = np.hstack((1., x))
+            return g2-Cm.dot(bb)**2-Sm.dot(bb)**2
+
+        def cjac(x):
+            bb = np.hstack((1., x))
+            return -2*(Cm.dot(bb)[:, np.newaxis]*Cm[:, 1:] +
+                       Sm.dot(bb)[:, np.newaxis]*Sm[:, 1:])
+
+        res = minimize(fun, b[1:], jac=jac, method='SLSQP',
+                       constraints=[{'type': 'ineq', 'fun': cfun,
+                                     'jac': cjac}],
+                       options={'maxiter': nopts['slsqp_maxiter'],
+                                'ftol': nopts['ftol']})
+        nit += res.nit
+        b = np.hstack((1., res.x))
+        if verbose:
+            print('Exchange iteration {}: {} frequencies, {} SLSQP '
+                  'iterations, {}'.format(itn+1, len(ff), res.nit,
+                                          res.message))
+    else:
+        warn('Constraint exchange iteration limit exceeded.',
+             PyDsmApproximationWarning)
+    # Lower bound by weak duality from the constraint multipliers
+    ww = 2*np.pi*np.outer(ff, kk)
+    Cm, Sm = np.cos(ww), np.sin(ww)
+    if 'multipliers' in res:
+        mu = np.maximum(res.multipliers/scale, 0.)
+    else:
+        G = Cm.dot(b)[:, np.newaxis]*Cm+Sm.dot(b)[:, np.newaxis]*Sm
+        mu = nnls(-G[:, 1:].T, Q[1:, :].dot(b))[0]
+    M = Q+(Cm.T*mu).dot(Cm)+(Sm.T*mu).dot(Sm)
+    bl = _fir_min_quadratic(M)
+    lower = max(bl.dot(M).dot(bl)-g2*np.sum(mu), 0.)
+    value = b.dot(Q).dot(b)
+    gap = (value-lower)/value
+    peak = np.sqrt(_gain_peaks(b, np.inf, points)[1])
+    if verbose:
+        print('Native solver: cost {:.6e}, lower bound {:.6e}, relative '
+              'gap {:.2e}, peak gain {:.6f}, {} SLSQP iterations'.format(
+                  np.sqrt(value), np.sqrt(lower), gap, peak, nit))
+    if gap > nopts['gap_tol']:
+        warn('Optimality gap {:.2e} exceeds tolerance.'.format(gap),
+             PyDsmApproximationWarning)
+    return b
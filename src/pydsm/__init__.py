@@ -72,12 +72,14 @@ Error handling
 # Read version info
 from ._version import __version__
 
-# Promote some key functions to the pydsm namespace
-from . import delsig
-from . import NTFdesign
-from . import simulation
-from . import audio_weightings
-from . import iso226
+# Promote some key modules to the pydsm namespace, importing them on
+# first access
+from ._lazy import lazy_attributes
+__getattr__, __dir__, _ = lazy_attributes(
+    __name__, ['delsig', 'NTFdesign', 'simulation', 'audio_weightings',
+               'iso226', 'correlations', 'ft', 'ir', 'relab', 'utilities',
+               'exceptions'])
+del lazy_attributes, _
 
 from ._pytesttester import PytestTester
 test = PytestTester(__name__)
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2026, Sergio Callegari
+# All rights reserved.
+
+# This file is part of PyDSM.
+
+# PyDSM is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# PyDSM is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with PyDSM.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Lazy loading of package contents.
+
+This module implements the module level ``__getattr__`` and ``__dir__``
+functions (PEP 562) used by the PyDSM packages to import their
+submodules, and the functions that they promote to the package
+namespace, only when they are first accessed. In this way, importing a
+package does not pay for matplotlib, the simulator backends or the
+scipy submodules needed by functions that are never used.
+
+This module is imported by every subpackage and must not import
+anything heavy.
+"""
+
+import sys
+import importlib
+
+__all__ = ['lazy_attributes']
+
+
+def lazy_attributes(package, submodules=(), attributes=None):
+    """
+    Prepare the lazy loading of the contents of a package.
+
+    Parameters
+    ----------
+    package : str
+        name of the package, namely its ``__name__``.
+    submodules : sequence of str, optional
+        submodules of the package that are imported when they are first
+        accessed as attributes of the package.
+    attributes : dict, optional
+        dictionary mapping the names of submodules, relative to the
+        package, to the lists of names that the package promotes from
+        them.
+
+    Returns
+    -------
+    getattr : callable
+        function to assign to ``__getattr__`` in the package.
+    dir : callable
+        function to assign to ``__dir__`` in the package.
+    all : list of str
+        the promoted names, suitable for ``__all__``.
+
+    Notes
+    -----
+    Promoted names are stored in the package namespace on first access,
+    so that the module level ``__getattr__`` is only called once per
+    name.
+    """
+    submodules = frozenset(submodules)
+    origin = {}
+    for module, names in (attributes or {}).items():
+        for name in names:
+            origin[name] = module
+
+    def __getattr__(name):
+        if name in submodules:
+            return importlib.import_module('.'+name, package)
+        if name in origin:
+            module = importlib.import_module(origin[name], package)
+            value = getattr(module, name)
+            setattr(sys.modules[package], name, value)
+            return value
+        raise AttributeError("module {!r} has no attribute {!r}".format(
+            package, name))
+
+    def __dir__():
+        return sorted(set(vars(sys.modules[package])) | submodules |
+                      set(origin))
+
+    return __getattr__, __dir__, list(origin)
@@ -39,6 +39,13 @@ implementation. In this case, be careful since no normalization is
 present so that the gain at 1 kHz can be arbitrary. The filter
 transfer function is referred to a signal amplitude weighting.
 
+Normalized analog filters and their discrete time counterparts at a
+given sample rate, obtained by the bilinear or the matched-z transform,
+can be obtained by :func:`analog_zpk` and :func:`digital_zpk`. The
+discrete time filters can be directly used as weightings by the NTF
+design and by the merit factor functions, that can then compute the
+weighted integrals exactly rather than by numerical quadrature.
+
 .. currentmodule:: pydsm.audio_weightings
 
 
@@ -69,6 +76,12 @@ Filter implementation of weighting functions
 .. autodata:: f_zpk
    :annotation:
 
+.. autosummary::
+   :toctree: generated/
+
+    analog_zpk
+    digital_zpk
+
 
 Normalization constants
 -----------------------
@@ -105,13 +118,14 @@ evaluation of the transfer function may require special care.
 from __future__ import division, print_function
 
 import numpy as np
+from functools import lru_cache
 
 __all__ = ["a_zpk", "a_weighting", "b_zpk", "b_weighting",
            "c_zpk", "c_weighting", "d_zpk", "d_weighting",
-           "f_zpk", "f_weighting"]
+           "f_zpk", "f_weighting", "analog_zpk", "digital_zpk"]
 
 a_zpk = (2*np.pi*np.asarray([0., 0., 0., 0.]),
-         2*np.pi*np.asarray([-20.6, -20.6, -107.7, -739.9, -12200., -12200.]),
+         2*np.pi*np.asarray([-20.6, -20.6, -107.7, -737.9, -12200., -12200.]),
          (2*np.pi*12200.)**2)
 """A-weighting filter in zpk form."""
 
@@ -342,3 +356,128 @@ def f_weighting(f, normal=True, power=True):
 f_weighting_gain = 1/f_weighting(1000, normal=False, power=True)
 """Normalization gain to apply to F-weighting filter (namely, the
    attenuation of the filter at 1 kHz)"""
+
+
+_zpk = {'a': a_zpk, 'b': b_zpk, 'c': c_zpk, 'd': d_zpk, 'f': f_zpk}
+
+
+def _log_gain(zpk, x):
+    # Log of the magnitude of the filter transfer function at x, computed
+    # root by root since the F-weighting filter can overflow otherwise
+    z, p, k = zpk
+    return (np.log(np.abs(k))+np.sum(np.log(np.abs(x-z))) -
+            np.sum(np.log(np.abs(x-p))))
+
+
+def _frozen(z, p, k):
+    # zpk tuple with read only arrays, safe to share from a cache
+    z = np.array(z, dtype=complex)
+    p = np.array(p, dtype=complex)
+    z.flags.writeable = False
+    p.flags.writeable = False
+    return z, p, float(k)
+
+
+def _check_weighting(weighting):
+    weighting = weighting.lower()
+    if weighting not in _zpk:
+        raise ValueError('Unsupported weighting {}'.format(weighting))
+    return weighting
+
+
+def analog_zpk(weighting, normal=True):
+    """Returns an analog filter realizing a weighting function.
+
+    Parameters
+    ----------
+    weighting : str
+        the weighting, one of ``a``, ``b``, ``c``, ``d`` and ``f``.
+    normal : bool
+        whether the filter should be normalized to have unit gain at
+        1 kHz.
+
+    Returns
+    -------
+    zpk : tuple
+        zeros, poles and gain of the filter, in rad/s. The magnitude of its
+        frequency response is the weighting in terms of signal amplitude.
+
+    Notes
+    -----
+    The returned arrays are cached and read only.
+    """
+    return _analog_zpk(_check_weighting(weighting), bool(normal))
+
+
+@lru_cache(maxsize=None)
+def _analog_zpk(weighting, normal):
+    z, p, k = _zpk[weighting]
+    if normal:
+        k = k/np.exp(_log_gain((z, p, k), 2j*np.pi*1000.))
+    return _frozen(z, p, k)
+
+
+def digital_zpk(weighting, fs, method='bilinear', normal=True):
+    """Returns a discrete time filter realizing a weighting function.
+
+    Parameters
+    ----------
+    weighting : str
+        the weighting, one of ``a``, ``b``, ``c``, ``d`` and ``f``.
+    fs : float
+        the sample rate of the filter in Hz. It must be larger than 2 kHz.
+    method : str
+        the discretization method, either ``bilinear`` (bilinear transform)
+        or ``matched`` (matched-z transform).
+    normal : bool
+        whether the filter should be normalized to have unit gain at
+        1 kHz.
+
+    Returns
+    -------
+    zpk : tuple
+        zeros, poles and gain of the filter. The magnitude of its frequency
+        response at the normalized frequency f/fs is the weighting at
+        frequency f in terms of signal amplitude.
+
+    Notes
+    -----
+    Either way, the filter gain is set so that the discrete time filter
+    matches the analog one at 1 kHz. Both transforms distort the
+    weighting close to the Nyquist frequency, so that ``fs`` should be
+    well above the audio band. This is always the case when the filter is
+    used as a noise weighting at the sample rate of an oversampling
+    modulator, as in::
+
+        w = digital_zpk('a', 2*osr*22.05E3)
+
+    The filters are cached by weighting, sample rate, method and
+    normalization. The returned arrays are read only.
+
+    See Also
+    --------
+    scipy.signal.bilinear_zpk : For the bilinear transform.
+    """
+    fs = float(fs)
+    if not fs > 2000.:
+        raise ValueError('Sample rate must be larger than 2 kHz')
+    if method not in ('bilinear', 'matched'):
+        raise ValueError('Unsupported method {}'.format(method))
+    return _digital_zpk(_check_weighting(weighting), fs, method, bool(normal))
+
+
+@lru_cache(maxsize=None)
+def _digital_zpk(weighting, fs, method, normal):
+    za, pa, ka = analog_zpk(weighting, normal)
+    if method == 'bilinear':
+        # Map the roots directly, the gain of scipy.signal.bilinear_zpk
+        # overflows with the F-weighting filter
+        fs2 = 2*fs
+        z = np.concatenate(((fs2+za)/(fs2-za), -np.ones(len(pa)-len(za))))
+        p = (fs2+pa)/(fs2-pa)
+    else:
+        z, p = np.exp(za/fs), np.exp(pa/fs)
+    # Match the analog filter at 1 kHz
+    k = np.exp(_log_gain((za, pa, ka), 2j*np.pi*1000.) -
+               _log_gain((z, p, 1.), np.exp(2j*np.pi*1000./fs)))
+    return _frozen(z, p, k)
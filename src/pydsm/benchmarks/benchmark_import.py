@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2026, Sergio Callegari
+# All rights reserved.
+
+# This file is part of PyDSM.
+
+# PyDSM is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# PyDSM is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with PyDSM.  If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import division, print_function
+
+import sys
+import subprocess
+import pytest
+
+try:
+    import pytest_benchmark
+    BENCHMARK_AVAILABLE = True
+except ImportError:
+    BENCHMARK_AVAILABLE = False
+
+
+def _import(statement):
+    subprocess.run([sys.executable, "-c", statement], check=True)
+
+
+@pytest.mark.skipif(not BENCHMARK_AVAILABLE,
+                    reason="pytest-benchmark is not installed")
+@pytest.mark.benchmark(group="import")
+class Benchmark_import(object):
+
+    def benchmark_import_pydsm(self, benchmark):
+        """Benchmark a fresh interpreter importing pydsm"""
+        benchmark(_import, "import pydsm")
+
+    def benchmark_import_simulator(self, benchmark):
+        """Benchmark a fresh interpreter importing the simulator only"""
+        benchmark(_import, "from pydsm.simulation import simulateDSM")
+
+    def benchmark_import_delsig_all(self, benchmark):
+        """Benchmark a fresh interpreter importing all of pydsm.delsig"""
+        benchmark(_import, "from pydsm.delsig import *")
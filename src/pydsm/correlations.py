@@ -41,6 +41,7 @@ Functions
 from __future__ import division, print_function
 
 import numpy as np
+import scipy.fft as fft
 
 import sys
 if sys.version_info < (3,):
@@ -49,16 +50,67 @@ if sys.version_info < (3,):
 __all__ = ["raw_acorr", "raw_xcorr"]
 
 
-def raw_acorr(x, N):
+def _fft_cheaper(m, n_lags, fft_len):
+    # Cost model in multiply-accumulate equivalents. The direct method
+    # pays about m MACs per lag plus the interpreter overhead of a dot
+    # call, the FFT method about 8*L*log2(L) for a transform pair of
+    # length L
+    direct = n_lags*(m+3000)
+    return 8*fft_len*np.log2(fft_len) < direct
+
+
+def _xcorr_direct(x, y, N):
+    mx = x.shape[-1]
+    my = y.shape[-1]
+    return np.stack([np.einsum('...i,...i->...',
+                               y[..., k:min(my, mx+k)],
+                               x[..., 0:min(my-k, mx)])
+                     for k in range(N+1)], axis=-1)
+
+
+def _xcorr_fft(x, y, N):
+    # q(k) = sum_n y(n+k) x(n), computed on a zero padded support long
+    # enough to avoid circular aliasing of the lags 0...N
+    mx = x.shape[-1]
+    my = y.shape[-1]
+    cplx = np.iscomplexobj(x) or np.iscomplexobj(y)
+    L = fft.next_fast_len(max(my, mx+N+1), not cplx)
+    if cplx:
+        q = fft.ifft(fft.fft(y, L)*np.conj(fft.fft(np.conj(x), L)), L)
+    else:
+        q = fft.irfft(fft.rfft(y, L)*np.conj(fft.rfft(x, L)), L)
+    return q[..., :N+1]
+
+
+def _xcorr(x, y, N, method):
+    x = np.asarray(x)
+    y = np.asarray(y)
+    if method == 'auto':
+        L = fft.next_fast_len(max(y.shape[-1], x.shape[-1]+N+1))
+        method = ('fft' if _fft_cheaper(min(x.shape[-1], y.shape[-1]),
+                                        N+1, L) else 'direct')
+    if method == 'direct':
+        return _xcorr_direct(x, y, N)
+    elif method == 'fft':
+        return _xcorr_fft(x, y, N)
+    raise ValueError('Unsupported correlation method {}'.format(method))
+
+
+def raw_acorr(x, N, method='auto'):
     """
     Computes the raw autocorrelation of a vector up to lag N.
 
     Parameters
     ----------
     x : array_like
-        1-D sequence to compute the auto-correlation upon
+        1-D sequence to compute the auto-correlation upon. A 2-D array
+        is taken as a batch of sequences, one per row.
     N : int
         the maximum (positive) lag of the raw auto-correlation to return.
+    method : string, optional
+        either ``direct``, computing a dot product per lag, ``fft``, using
+        zero padded fast Fourier transforms, or ``auto`` (default), choosing
+        the cheaper of the two on the basis of the length of x and N.
 
     Returns
     -------
@@ -66,31 +118,40 @@ def raw_acorr(x, N):
         the raw (unnormalized) autocorrelation vector.
         Assuming that :math:`m` is the length of x,
         :math:`q(k) = \\sum_{n=k}^{m-1} x(n) x(n-k)
-        \\text{ for } k = 0 \\dots N`
+        \\text{ for } k = 0 \\dots N`. For a 2-D x, an array
+        with an autocorrelation vector per row.
 
     Notes
     -----
     The routine does not make any check on the length of x and N. It
     is responsibility of the user to assure that len(x)>=N. In some cases
     (but only in some cases), zero padding is practiced.
+
+    The ``fft`` method costs O(m log m) operations rather than O(m N),
+    at the price of a rounding error proportional to the energy of x
+    rather than to the magnitude of each lag.
     """
-    m = len(x)
-    q = np.asarray([np.dot(x[k:m], x[0:m-k]) for k in range(N+1)])
-    return q
+    return _xcorr(x, x, N, method)
 
 
-def raw_xcorr(x, y, N):
+def raw_xcorr(x, y, N, method='auto'):
     """
     Computes the raw crosscorrelation between two vectors up to lag N.
 
     Parameters
     ----------
     x : array_like
-        first 1-D vector
+        first 1-D vector. A 2-D array is taken as a batch of vectors, one
+        per row.
     y : array_like
-        second 1-D vector
+        second 1-D vector. A 2-D array is taken as a batch of vectors, one
+        per row. Batches of x and y are broadcast against each other.
     N : int
         the maximum (positive) lag of the raw cross-correlation to return.
+    method : string, optional
+        either ``direct``, computing a dot product per lag, ``fft``, using
+        zero padded fast Fourier transforms, or ``auto`` (default), choosing
+        the cheaper of the two on the basis of the lengths of x, y and N.
 
     Returns
     -------
@@ -98,7 +159,8 @@ def raw_xcorr(x, y, N):
         the raw (unnormalized) crosscorrelation vector.
         Assuming that :math:`m_x` and :math:`m_y` are the lengths of x and y,
         :math:`q(k) = \\sum_{n=k}^{\\min(m_x-1,m_y+k-1)}
-        x(n) y(n-k) \\text{ for } k = 0 \\dots N`
+        x(n) y(n-k) \\text{ for } k = 0 \\dots N`. For 2-D inputs, an
+        array with a crosscorrelation vector per row.
 
     Notes
     -----
@@ -106,8 +168,4 @@ def raw_xcorr(x, y, N):
     is responsibility of the user to assure that N<=len(y). In some cases
     (but only in some cases), zero padding is assumed.
     """
-    mx = len(x)
-    my = len(y)
-    q = np.asarray([np.dot(y[k:min(my, mx+k)],
-                           x[0:min(my-k, mx)]) for k in range(N+1)])
-    return q
+    return _xcorr(x, y, N, method)
@@ -27,11 +27,36 @@ if sys.version_info >= (3, 0):
 else:
     int_types = (int, long)
 
+# Function: _obj
+def _obj(x):
+    """
+    Wraps an object in a 0-d object array, so that numpy
+    broadcasts it as is in elementwise operations.
+
+    :param x: Number or scalar object.
+    """
+
+    o = np.empty((),dtype=object)
+    o[()] = x
+    return o
+
+# Function: _is_zero
+def _is_zero(x):
+    """
+    Determines if an entry is the number zero.
+
+    :param x: Number or scalar object.
+    """
+
+    return np.isscalar(x) and x == 0.0
+
 #***********************************************************************#
 # Class definition: cvxpy_array                                         #
 #***********************************************************************#
 class cvxpy_array(object):
 
+    __slots__ = ('shape','data','type','_variables','_parameters')
+
     # Method: __init__
     def __init__(self,m,n):
         """
@@ -42,58 +67,67 @@ class cvxpy_array(object):
         """
 
         self.shape = (m,n)
-        temp1 = {}
-        for i in range(0,m,1):
-            temp2 = {}
-            for j in range(0,n,1):
-                temp2[j] = 0.0
-            temp1[i] = temp2
-        self.data = temp1
+        self.data = np.full((m,n),0.0,dtype=object)
         self.type = ARRAY
+        self._variables = None
+        self._parameters = None
 
-    # Method:__getattribute__
-    def __getattribute__(self,name):
-
-        # Transpose
-        if name == 'T':
-            new_ar = cvxpy_array(self.shape[1],self.shape[0])
-            for i in range(0,self.shape[0],1):
-                for j in range(0,self.shape[1],1):
-                    new_ar.data[j][i] = self.data[i][j]
-            return new_ar
-
-        # Variables
-        elif name == 'variables':
-            l = []
-            for i in range(0,self.shape[0],1):
-                for j in range(0,self.shape[1],1):
-                    if not np.isscalar(self.data[i][j]):
-                        l += self.data[i][j].variables
-            return cvxpy_list(set(l))
-
-        # Parameters
-        elif name == 'parameters':
-            l = []
-            for i in range(0,self.shape[0],1):
-                for j in range(0,self.shape[1],1):
-                    if not np.isscalar(self.data[i][j]):
-                        l += self.data[i][j].parameters
-            return cvxpy_list(set(l))
-
-        # Value
-        elif name == 'value':
-            mat = cvxpy_matrix(np.zeros((self.shape[0],self.shape[1])),np.float64)
-            for i in range(0,self.shape[0],1):
-                for j in range(0,self.shape[1],1):
-                    if np.isscalar(self.data[i][j]):
-                        mat[i,j] = self.data[i][j]
-                    else:
-                        mat[i,j] = self.data[i][j].value
-            return mat
-
-        # Other attribute
-        else:
-            return object.__getattribute__(self,name)
+    # Method: _from_data
+    @classmethod
+    def _from_data(cls,data):
+        """
+        Builds an array around an object ndarray.
+
+        :param data: 2-D object ndarray, not copied.
+        """
+
+        new_ar = cvxpy_array.__new__(cvxpy_array)
+        new_ar.shape = data.shape
+        new_ar.data = data
+        new_ar.type = ARRAY
+        new_ar._variables = None
+        new_ar._parameters = None
+        return new_ar
+
+    # Method: _collect
+    def _collect(self,name):
+        """
+        Collects the variables or parameters of the entries.
+
+        :param name: 'variables' or 'parameters'.
+        """
+
+        l = set()
+        for x in self.data.flat:
+            if not np.isscalar(x):
+                l.update(getattr(x,name))
+        return l
+
+    # Transpose
+    @property
+    def T(self):
+        return cvxpy_array._from_data(self.data.T.copy())
+
+    # Variables (cached, since entries only change through __setitem__)
+    @property
+    def variables(self):
+        if self._variables is None:
+            self._variables = self._collect('variables')
+        return cvxpy_list(self._variables)
+
+    # Parameters (cached, since entries only change through __setitem__)
+    @property
+    def parameters(self):
+        if self._parameters is None:
+            self._parameters = self._collect('parameters')
+        return cvxpy_list(self._parameters)
+
+    # Value
+    @property
+    def value(self):
+        mat = np.asarray([x if np.isscalar(x) else x.value
+                          for x in self.data.flat],dtype=np.float64)
+        return cvxpy_matrix(mat.reshape(self.shape),np.float64)
 
     # Method: __setitem__
     def __setitem__(self,key,value):
@@ -110,7 +144,9 @@ class cvxpy_array(object):
         if key[1] < 0 or key[1] >= self.shape[1]:
             raise ValueError('Index out of range')
 
-        self.data[key[0]][key[1]] = value
+        self.data[key[0],key[1]] = value
+        self._variables = None
+        self._parameters = None
 
     # Method: __getitem__
     def __getitem__(self,key):
@@ -119,6 +155,15 @@ class cvxpy_array(object):
             raise TypeError('Invalid Key')
         if len(key) != 2:
             raise TypeError('Invalid Key')
+
+        # Single entry
+        if (type(key[0]) in int_types and type(key[1]) in int_types):
+            if key[0] < 0 or key[0] >= self.shape[0]:
+                raise ValueError('Index out of range')
+            if key[1] < 0 or key[1] >= self.shape[1]:
+                raise ValueError('Index out of range')
+            return self.data[key[0],key[1]]
+
         if (not (issubclass(type(key[0]), int_types+(np.integer,))) and
             type(key[0]) is not slice):
             raise TypeError('Invalid Key')
@@ -180,22 +225,14 @@ class cvxpy_array(object):
                 raise ValueError('Index out of range')
             if sr[0] < 0 or sr[0] >= self.shape[1]:
                 raise ValueError('Index out of range')
-            return self.data[sl[0]][sr[0]]
+            return self.data[sl[0],sr[0]]
 
         # Array
-        new_ar = cvxpy_array(new_m,new_n)
-        for i in range(0,new_m,1):
-
-            if ll[i] < 0 or ll[i] >= self.shape[0]:
-                raise ValueError('Index out of range')
-
-            for j in range(0,new_n,1):
-
-                if lr[j] < 0 or lr[j] >= self.shape[1]:
-                    raise ValueError('Index out of range')
-
-                new_ar.data[i][j] = self.data[ll[i]][lr[j]]
-        return new_ar
+        if new_m and (min(ll) < 0 or max(ll) >= self.shape[0]):
+            raise ValueError('Index out of range')
+        if new_n and (min(lr) < 0 or max(lr) >= self.shape[1]):
+            raise ValueError('Index out of range')
+        return cvxpy_array._from_data(self.data[np.ix_(ll,lr)])
 
     # Method: __str__
     def __str__(self):
@@ -207,7 +244,7 @@ class cvxpy_array(object):
             else:
                 output += '['
             for j in range(0,self.shape[1],1):
-                output += ' ' + str(self.data[i][j]) + ' '
+                output += ' ' + str(self.data[i,j]) + ' '
             output += ']'
         output += '] '
         return output
@@ -241,42 +278,21 @@ class cvxpy_array(object):
         :param action: Keyword (See cvxpy.defs).
         """
 
-        # New array
+        # Dimensions
         (m,n) = self.shape
-        new_ar = cvxpy_array(m,n)
 
-        # Scalar
+        # Scalar or array or matrix, elementwise on object arrays
         if (np.isscalar(other) or
             type(other).__name__ in SCALAR_OBJS):
-            for i in range(0,m,1):
-                for j in range(0,n,1):
-                    if action == LEFT_ADD:
-                        new_ar.data[i][j] = self.data[i][j] + other
-                    elif action == LEFT_SUBTRACT:
-                        new_ar.data[i][j] = self.data[i][j] - other
-                    elif action == RIGHT_ADD:
-                        new_ar.data[i][j] = other + self.data[i][j]
-                    else:
-                        new_ar.data[i][j] = other - self.data[i][j]
-            return new_ar
-
-        # Array or matrix
+            od = _obj(other)
         elif (type(other).__name__ in MATRIX_OBJS or
               type(other).__name__ in ARRAY_OBJS):
             if other.shape != self.shape:
                 raise ValueError('Invalid Dimensions')
+            if type(other).__name__ in ARRAY_OBJS:
+                od = other.data
             else:
-                for i in range(0,m,1):
-                    for j in range(0,n,1):
-                        if action == LEFT_ADD:
-                            new_ar.data[i][j] = self.data[i][j] + other[i,j]
-                        elif action == LEFT_SUBTRACT:
-                            new_ar.data[i][j] = self.data[i][j] - other[i,j]
-                        elif action == RIGHT_ADD:
-                            new_ar.data[i][j] = other[i,j] + self.data[i][j]
-                        else:
-                            new_ar.data[i][j] = other[i,j] - self.data[i][j]
-                return new_ar
+                od = np.asarray(other).astype(object)
 
         # Sparray or spmatrix
         elif (type(other) is cvxpy_spmatrix or
@@ -284,9 +300,7 @@ class cvxpy_array(object):
             if other.shape != self.shape:
                 raise ValueError('Invalid Dimensions')
             else:
-                for i in range(0,m):
-                    for j in range(0,n):
-                        new_ar.data[i][j] = self.data[i][j]
+                new_ar = cvxpy_array._from_data(self.data.copy())
                 for i in range(0,m,1):
                     rowi_indeces = other.rows[i]
                     rowi_values = other.data[i]
@@ -294,19 +308,29 @@ class cvxpy_array(object):
                         j = rowi_indeces[k]
                         value = rowi_values[k]
                         if action == LEFT_ADD:
-                            new_ar.data[i][j] = new_ar.data[i][j] + value
+                            new_ar.data[i,j] = new_ar.data[i,j] + value
                         elif action == LEFT_SUBTRACT:
-                            new_ar.data[i][j] = new_ar.data[i][j] - value
+                            new_ar.data[i,j] = new_ar.data[i,j] - value
                         elif action == RIGHT_ADD:
-                            new_ar.data[i][j] = value + new_ar.data[i][j]
+                            new_ar.data[i,j] = value + new_ar.data[i,j]
                         else:
-                            new_ar.data[i][j] = value - new_ar.data[i][j]
+                            new_ar.data[i,j] = value - new_ar.data[i,j]
                 return new_ar
 
         # Not implemented
         else:
             return NotImplemented
 
+        if action == LEFT_ADD:
+            data = self.data + od
+        elif action == LEFT_SUBTRACT:
+            data = self.data - od
+        elif action == RIGHT_ADD:
+            data = od + self.data
+        else:
+            data = od - self.data
+        return cvxpy_array._from_data(np.asarray(data,dtype=object))
+
     # Method: __mul__
     def __mul__(self,other):
 
@@ -322,6 +346,9 @@ class cvxpy_array(object):
         """
         Handles multiplication.
 
+        Products by entries that are the number zero are skipped, since
+        they would anyway give zero terms that vanish in the summations.
+
         :param other: Other operand.
         :param action: Keyword (See cvxpy.defs).
         """
@@ -332,53 +359,52 @@ class cvxpy_array(object):
         # Scalar
         if (np.isscalar(other) or
             type(other).__name__ in SCALAR_OBJS):
-            new_ar = cvxpy_array(m,n)
-            for i in range(0,m):
-                for j in range(0,n):
-                    if action == LEFT_MULTIPLY:
-                        new_ar.data[i][j] = self.data[i][j] * other
-                    else:
-                        new_ar.data[i][j] = other * self.data[i][j]
-            return new_ar
+            if action == LEFT_MULTIPLY:
+                data = self.data * _obj(other)
+            else:
+                data = _obj(other) * self.data
+            return cvxpy_array._from_data(np.asarray(data,dtype=object))
 
         # Array or matrix
         elif (type(other).__name__ in MATRIX_OBJS or
               type(other).__name__ in ARRAY_OBJS):
+            if type(other).__name__ in ARRAY_OBJS:
+                od = other.data
+                nz = ~np.vectorize(_is_zero,otypes=[bool])(od)
+            else:
+                od = np.asarray(other).astype(object)
+                nz = np.asarray(other) != 0
             (p,q) = other.shape
             if action == LEFT_MULTIPLY:
                 if p != n:
                     raise ValueError('Invalid dimensions')
                 else:
-                    new_ar = cvxpy_array(m,q)
-                    for i in range(0,m):
-                        for j in range(0,q):
-                            temp = 0
-                            for k in range(0,n):
-                                temp += self.data[i][k]*other[k,j]
-                            new_ar.data[i][j] = temp
-
-                    # Convert to scalar if shape is (1,1)
-                    if new_ar.shape == (1,1):
-                        return new_ar.data[0][0]
-                    else:
-                        return new_ar
+                    data = np.full((m,q),0.0,dtype=object)
+                    for j in range(0,q):
+                        kk = np.flatnonzero(nz[:,j])
+                        if len(kk):
+                            temp = self.data[:,kk[0]]*_obj(od[kk[0],j])
+                            for k in kk[1:]:
+                                temp = temp + self.data[:,k]*_obj(od[k,j])
+                            data[:,j] = temp
             else:
                 if q != m:
                     raise ValueError('Invalid dimensions')
                 else:
-                    new_ar = cvxpy_array(p,n)
+                    data = np.full((p,n),0.0,dtype=object)
                     for i in range(0,p):
-                        for j in range(0,n):
-                            temp = 0
-                            for k in range(0,m):
-                                temp += other[i,k]*self.data[k][j]
-                            new_ar.data[i][j] = temp
-
-                    # Convert to scalar if shape = (1,1)
-                    if new_ar.shape == (1,1):
-                        return new_ar.data[0][0]
-                    else:
-                        return new_ar
+                        kk = np.flatnonzero(nz[i,:])
+                        if len(kk):
+                            temp = _obj(od[i,kk[0]])*self.data[kk[0],:]
+                            for k in kk[1:]:
+                                temp = temp + _obj(od[i,k])*self.data[k,:]
+                            data[i,:] = temp
+
+            # Convert to scalar if shape is (1,1)
+            if data.shape == (1,1):
+                return data[0,0]
+            else:
+                return cvxpy_array._from_data(data)
 
         # Sparray or spmatrix
         elif (type(other) is cvxpy_spmatrix or
@@ -388,58 +414,40 @@ class cvxpy_array(object):
                 if p != n:
                     raise ValueError('Invalid dimensions')
                 else:
-                    new_ar = cvxpy_array(m,q)
+                    data = np.full((m,q),0.0,dtype=object)
                     other._create_col_based_rep()
                     for j in range(0,q):
                         colj_indeces = other.cols[j]
                         colj_values = other.datac[j]
-                        for i in range(0,m):
-                            temp = 0.
-                            for r in range(0,len(colj_indeces)):
-                                k = colj_indeces[r]
-                                temp += self.data[i][k]*colj_values[r]
-                            new_ar.data[i][j] = temp
-
-                    # Convert to scalar if shape is (1,1)
-                    if new_ar.shape == (1,1):
-                        return new_ar.data[0][0]
-                    else:
-                        return new_ar
+                        for r in range(0,len(colj_indeces)):
+                            k = colj_indeces[r]
+                            data[:,j] = (data[:,j] +
+                                         self.data[:,k]*_obj(colj_values[r]))
             else:
                 if q != m:
                     raise ValueError('Invalid dimensions')
                 else:
-                    new_ar = cvxpy_array(p,n)
+                    data = np.full((p,n),0.0,dtype=object)
                     for i in range(0,p):
                         rowi_indeces = other.rows[i]
                         rowi_values = other.data[i]
-                        for j in range(0,n):
-                            temp = 0.
-                            for r in range(0,len(rowi_indeces)):
-                                k = rowi_indeces[r]
-                                temp += rowi_values[r]*self.data[k][j]
-                            new_ar.data[i][j] = temp
-
-                    # Convert to scalar if shape = (1,1)
-                    if new_ar.shape == (1,1):
-                        return new_ar.data[0][0]
-                    else:
-                        return new_ar
+                        for r in range(0,len(rowi_indeces)):
+                            k = rowi_indeces[r]
+                            data[i,:] = (data[i,:] +
+                                         _obj(rowi_values[r])*self.data[k,:])
+
+            # Convert to scalar if shape is (1,1)
+            if data.shape == (1,1):
+                return data[0,0]
+            else:
+                return cvxpy_array._from_data(data)
         else:
             return NotImplemented
 
     # Method: __neg__
     def __neg__(self):
 
-        # Allocate new array
-        (m,n) = self.shape
-        new_ar = cvxpy_array(m,n)
-
-        # Fill and return array
-        for i in range(0,m,1):
-            for j in range(0,n,1):
-                new_ar.data[i][j] = -self.data[i][j]
-        return new_ar
+        return cvxpy_array._from_data(np.asarray(-self.data,dtype=object))
 
     # Method: is_affine
     def is_affine(self):
@@ -448,11 +456,10 @@ class cvxpy_array(object):
         expressions only.
         """
 
-        for i in range(0,self.shape[0],1):
-            for j in range(0,self.shape[1],1):
-                if (not np.isscalar(self.data[i][j]) and
-                    not self.data[i][j].is_affine()):
-                    return False
+        for x in self.data.flat:
+            if (not np.isscalar(x) and
+                not x.is_affine()):
+                return False
         return True
 
 #***********************************************************************#
@@ -460,6 +467,8 @@ class cvxpy_array(object):
 #***********************************************************************#
 class cvxpy_var(cvxpy_array):
 
+    __slots__ = ()
+
     # Method: __init__
     def __init__(self,m,n,structure=None,name=None):
         """
@@ -484,7 +493,7 @@ class cvxpy_var(cvxpy_array):
             for i in range(0,m,1):
                 for j in range(0,n,1):
                     v = cvxpy_scalar_var(name+'['+str(i)+','+str(j)+']')
-                    self.data[i][j] = v
+                    self.data[i,j] = v
 
         # Lower triangular
         elif structure == LOWER_TRIANGULAR:
@@ -493,7 +502,7 @@ class cvxpy_var(cvxpy_array):
             for i in range(0,m,1):
                 for j in range(0,i+1,1):
                     v = cvxpy_scalar_var(name+'['+str(i)+','+str(j)+']')
-                    self.data[i][j] = v
+                    self.data[i,j] = v
 
         # Upper triangular
         elif structure == UPPER_TRIANGULAR:
@@ -502,7 +511,7 @@ class cvxpy_var(cvxpy_array):
             for i in range(0,m,1):
                 for j in range(i,n,1):
                     v = cvxpy_scalar_var(name+'['+str(i)+','+str(j)+']')
-                    self.data[i][j] = v
+                    self.data[i,j] = v
 
         # Symmetric
         elif structure == SYMMETRIC:
@@ -511,8 +520,8 @@ class cvxpy_var(cvxpy_array):
             for i in range(0,m,1):
                 for j in range(0,i+1,1):
                     v = cvxpy_scalar_var(name+'['+str(i)+','+str(j)+']')
-                    self.data[i][j] = v
-                    self.data[j][i] = v
+                    self.data[i,j] = v
+                    self.data[j,i] = v
 
         # Error
         else:
@@ -523,6 +532,8 @@ class cvxpy_var(cvxpy_array):
 #***********************************************************************#
 class cvxpy_param(cvxpy_array):
 
+    __slots__ = ()
+
     # Method: __init__
     def __init__(self,m,n,attribute=None,name=None):
         """
@@ -547,30 +558,26 @@ class cvxpy_param(cvxpy_array):
             for j in range(0,n,1):
                 v = cvxpy_scalar_param(attribute,
                                        name+'['+str(i)+','+str(j)+']')
-                self.data[i][j] = v
+                self.data[i,j] = v
 
-    # Method: __setattr__
-    def __setattr__(self,name,value):
+    # Method: _set_value
+    def _set_value(self,value):
 
-        # Value
-        if name == 'value':
-
-            # Check type
-            if type(value) is not cvxpy_matrix:
-                raise TypeError('Invalid value type')
+        # Check type
+        if type(value) is not cvxpy_matrix:
+            raise TypeError('Invalid value type')
 
-            # Check dimensions
-            if value.shape != self.shape:
-                raise ValueError('Invalid value dimensions')
+        # Check dimensions
+        if value.shape != self.shape:
+            raise ValueError('Invalid value dimensions')
 
-            # Store new values
-            for i in range(0,self.shape[0],1):
-                for j in range(0,self.shape[1],1):
-                    self.data[i][j].value = value[i,j]
+        # Store new values
+        for i in range(0,self.shape[0],1):
+            for j in range(0,self.shape[1],1):
+                self.data[i,j].value = value[i,j]
 
-        # Other
-        else:
-            object.__setattr__(self,name,value)
+    # Value
+    value = property(cvxpy_array.value.fget,_set_value)
 
 #***********************************************************************#
 # Class definition: cvxpy_matrix                                        #
@@ -593,18 +600,12 @@ class cvxpy_matrix(np.matrix):
         pass
 
 
-    # Method:__getattr__
-    def __getattribute__(self,name):
-
-        # Inverse
-        if name == 'I':
-            temp = np.array(self.copy())
-            temp = np.array(np.matrix(temp).I)
-            return cvxpy_matrix(temp,np.dtype(np.float64))
-
-        # Other attribute
-        else:
-            return np.matrix.__getattribute__(self,name)
+    # Inverse
+    @property
+    def I(self):
+        temp = np.array(self.copy())
+        temp = np.array(np.matrix(temp).I)
+        return cvxpy_matrix(temp,np.dtype(np.float64))
 
 
     # Method: __add__
@@ -698,16 +699,10 @@ class cvxpy_spmatrix(sp.lil_matrix):
                 self.cols[j].append(i)
                 self.datac[j].append(value)
 
-    # Method:__getattr__
-    def __getattribute__(self,name):
-
-        # Inverse
-        if name == 'T':
-            return cvxpy_spmatrix(self.transpose())
-
-        # Other attribute
-        else:
-            return sp.lil_matrix.__getattribute__(self,name)
+    # Transpose
+    @property
+    def T(self):
+        return cvxpy_spmatrix(self.transpose())
 
     # Method: __add__
     def __add__(self,other):
@@ -768,6 +763,8 @@ class cvxpy_spmatrix(sp.lil_matrix):
 #***********************************************************************#
 class cvxpy_sparray(object):
 
+    __slots__ = ('shape','type','rows','data','nnz','cols','datac')
+
     # Method: __init__
     def __init__(self,m,n):
         """
@@ -802,53 +799,50 @@ class cvxpy_sparray(object):
                 self.cols[j].append(i)
                 self.datac[j].append(value)
 
-    # Method:__getattribute__
-    def __getattribute__(self,name):
-
-        # Transpose
-        if name == 'T':
-            new_ar = cvxpy_sparray(self.shape[1],self.shape[0])
-            for i in range(0,self.shape[0],1):
-                rowi_indeces = self.rows[i]
-                rowi_values = self.data[i]
-                for k in range(0,len(rowi_indeces)):
-                    new_ar[rowi_indeces[k],i] = rowi_values[k]
-            return new_ar
-
-        # Variables
-        elif name == 'variables':
-            l = []
-            for i in range(0,self.shape[0],1):
-                for obj in self.data[i]:
-                    if not np.isscalar(obj):
-                        l += obj.variables
-            return cvxpy_list(set(l))
-
-        # Parameters
-        elif name == 'parameters':
-            l = []
-            for i in range(0,self.shape[0],1):
-                for obj in self.data[i]:
-                    if not np.isscalar(obj):
-                        l += obj.parameters
-            return cvxpy_list(set(l))
-
-        # Value
-        elif name == 'value':
-            mat = cvxpy_spmatrix((self.shape[0],self.shape[1]),np.float64)
-            for i in range(0,self.shape[0],1):
-                rowi_indeces = self.rows[i]
-                rowi_values = self.data[i]
-                for k in range(0,len(rowi_indeces)):
-                    if np.isscalar(rowi_values[k]):
-                        mat[i,rowi_indeces[k]] = rowi_values[k]
-                    else:
-                        mat[i,rowi_indeces[k]] = rowi_values[k].value
-            return mat
+    # Transpose
+    @property
+    def T(self):
+        new_ar = cvxpy_sparray(self.shape[1],self.shape[0])
+        for i in range(0,self.shape[0],1):
+            rowi_indeces = self.rows[i]
+            rowi_values = self.data[i]
+            for k in range(0,len(rowi_indeces)):
+                new_ar[rowi_indeces[k],i] = rowi_values[k]
+        return new_ar
 
-        # Other attribute
-        else:
-            return object.__getattribute__(self,name)
+    # Variables
+    @property
+    def variables(self):
+        l = set()
+        for i in range(0,self.shape[0],1):
+            for obj in self.data[i]:
+                if not np.isscalar(obj):
+                    l.update(obj.variables)
+        return cvxpy_list(l)
+
+    # Parameters
+    @property
+    def parameters(self):
+        l = set()
+        for i in range(0,self.shape[0],1):
+            for obj in self.data[i]:
+                if not np.isscalar(obj):
+                    l.update(obj.parameters)
+        return cvxpy_list(l)
+
+    # Value
+    @property
+    def value(self):
+        mat = cvxpy_spmatrix((self.shape[0],self.shape[1]),np.float64)
+        for i in range(0,self.shape[0],1):
+            rowi_indeces = self.rows[i]
+            rowi_values = self.data[i]
+            for k in range(0,len(rowi_indeces)):
+                if np.isscalar(rowi_values[k]):
+                    mat[i,rowi_indeces[k]] = rowi_values[k]
+                else:
+                    mat[i,rowi_indeces[k]] = rowi_values[k].value
+        return mat
 
     # Method: __setitem__
     def __setitem__(self,key,value):
@@ -21,19 +21,20 @@ import numpy as np
 import cvxopt as opt
 from .expand import expand
 from ..defs import *
-import scipy.sparse as sp
 from cvxopt import solvers
 from ..scalars import cvxpy_obj
 from ..constraints import cvxpy_list
 
-# Function: call_solver
-def call_solver(p,quiet):
+# Function: construct_std_form
+def construct_std_form(p):
     """
-    Calls solver.
+    Constructs the standard form of a program.
 
     :param p: Convex cvxpy_program.
               Assumed to be expanded.
-    :param quiet: Boolean.
+    :return: Dictionary with the sorted variables, the
+             variable-index map and the c,G,h,dims,A,b,F
+             data for the solver.
     """
 
     # Set printing format for cvxopt sparse matrices
@@ -67,13 +68,42 @@ def call_solver(p,quiet):
     # Construct F
     F = construct_F(constr_list._get_ineq_in(),var_to_index,n)
 
+    # Return standard form
+    return {'variables':variables,'var_to_index':var_to_index,
+            'c':c,'G':G,'h':h,'dims':{'l':dim_l,'q':dim_q,'s':dim_s},
+            'A':A,'b':b,'F':F}
+
+# Function: call_solver
+def call_solver(p,quiet,std_form=None):
+    """
+    Calls solver.
+
+    :param p: Convex cvxpy_program.
+              Assumed to be expanded if std_form is None.
+    :param quiet: Boolean.
+    :param std_form: Standard form of p, as returned by
+                     construct_std_form. Computed if None.
+    """
+
+    # Construct standard form
+    if std_form is None:
+        std_form = construct_std_form(p)
+    variables = std_form['variables']
+    var_to_index = std_form['var_to_index']
+    c = std_form['c']
+    G = std_form['G']
+    h = std_form['h']
+    dims = std_form['dims']
+    A = std_form['A']
+    b = std_form['b']
+    F = std_form['F']
+
     # Call cvxopt
     solvers.options['maxiters'] = p.options['maxiters']
     solvers.options['abstol'] = p.options['abstol']
     solvers.options['reltol'] = p.options['reltol']
     solvers.options['feastol'] = p.options['feastol']
     solvers.options['show_progress'] = not quiet
-    dims = {'l':dim_l, 'q':dim_q, 's':dim_s}
     if F is None:
         r =  solvers.conelp(c,G,h,dims,A,b)
     else:
@@ -154,8 +184,13 @@ def construct_Ab(constr_list,mapping,n):
 
     constr_list.sort(key=cmp_keys)
 
-    # Construct matrices
-    Ab = None
+    # Construct matrices by triplets. Each row is accumulated in a
+    # dictionary, in the same order in which the coefficients appear
+    Ai = []
+    Aj = []
+    Av = []
+    b = []
+    accepted = {}
     for constr in constr_list:
 
         # Get elements
@@ -163,23 +198,25 @@ def construct_Ab(constr_list,mapping,n):
         right = constr.right
 
         # New row
-        t = sp.lil_matrix((1,n+1))
+        t = {}
+        def add(j,v):
+            t[j] = t.get(j,0.)+v
 
         # Deal with right element
         if right.type == CONSTANT:
-            t[0,n] += right.value*1.
+            add(n,right.value*1.)
         elif right.type == VARIABLE:
-            t[0,mapping[right]] += -1.
+            add(mapping[right],-1.)
         else:
             raise TypeError('Bad equality: Cannot construct A,b')
 
         # Left is a variable
         if left.type == VARIABLE:
-            t[0,mapping[left]] += 1.
+            add(mapping[left],1.)
 
         # Left is a constant
         elif left.type == CONSTANT:
-             t[0,n] += -left.value*1.
+            add(n,-left.value*1.)
 
         # Left is an operation tree
         elif left.type == TREE and left.item.type == OPERATOR:
@@ -192,11 +229,11 @@ def construct_Ab(constr_list,mapping,n):
                         arg.item.name == MULTIPLICATION):
                         ch1 = arg.children[1]
                         ch0 = arg.children[0]
-                        t[0,mapping[ch1]] += ch0.value*1.
+                        add(mapping[ch1],ch0.value*1.)
                     elif arg.type == VARIABLE:
-                        t[0,mapping[arg]] += 1.
+                        add(mapping[arg],1.)
                     elif arg.type == CONSTANT:
-                        t[0,n] += -arg.value*1.
+                        add(n,-arg.value*1.)
                     else:
                         raise TypeError('Bad equality: Cannot construct A,b')
 
@@ -204,7 +241,7 @@ def construct_Ab(constr_list,mapping,n):
             elif left.item.name == MULTIPLICATION:
                 op1 = left.children[0]
                 op2 = left.children[1]
-                t[0,mapping[op2]] += 1.*op1.value
+                add(mapping[op2],1.*op1.value)
 
             # Error
             else:
@@ -215,46 +252,43 @@ def construct_Ab(constr_list,mapping,n):
             raise TypeError('Bad equality: Cannot construct A,b')
 
         # Compute norm
-        t = t.tocsr()
-        t_norm = np.sqrt((t*t.T)[0,0])
+        cols = tuple(sorted([j for j in t if t[j] != 0]))
+        vals = np.asarray([t[j] for j in cols],dtype=np.float64)
+        t_norm = np.sqrt(np.dot(vals,vals))
 
         # Process
         if t_norm < EPSILON:
             continue
-        if Ab is None:
-            Ab = t
-        else:
-            t_c = t.nonzero()[1]
-            Ab_c = Ab.nonzero()[1]
-            c_overlap = True
-            for x in t_c:
-                if x not in Ab_c:
-                    c_overlap = False
-                    break
-            valid_row = True
-            if c_overlap:
-                tn = t/t_norm
-                for i in range(Ab.shape[0]-1,-1,-1):
-                    s = Ab[i,:]
-                    s_c = s.nonzero()[1]
-                    if len(s_c) < len(t_c):
-                        break
-                    if set(s_c) == set(t_c):
-                        e = s-(tn*s.T)*tn
-                        if np.sqrt((e*e.T)[0,0]) < EPSILON:
-                            valid_row = False
-                            break
-            if valid_row:
-                Ab = sp.vstack((Ab,t)).tocsr()
+
+        # Drop rows parallel to an accepted one. Only rows with the same
+        # nonzero pattern can be parallel, hence the pattern is the key
+        # of a hash table of the accepted rows
+        valid_row = True
+        tn = vals/t_norm
+        for r in accepted.get(cols,[]):
+            e = r-np.dot(tn,r)*tn
+            if np.sqrt(np.dot(e,e)) < EPSILON:
+                valid_row = False
+                break
+        if not valid_row:
+            continue
+        accepted.setdefault(cols,[]).append(vals)
+
+        # Store row
+        k = len(b)
+        bk = 0.
+        for j,v in zip(cols,vals):
+            if j == n:
+                bk = v
+            else:
+                Ai.append(k)
+                Aj.append(j)
+                Av.append(v)
+        b.append(bk)
 
     # Return matrices
-    if Ab is None:
-        Ab = opt.spmatrix(0.0,[],[],(0,n+1))
-    else:
-        nz = Ab.nonzero()
-        Ab = opt.spmatrix(Ab.data.tolist(),nz[0].tolist(),
-                          nz[1].tolist(),Ab.shape)
-    return Ab[:,0:n],opt.matrix(Ab[:,n])
+    A = opt.spmatrix(Av,Ai,Aj,(len(b),n))
+    return A,opt.matrix(b,(len(b),1),'d')
 
 # Function: construct_Gh
 def construct_Gh(constr_list,mapping,n):
@@ -277,14 +311,18 @@ def construct_Gh(constr_list,mapping,n):
                 (c.right.type != VARIABLE and c.right.type != CONSTANT)):
                 raise TypeError('Bad constraint: Cannot construct G,h')
 
-    # Initialize G,h and dimensions
+    # Initialize G,h blocks and dimensions
     dim_l = 0
     dim_q = []
     dim_s = []
-    G = opt.spmatrix(0.0,[],[],(0,n))
-    h = opt.matrix(0.0,(0,1))
-
-    # Nonnegative Orthant
+    Gs = []
+    hs = []
+
+    # Nonnegative Orthant, by triplets
+    Gi = []
+    Gj = []
+    Gv = []
+    hl = []
     for c in constr_list:
 
         # Left is constant or variable
@@ -296,23 +334,26 @@ def construct_Gh(constr_list,mapping,n):
             ob2 = c.right
 
             # New row
-            rowG = opt.spmatrix(0.0,[],[],(1,n))
-            rowh = opt.matrix(0.0,(1,1))
+            rowh = 0.
             if ob1.type == VARIABLE:
-                rowG[0,mapping[ob1]]+=1. if t==LESS_EQUALS else -1.
+                Gi.append(dim_l)
+                Gj.append(mapping[ob1])
+                Gv.append(1. if t==LESS_EQUALS else -1.)
             else:
-                rowh[0,0]+=-ob1.value*1. if t==LESS_EQUALS else ob1.value*1.
+                rowh += -ob1.value*1. if t==LESS_EQUALS else ob1.value*1.
             if ob2.type == VARIABLE:
-                rowG[0,mapping[ob2]]+=1. if t==GREATER_EQUALS else -1.
+                Gi.append(dim_l)
+                Gj.append(mapping[ob2])
+                Gv.append(1. if t==GREATER_EQUALS else -1.)
             else:
-                rowh[0,0]+=-ob2.value*1. if t==GREATER_EQUALS else ob2.value*1.
-
-            # Append to G,h
-            G = opt.sparse([G,rowG])
-            h = opt.matrix([h,rowh])
+                rowh += -ob2.value*1. if t==GREATER_EQUALS else ob2.value*1.
+            hl.append(float(rowh))
 
             # Increment size of cone
             dim_l += 1
+    if dim_l:
+        Gs.append(opt.spmatrix(Gv,Gi,Gj,(dim_l,n)))
+        hs.append(opt.matrix(hl,(dim_l,1),'d'))
 
     # Second order cone
     for c in constr_list:
@@ -327,8 +368,8 @@ def construct_Gh(constr_list,mapping,n):
             newG,newh,r = set_atom._construct(el,mapping,n)
 
             # Attach to G,h
-            G = opt.sparse([G,newG])
-            h = opt.matrix([h,newh])
+            Gs.append(newG)
+            hs.append(newh)
 
             # Attach size of cone
             dim_q = dim_q + [r]
@@ -346,12 +387,20 @@ def construct_Gh(constr_list,mapping,n):
             newG,newh,t = set_atom._construct(el,mapping,n)
 
             # Attach to G,h
-            G = opt.sparse([G,newG])
-            h = opt.matrix([h,newh])
+            Gs.append(newG)
+            hs.append(newh)
 
             # Attach size of cone
             dim_s = dim_s + [t]
 
+    # Stack blocks at once
+    if Gs:
+        G = opt.sparse(Gs)
+        h = opt.matrix(hs)
+    else:
+        G = opt.spmatrix(0.0,[],[],(0,n))
+        h = opt.matrix(0.0,(0,1))
+
     # Return
     return G,h,dim_l,dim_q,dim_s
 
@@ -22,15 +22,21 @@ from ..defs import *
 from .call_solver import call_solver
 
 # Function
-def solve_prog(p,quiet):
+def solve_prog(p,quiet,std_form=None):
     """
     Solves optimization program.
 
     :param p: cvxpy_program
+    :param std_form: Standard form of the expanded
+                     program (see call_solver). If
+                     given, p is not expanded again.
     """
 
     # Expand
-    p_expanded = p._get_expanded_program()
+    if std_form is None:
+        p_expanded = p._get_expanded_program()
+    else:
+        p_expanded = p
 
     # Compute signs
     if p.action == MINIMIZE:
@@ -41,7 +47,7 @@ def solve_prog(p,quiet):
     # Solve convex relaxation
     if not quiet:
         print('\nCalling CVXOPT ...')
-    sol = call_solver(p_expanded,quiet)
+    sol = call_solver(p_expanded,quiet,std_form)
 
     valid = True
 
@@ -25,6 +25,7 @@ from .constraints import *
 from .procedures.expand import expand
 from .procedures.re_eval import re_eval
 from .procedures.solve_prog import solve_prog
+from .procedures.call_solver import construct_std_form
 
 #***********************************************************************#
 # Class definition: cvxpy_program                                       #
@@ -72,6 +73,9 @@ class cvxpy_program(object):
         else:
             self.options = CONFIGURATION.copy()
 
+        # Cached standard form
+        self._std_form = None
+
     # Method: _get_expanded_objects
     def _get_expanded_objects(self,args):
         """
@@ -140,6 +144,24 @@ class cvxpy_program(object):
         else:
             return object.__getattribute__(self,name)
 
+    # Method: _std_form_matches
+    def _std_form_matches(self,key):
+        """
+        Tells whether the cached standard form has the given key.
+        Objects are compared by identity, since their comparison
+        operators build constraints.
+
+        :param key: Tuple (action,objective,constraints,param-value map).
+        """
+
+        if self._std_form is None:
+            return False
+        old = self._std_form[0]
+        return (old[0] == key[0] and old[1] is key[1] and
+                len(old[2]) == len(key[2]) and
+                all([a is b for a,b in zip(old[2],key[2])]) and
+                old[3] == key[3])
+
     # Method: solve
     def solve(self,quiet=False,return_status=False):
         """
@@ -147,26 +169,40 @@ class cvxpy_program(object):
         parameter values.
         """
 
-        # Check DCP
-        if not self.is_dcp():
-            raise ValueError('Program is not DCP')
-
-        # Create param-value map
-        replace_map = {}
-        for param in self.parameters:
+        # Key of the standard form: the action, the objective and
+        # constraint objects and the parameter values. The objects are
+        # kept in the key, so that they cannot be freed and their ids
+        # reused while the standard form is cached. The cache only helps
+        # solving the same program object again.
+        params = self.parameters
+        for param in params:
             if np.isnan(param.value):
                 raise ValueError('Invalid parameter value: NaN')
-            else:
-                replace_map[param] = param.value
+        key = (self.action,self.objective,tuple(self.constraints),
+               dict([(param,param.value) for param in params]))
 
-        # Create new program
-        new_p = cvxpy_program(self.action,
-                              re_eval(self.objective,replace_map),
-                              re_eval(self.constraints,replace_map),
-                              [],self.options,'')
+        # Expand and construct standard form only if the key changed
+        if not self._std_form_matches(key):
+
+            # Check DCP
+            if not self.is_dcp():
+                raise ValueError('Program is not DCP')
+
+            # Create param-value map
+            replace_map = key[3]
+
+            # Create new program
+            new_p = cvxpy_program(self.action,
+                                  re_eval(self.objective,replace_map),
+                                  re_eval(self.constraints,replace_map),
+                                  [],self.options,'')
+
+            # Construct standard form
+            std_form = construct_std_form(new_p._get_expanded_program())
+            self._std_form = (key,std_form)
 
-        # Solve new program
-        obj,valid = solve_prog(new_p,quiet)
+        # Solve standard form
+        obj,valid = solve_prog(self,quiet,self._std_form[1])
         if return_status:
             return obj,valid
         else:
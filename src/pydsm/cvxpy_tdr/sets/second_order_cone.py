@@ -53,8 +53,9 @@ class cvxpy_second_order_cone(object):
     def _construct(self,el,mp,n):
 
         m = el.shape[0]-1
-        G = opt.spmatrix(0.0,[],[],(m+1,n))
         h = opt.matrix(0.0,(m+1,1))
+        Gi = []
+        Gj = []
 
         # y
         y = el[m,0]
@@ -63,7 +64,8 @@ class cvxpy_second_order_cone(object):
         elif type(y) is cvxpy_obj:
             h[0,0] = y.value*1.
         else:
-            G[0,mp[y]]=-1.
+            Gi.append(0)
+            Gj.append(mp[y])
 
         # x
         for i in range(0,m,1):
@@ -73,9 +75,11 @@ class cvxpy_second_order_cone(object):
             elif type(x) is cvxpy_obj:
                 h[i+1,0] = x.value*1.
             else:
-                G[i+1,mp[x]] = -1.
+                Gi.append(i+1)
+                Gj.append(mp[x])
 
         # Return G,h
+        G = opt.spmatrix([-1.]*len(Gi),Gi,Gj,(m+1,n))
         return G,h,m+1
 
 # Create instance
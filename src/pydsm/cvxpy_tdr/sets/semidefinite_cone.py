@@ -53,16 +53,20 @@ class cvxpy_semidefinite_cone(object):
     def _construct(self,el,mp,n):
 
         m = int(el.shape[0])
-        G = opt.spmatrix(0.0,[],[],(m*m,n))
         h = opt.matrix(0.0,(m*m,1))
+        Gi = []
+        Gj = []
         for j in range(0,m,1):
             for i in range(0,m,1):
-                if np.isscalar(el[i,j]):
-                    h[j*m+i,0] = el[i,j]*1.
-                elif type(el[i,j]) is cvxpy_obj:
-                    h[j*m+i,0] = el[i,j].value*1.
+                x = el[i,j]
+                if np.isscalar(x):
+                    h[j*m+i,0] = x*1.
+                elif type(x) is cvxpy_obj:
+                    h[j*m+i,0] = x.value*1.
                 else:
-                    G[j*m+i,mp[el[i,j]]] = -1.
+                    Gi.append(j*m+i)
+                    Gj.append(mp[x])
+        G = opt.spmatrix([-1.]*len(Gi),Gi,Gj,(m*m,n))
         return G,h,m
 
 # Create instance
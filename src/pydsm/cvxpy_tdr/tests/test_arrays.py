@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2012-2024, Sergio Callegari
+# All rights reserved.
+
+# This file is part of PyDSM.
+
+# PyDSM is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# PyDSM is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+
+from __future__ import division, print_function
+
+import numpy as np
+import pytest
+from pydsm.cvxpy_tdr import variable, parameter, matrix
+from pydsm.cvxpy_tdr import arrays
+from pydsm.cvxpy_tdr.arrays import cvxpy_array, cvxpy_matrix
+
+__all__ = ["TestArray"]
+
+
+class TestArray:
+
+    def setup_method(self):
+        self.x = variable(2, 2)
+        for (i, j), v in np.ndenumerate([[1., 2.], [3., 4.]]):
+            self.x[i, j].value = v
+
+    def test_transpose(self):
+        t = self.x.T
+        assert t.shape == (2, 2)
+        assert t[0, 1] is self.x[1, 0]
+        np.testing.assert_array_equal(t.value, [[1., 3.], [2., 4.]])
+        # The transpose does not share the entries storage
+        t[0, 1] = 5.
+        assert self.x[1, 0] is not t[0, 1]
+
+    def test_value(self):
+        a = cvxpy_array(2, 3)
+        a[0, 0] = self.x[1, 1]
+        a[1, 2] = 7.
+        v = a.value
+        assert type(v) is cvxpy_matrix
+        assert v.dtype == np.float64
+        np.testing.assert_array_equal(v, [[4., 0., 0.], [0., 0., 7.]])
+
+    def test_add_sub(self):
+        m = matrix([[1., 0.], [2., 0.]])
+        np.testing.assert_array_equal((self.x+1).value,
+                                      [[2., 3.], [4., 5.]])
+        np.testing.assert_array_equal((1-self.x).value,
+                                      [[0., -1.], [-2., -3.]])
+        np.testing.assert_array_equal((self.x-m).value,
+                                      [[0., 2.], [1., 4.]])
+        np.testing.assert_array_equal((m+self.x).value,
+                                      [[2., 2.], [5., 4.]])
+        np.testing.assert_array_equal((self.x+self.x.T).value,
+                                      [[2., 5.], [5., 8.]])
+        np.testing.assert_array_equal((-self.x).value,
+                                      [[-1., -2.], [-3., -4.]])
+        with pytest.raises(ValueError):
+            self.x+matrix([[1., 2.]])
+
+    def test_mul(self):
+        m = matrix([[1., 2.], [3., 4.]])
+        np.testing.assert_array_equal((self.x*m).value, [[7., 10.],
+                                                         [15., 22.]])
+        np.testing.assert_array_equal((m*self.x).value, [[7., 10.],
+                                                         [15., 22.]])
+        np.testing.assert_array_equal((2*self.x).value, [[2., 4.],
+                                                         [6., 8.]])
+        # A 1x1 product is a scalar
+        r = self.x[0:1, :]*matrix([[1.], [1.]])
+        assert not isinstance(r, cvxpy_array)
+        assert r.value == 3.
+        with pytest.raises(ValueError):
+            self.x*matrix([[1., 2.]])
+
+    # The zeros are skipped in the operand that is not the array handling
+    # the product, so a zero array times the variables is not covered
+    @pytest.mark.parametrize("as_array, right", [(False, False),
+                                                 (False, True),
+                                                 (True, False)])
+    def test_mul_skips_zeros(self, monkeypatch, right, as_array):
+        # Count the product terms, each wrapping its coefficient
+        count = [0]
+        obj = arrays._obj
+
+        def counted(x):
+            count[0] += 1
+            return obj(x)
+
+        monkeypatch.setattr(arrays, '_obj', counted)
+        m = matrix([[0., 2.], [0., 0.]])
+        if as_array:
+            other = cvxpy_array(2, 2)
+            other[0, 1] = parameter()
+            other[0, 1].value = 2.
+        else:
+            other = m
+        r = other*self.x if right else self.x*other
+        assert count[0] == 1
+        if right:
+            np.testing.assert_array_equal(r.value, [[6., 8.], [0., 0.]])
+            assert r[1, 0] == 0 and r[1, 1] == 0
+        else:
+            np.testing.assert_array_equal(r.value, [[0., 2.], [0., 6.]])
+            assert r[0, 0] == 0 and r[1, 0] == 0
+
+    def test_cache_invalidation(self):
+        a = cvxpy_array(2, 1)
+        a[0, 0] = self.x[0, 0]
+        assert set(a.variables) == {self.x[0, 0]}
+        assert len(a.parameters) == 0
+        a[1, 0] = self.x[1, 1]
+        assert set(a.variables) == {self.x[0, 0], self.x[1, 1]}
+        p = parameter()
+        a[0, 0] = 2*p
+        assert set(a.variables) == {self.x[1, 1]}
+        assert set(a.parameters) == {p}
+        a[1, 0] = 1.
+        assert len(a.variables) == 0
+        assert set(a.parameters) == {p}
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2012-2024, Sergio Callegari
+# All rights reserved.
+
+# This file is part of PyDSM.
+
+# PyDSM is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# PyDSM is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with PyDSM.  If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import division, print_function
+
+import pytest
+from pydsm.cvxpy_tdr import (variable, parameter, program, minimize,
+                             greater_equals, less_equals)
+from pydsm.cvxpy_tdr import programs
+from pydsm.cvxpy_tdr.constraints import cvxpy_list
+from pydsm.cvxpy_tdr.defs import MAXIMIZE
+
+__all__ = ["TestProgramCache"]
+
+
+class TestProgramCache:
+
+    def setup_method(self):
+        self.x = variable()
+        self.a = parameter()
+        self.a.value = 1.
+        self.p = program(minimize(self.x),
+                         [greater_equals(self.x, self.a),
+                          less_equals(self.x, 2)])
+
+    @pytest.fixture
+    def builds(self, monkeypatch):
+        # Count the constructions of the standard form
+        count = [0]
+        construct = programs.construct_std_form
+
+        def counted(p):
+            count[0] += 1
+            return construct(p)
+
+        monkeypatch.setattr(programs, 'construct_std_form', counted)
+        return count
+
+    def test_cache_hit(self, builds):
+        assert self.p.solve(quiet=True) == pytest.approx(1., abs=1E-5)
+        assert self.p.solve(quiet=True) == pytest.approx(1., abs=1E-5)
+        assert builds[0] == 1
+
+    def test_parameter_change(self, builds):
+        self.p.solve(quiet=True)
+        self.a.value = 0.5
+        assert self.p.solve(quiet=True) == pytest.approx(0.5, abs=1E-5)
+        assert builds[0] == 2
+        self.a.value = 1.
+        assert self.p.solve(quiet=True) == pytest.approx(1., abs=1E-5)
+        assert builds[0] == 3
+
+    def test_action_change(self, builds):
+        self.p.solve(quiet=True)
+        self.p.action = MAXIMIZE
+        assert self.p.solve(quiet=True) == pytest.approx(2., abs=1E-5)
+        assert builds[0] == 2
+
+    def test_objective_change(self, builds):
+        self.p.solve(quiet=True)
+        self.p.objective = -self.x
+        assert self.p.solve(quiet=True) == pytest.approx(-2., abs=1E-5)
+        assert builds[0] == 2
+
+    def test_constraints_change(self, builds):
+        self.p.solve(quiet=True)
+        self.p.constraints = cvxpy_list([greater_equals(self.x, 1.5),
+                                         less_equals(self.x, 2)])
+        assert self.p.solve(quiet=True) == pytest.approx(1.5, abs=1E-5)
+        assert builds[0] == 2
+        # Same number of constraints, new objects
+        self.p.constraints = cvxpy_list([greater_equals(self.x, 1.25),
+                                         less_equals(self.x, 2)])
+        assert self.p.solve(quiet=True) == pytest.approx(1.25, abs=1E-5)
+        assert builds[0] == 3
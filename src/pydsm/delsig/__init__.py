@@ -64,6 +64,7 @@ Key functions
    :toctree: generated/
 
    synthesizeNTF
+   synthesizeNTFBatch
    clans
    synthesizeChebyshevNTF
    simulateDSM
@@ -120,27 +121,33 @@ Plumbing
    padb
    evalTF
    evalRPoly
+   evalTFBatch
+   ucGrid
 
 """
 
 __delsig_version__ = "7.4"
 
-# The delsig module reflects the flat organization of the original DELSIG
-from ._axisLabels import *
-from ._decibel import *
-from ._ds import *
-from ._padding import *
-from ._tf import *
-from ._plot import *
-from ._synthesizeNTF import *
-from ._synthesizeChebyshevNTF import *
-from ._clans import *
-from ._dsclansNTF import *
-from ._simulateDSM import *
-from ._simulateDSM_scipy import *
-from ._partitionABCD import *
-from ._rmsGain import *
-from ._rms import *
+# The delsig module reflects the flat organization of the original DELSIG.
+# The functions are imported from their submodules on first access.
+from .._lazy import lazy_attributes
+__getattr__, __dir__, __all__ = lazy_attributes(__name__, attributes={
+    '._axisLabels': ['axisLabels'],
+    '._decibel': ['dbv', 'dbp', 'dbm', 'undbv', 'undbp', 'undbm'],
+    '._ds': ['ds_synNTFobj1', 'ds_f1f2', 'ds_optzeros'],
+    '._padding': ['padl', 'padr', 'padt', 'padb'],
+    '._tf': ['evalTF', 'evalRPoly', 'evalTFBatch', 'ucGrid'],
+    '._plot': ['plotPZ'],
+    '._synthesizeNTF': ['synthesizeNTF', 'synthesizeNTFBatch'],
+    '._synthesizeChebyshevNTF': ['synthesizeChebyshevNTF'],
+    '._clans': ['clans'],
+    '._dsclansNTF': ['dsclansNTF'],
+    '._simulateDSM': ['simulateDSM'],
+    '._simulateDSM_scipy': ['ds_quantize'],
+    '._partitionABCD': ['partitionABCD'],
+    '._rmsGain': ['rmsGain'],
+    '._rms': ['rms']})
+del lazy_attributes
 
 from .._pytesttester import PytestTester
 test = PytestTester(__name__)
@@ -63,8 +63,8 @@ from ._synthesizeNTF import synthesizeNTF
 from ..relab import cplxpair
 from ._tf import evalTF
 from ..ir import impulse_response
-from ._dsclansNTF import dsclansNTF
-from ..utilities import digested_options
+from ._dsclansNTF import dsclansNTF, _dsclansNTF_jac
+from ..utilities import digested_options, _parallel_map
 
 __all__ = ["clans"]
 
@@ -99,6 +99,30 @@ def clans(order=4, osr=64, nq=5, rmax=0.95, opt=0, **options):
     show_progress : bool, optional
         provide extended output, default is False and can be updated by
         changing the function ``default_options`` attribute.
+    jac : bool, optional
+        whether to provide the optimizer with the analytic gradients of the
+        objective and constraint functions (default) or to let it use finite
+        differences.
+    multistart : int, optional
+        number of optimizations to run from different initial pole
+        placements. The first one starts from the poles computed by
+        ``synthesizeNTF``, the other ones from random perturbations of
+        them. The best feasible result is kept. Defaults to 1.
+    spread : real, optional
+        standard deviation of the log-normal perturbation applied to the
+        optimization parameters to obtain the further initial guesses in
+        multistart mode. Defaults to 0.2.
+    seed : int or None, optional
+        seed for the generation of the initial guesses in multistart mode.
+        Defaults to 0, so that the results are deterministic.
+    workers : int or None, optional
+        number of threads used to run the optimizations in multistart mode.
+        Defaults to 1. If None, as many threads as processors are used.
+        Since the optimizations are mostly interpreter bound, the threads
+        provide concurrency rather than a speedup.
+    feastol : real, optional
+        tolerance on the constraint violation for considering a result
+        feasible in multistart mode. Defaults to 1e-6.
     slsqp_opts : dictionary, optional
         Parameters passed to the ``fmin_slsqp`` optimizer. Allowed options are:
 
@@ -148,7 +172,8 @@ def clans(order=4, osr=64, nq=5, rmax=0.95, opt=0, **options):
     """
     # Manage optional parameters
     opts = digested_options(options, clans.default_options,
-                            ['show_progress'], ['slsqp_opts'])
+                            ['show_progress', 'jac', 'multistart', 'spread',
+                             'seed', 'workers', 'feastol'], ['slsqp_opts'])
     slsqp_opts = opts['slsqp_opts']
     slsqp_opts['disp'] = opts.get('show_progress', False)
     # Create the initial guess
@@ -198,16 +223,42 @@ def clans(order=4, osr=64, nq=5, rmax=0.95, opt=0, **options):
         x[i] = np.sqrt(zeta)
         x[i+1] = np.sqrt(wn)
 
+    # Initial guesses for the multistart mode, perturbing the parameters
+    # multiplicatively so that they remain positive
+    rng = np.random.default_rng(opts['seed'])
+    starts = [x]+[x*np.exp(opts['spread']*rng.standard_normal(order))
+                  for i in range(opts['multistart']-1)]
+    args = (order, osr, nq, rmax, Hz)
+    if opts['jac']:
+        jacs = {'jac': _dsclansObj6a_jac}
+        cjacs = {'jac': _dsclansObj6b_jac}
+    else:
+        jacs = {}
+        cjacs = {}
+
+    def run(x0):
+        return minimize(_dsclansObj6a, x0, args=args, method='SLSQP',
+                        constraints=dict(type='ineq', fun=_dsclansObj6b,
+                                         args=args, **cjacs),
+                        options=slsqp_opts, **jacs)
+
     # Run the optimizer
-    x = minimize(_dsclansObj6a, x, args=(order, osr, nq, rmax, Hz),
-                 method='SLSQP',
-                 constraints={'type': 'ineq',
-                              'fun': _dsclansObj6b,
-                              'args': (order, osr, nq, rmax, Hz)},
-                 options=slsqp_opts)['x']
-    return dsclansNTF(x, order, rmax, Hz)
+    results = _parallel_map(run, [(x0,) for x0 in starts], opts['workers'])
+    # Keep the best feasible result, or the least infeasible one
+    violations = [max(-_dsclansObj6b(r.x, *args), 0.) for r in results]
+    best = min(range(len(results)),
+               key=lambda i: (violations[i] > opts['feastol'],
+                              violations[i] if violations[i] >
+                              opts['feastol'] else results[i].fun))
+    return dsclansNTF(results[best].x, order, rmax, Hz)
 
 clans.default_options = {'show_progress': False,
+                         'jac': True,
+                         'multistart': 1,
+                         'spread': 0.2,
+                         'seed': 0,
+                         'workers': 1,
+                         'feastol': 1e-6,
                          'slsqp_opts': {'maxiter': 100,
                                         'ftol': 1e-06,
                                         'eps': 1.4901161193847656e-08}}
@@ -229,3 +280,27 @@ def _dsclansObj6b(x, order, osr, nq, rmax, Hz):
     g = np.sum(np.abs(impulse_response(H, m=100)))-1-nq
     # With our optimizer, this needs to be inverted
     return -g
+
+
+def _dsclansObj6a_jac(x, order, osr, nq, rmax, Hz):
+    # Gradient of the objective function for clans
+    # d|H(z0)|/dp = |H(z0)| Re(1/(z0-p)) dp
+    H, J = _dsclansNTF_jac(x, order, rmax, Hz)
+    z0 = np.exp(1j*np.pi/osr)
+    f = np.abs(evalTF(H, z0))
+    return f*np.real(J.T.dot(1./(z0-H[1])))
+
+
+def _dsclansObj6b_jac(x, order, osr, nq, rmax, Hz):
+    # Gradient of the constraint function for clans
+    # The derivative of H wrt pole p is H(z)/(z-p), whose impulse response
+    # is obtained by convolving the one of H with the delayed sequence p**n.
+    # This is done for all the poles at once by FFT.
+    m = 100
+    H, J = _dsclansNTF_jac(x, order, rmax, Hz)
+    h = impulse_response(H, m=m)
+    pw = H[1][:, np.newaxis]**np.arange(m-1)
+    nfft = 2*m
+    dh = np.fft.ifft(np.fft.fft(h, nfft)*np.fft.fft(pw, nfft), axis=1)
+    dh = np.hstack((np.zeros((len(H[1]), 1)), dh[:, :m-1]))
+    return -np.real(J.T.dot(dh.dot(np.sign(h))))
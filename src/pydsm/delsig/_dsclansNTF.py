@@ -76,3 +76,34 @@ def dsclansNTF(x, order, rmax, Hz):
         # Bilinear transform
         Hp[i:i+2] = rmax*(1+s)/(1-s)
     return (Hz, Hp, 1)
+
+
+def _dsclansNTF_jac(x, order, rmax, Hz):
+    """
+    Convert CLANS parameters into an NTF, also returning the poles jacobian
+
+    The jacobian J has J[k, i] equal to the derivative of the k-th pole with
+    respect to x[i].
+    """
+    H = dsclansNTF(x, order, rmax, Hz)
+    Hp = H[1]
+    J = np.zeros((len(Hp), len(x)), dtype=complex)
+    odd = order % 2
+    if odd:
+        s = -x[0]**2
+        J[0, 0] = rmax*2/(1-s)**2*(-2*x[0])
+    for i in range(odd, order, 2):
+        zeta = x[i]**2
+        wn = x[i+1]**2
+        # Recover s from the poles, so that the root ordering is the same
+        z = Hp[i:i+2]/rmax
+        s = (z-1)/(z+1)
+        # Roots of s**2+b*s+c, ds/db = -s/(2s+b), ds/dc = -1/(2s+b)
+        den = 2*s+2*zeta*wn
+        den = np.where(np.abs(den) < 1e-12, 1e-12, den)
+        ds_db = -s/den
+        ds_dc = -1./den
+        dz_ds = rmax*2/(1-s)**2
+        J[i:i+2, i] = dz_ds*ds_db*4*x[i]*wn
+        J[i:i+2, i+1] = dz_ds*(ds_db*4*zeta*x[i+1]+ds_dc*4*wn*x[i+1])
+    return H, J
@@ -23,13 +23,6 @@ Entry point for DELSIG-like Delta-Sigma modulator simulator
 ===========================================================
 """
 
-from ._simulateDSM_scipy import simulateDSM as _simulateDSM_scipy
-try:
-    from ._simulateDSM_cblas import simulateDSM as _simulateDSM_cblas
-    HAS_CBLAS = True
-except:
-    HAS_CBLAS = False
-from ._simulateDSM_scipy_blas import simulateDSM as _simulateDSM_scipy_blas
 from ..utilities import digested_options
 
 __all__ = ["simulateDSM"]
@@ -146,14 +139,16 @@ def simulateDSM(u, arg2, nlev=2, x0=0,
     opts = digested_options(options, simulateDSM.default_options,
                             ['backend'])
     backend = opts["backend"]
-    if backend == 'auto':
-        simulator = _simulateDSM_scipy_blas
+    # Backends are only imported when first used
+    if backend == 'auto' or backend == 'scipy_blas':
+        from ._simulateDSM_scipy_blas import simulateDSM as simulator
     elif backend == 'scipy':
-        simulator = _simulateDSM_scipy
-    elif backend == 'scipy_blas':
-        simulator = _simulateDSM_scipy_blas
-    elif backend == 'cblas' and HAS_CBLAS:
-        simulator = _simulateDSM_cblas
+        from ._simulateDSM_scipy import simulateDSM as simulator
+    elif backend == 'cblas':
+        try:
+            from ._simulateDSM_cblas import simulateDSM as simulator
+        except ImportError:
+            raise RuntimeError('Unsupported simulator backend %s' % backend)
     else:
         raise RuntimeError('Unsupported simulator backend %s' % backend)
     return simulator(u, arg2, nlev, x0, store_xn, store_xmax, store_y)
@@ -53,8 +53,6 @@ Slow simulator for a generic delta sigma modulator
 """
 
 import numpy as np
-from scipy.signal import zpk2ss
-from scipy import linalg
 from warnings import warn
 from ..exceptions import PyDsmSlowPathWarning
 
@@ -73,7 +71,7 @@ def simulateDSM(u, arg2, nlev=2, x0=0,
          PyDsmSlowPathWarning)
 
     # Make sure that nlev is an array
-    nlev = np.asarray(nlev).reshape(1)
+    nlev = np.asarray(nlev).reshape(-1)
 
     # Make sure that input is a matrix
     u = np.asarray(u)
@@ -110,6 +108,8 @@ def simulateDSM(u, arg2, nlev=2, x0=0,
         C = ABCD[order:order+nq, 0:order]
         D1 = ABCD[order:order+nq, order:order+nu]
     else:
+        from scipy.signal import zpk2ss
+        from scipy import linalg
         # Seek a realization of -1/H
         A, B2, C, D2 = zpk2ss(ntf_p, ntf_z, -1)
         # Transform the realization so that C = [1 0 0 ...]
@@ -148,14 +148,15 @@ def simulateDSM(u, arg2, nlev=2, x0=0,
 
     for i in range(N):
         # I guess the coefficients in A, B, C, D should be real...
-        y0 = np.real(np.dot(C, x0) + np.dot(D1, u[:, i]))
+        y0 = np.real(np.dot(C, x0) + np.dot(D1, u[:, i]).reshape(-1, 1))
         if store_y:
-            y[:, i] = y0
-        v[:, i] = ds_quantize(y0, nlev)
-        x0 = np.dot(A, x0) + np.dot(B, np.vstack((u[:, i], v[:, i])))
+            y[:, i] = y0[:, 0]
+        v[:, i] = ds_quantize(y0, nlev)[:, 0]
+        x0 = np.dot(A, x0) + np.dot(
+            B, np.concatenate((u[:, i], v[:, i])).reshape(-1, 1))
         if store_xn:
             # Save the next state
-            xn[:, i] = x0
+            xn[:, i] = x0[:, 0]
         if store_xmax:
             # Keep track of the state maxima
             xmax = np.max((np.abs(x0), xmax), 0)
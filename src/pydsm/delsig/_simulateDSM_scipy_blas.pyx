@@ -27,7 +27,6 @@ import numpy as np
 cimport numpy as np
 np.import_array()
 import scipy as sp
-__import__('scipy.signal')
 __import__('scipy.linalg')
 from libc.math cimport floor, fabs
 
@@ -58,7 +57,7 @@ def simulateDSM(np.ndarray u, arg2, nlev=2, x0=0,
         c_nlev = np.asarray(nlev, dtype=np.int32)
         if c_nlev.ndim > 1:
             raise TypeError()
-        c_nlev=c_nlev.reshape(1)
+        c_nlev=c_nlev.reshape(-1)
     except (ValueError, TypeError):
          raise ValueError(\
             "Invalid argument: nlev must be convertible into a 1D int array")
@@ -132,6 +131,8 @@ def simulateDSM(np.ndarray u, arg2, nlev=2, x0=0,
         D1 = np.asarray(ABCD[order:order+nq, order:order+nu], \
             dtype=np.float64, order='C')
     else:
+        # scipy.signal is slow to import, so only do it when needed
+        __import__('scipy.signal')
         # Seek a realization of -1/H
         A, B2, C, D2 = sp.signal.zpk2ss(ntf_p, ntf_z, -1)
         C=C.real
@@ -56,10 +56,26 @@ import numpy as np
 from warnings import warn
 from ..exceptions import PyDsmApproximationWarning
 from ._synthesizeNTF0 import synthesizeNTF0
-from ._synthesizeNTF1 import synthesizeNTF1
+from ._synthesizeNTF1 import (synthesizeNTF1, _ntf1_zeros, _hinf_poles)
+from ..relab import cplxpair
 from ..utilities import digested_options
 
-__all__ = ["synthesizeNTF"]
+__all__ = ["synthesizeNTF", "synthesizeNTFBatch"]
+
+
+def _check_ntf_spec(order, osr, opt, H_inf, f0):
+    # Validate the specification of an NTF for synthesizeNTF
+    if f0 > 0.5:
+        raise ValueError('Frequency f0 must be less than 0.5')
+    if f0 != 0 and f0 < 0.25/osr:
+        warn('Creating a lowpass ntf.', PyDsmApproximationWarning)
+        f0 = 0
+    if f0 != 0 and order % 2 != 0:
+        raise ValueError('Order must be even for a bandpass modulator')
+    opt = np.asarray(opt)
+    if opt.ndim > 1 or (opt.ndim == 1 and opt.size != order):
+        raise ValueError('The opt vector must be of length %d' % order)
+    return order, osr, opt, H_inf, f0
 
 
 def synthesizeNTF(order=3, osr=64, opt=0, H_inf=1.5, f0=0.0,
@@ -146,17 +162,7 @@ def synthesizeNTF(order=3, osr=64, opt=0, H_inf=1.5, f0=0.0,
                             ['use_optimizer'])
     use_optimizer = opts['use_optimizer']
     # Do the computation
-    if f0 > 0.5:
-        raise ValueError('Frequency f0 must be less than 0.5')
-    if f0 != 0 and f0 < 0.25/osr:
-        warn('Creating a lowpass ntf.', PyDsmApproximationWarning)
-        f0 = 0
-    if f0 != 0 and order % 2 != 0:
-        raise ValueError('Order must be even for a bandpass modulator')
-    opt = np.asarray(opt)
-    if opt.ndim > 1 or (opt.ndim == 1 and opt.size != order):
-        raise ValueError('The opt vector must be of length %d' % order)
-
+    order, osr, opt, H_inf, f0 = _check_ntf_spec(order, osr, opt, H_inf, f0)
     if not use_optimizer:
         ntf = synthesizeNTF0(order, osr, opt, H_inf, f0)
     else:
@@ -164,3 +170,86 @@ def synthesizeNTF(order=3, osr=64, opt=0, H_inf=1.5, f0=0.0,
     return ntf
 
 synthesizeNTF.default_options = {'use_optimizer': True}
+
+
+def synthesizeNTFBatch(order=3, osr=64, opt=0, H_inf=1.5, f0=0.0,
+                       **options):
+    """
+    Synthesizes many NTFs for DS modulators by Schreier's approach.
+
+    This is equivalent to calling :func:`synthesizeNTF` for each set of
+    parameters, but the iterative search for the poles giving the desired
+    H_inf is practiced for all the NTFs at once, in a vectorized way.
+
+    Parameters
+    ----------
+    order : int or array_like of ints, optional
+        the orders of the modulators, defaults to 3
+    osr : float or array_like of floats, optional
+        the oversamping ratios (based on the actual signal bandwidth)
+    opt : int or array_like of ints, optional
+        flags for optimized zeros, as in :func:`synthesizeNTF`. Explicit
+        zero locations are not supported. Defaults to 0.
+    H_inf : real or array_like of reals, optional
+        max allowed peak values of the NTFs. Defaults to 1.5
+    f0 : real or array_like of reals, optional
+        center frequencies for BP modulators, or 0 for LP modulators.
+        Defaults to 0.
+
+    Returns
+    -------
+    ntfs : list of tuples
+        noise transfer functions in zpk form.
+
+    Other Parameters
+    ----------------
+    use_optimizer : bool
+        As in :func:`synthesizeNTF`. Defaults can be set by changing the
+        function ``default_options`` attribute.
+
+    Raises
+    ------
+    ValueError
+        As in :func:`synthesizeNTF`.
+
+    Warns
+    -----
+    PyDsmApproximationWarning
+        As in :func:`synthesizeNTF`.
+
+    Notes
+    -----
+    The parameters are broadcast against each other, so that scalars can
+    be used for the parameters that are common to all the NTFs.
+
+    The NTFs whose zeros are optimized with the optimizer (opt equal to 3
+    or 4) and, if ``use_optimizer`` is False, all the NTFs, are synthesized
+    one at a time.
+    """
+    # Manage options
+    opts = digested_options(options, synthesizeNTFBatch.default_options,
+                            ['use_optimizer'])
+    use_optimizer = opts['use_optimizer']
+    specs = [_check_ntf_spec(*spec) for spec in zip(*(
+        a.ravel().tolist() for a in np.broadcast_arrays(
+            order, osr, opt, H_inf, f0)))]
+    ntfs = [None]*len(specs)
+    batch = []
+    for i, (order, osr, opt, H_inf, f0) in enumerate(specs):
+        if not use_optimizer:
+            ntfs[i] = synthesizeNTF0(order, osr, opt, H_inf, f0)
+        elif opt >= 3:
+            ntfs[i] = synthesizeNTF1(order, osr, opt, H_inf, f0)
+        else:
+            batch.append(i)
+    if batch:
+        zs = [_ntf1_zeros(*[specs[i][j] for j in (0, 1, 2, 4)])
+              for i in batch]
+        ps = _hinf_poles([z for n, z in zs], [n for n, z in zs],
+                         [specs[i][3] for i in batch],
+                         [specs[i][4] for i in batch])
+        for i, (n, z), p in zip(batch, zs, ps):
+            ntfs[i] = (cplxpair(z), p, 1)
+    return ntfs
+
+synthesizeNTFBatch.default_options = synthesizeNTF.default_options.copy()
@@ -54,9 +54,9 @@ from scipy.optimize import fmin_l_bfgs_b
 from warnings import warn
 from ..exceptions import PyDsmApproximationWarning
 from ._tf import evalTF
-from ..utilities import is_negligible
+from ..utilities import is_negligible, _uc_zero_pairs
 from ..relab import cplxpair
-from ._ds import ds_optzeros, ds_synNTFobj1
+from ._ds import ds_optzeros, ds_f1f2
 from ._padding import padl
 
 import sys
@@ -64,8 +64,134 @@ if sys.version_info < (3,):
     range = xrange
 
 
-def synthesizeNTF1(order, osr, opt, H_inf, f0):
-    # Determine the zeros.
+def _synNTFobj1_grad(x, p, osr, f0, N=100):
+    """
+    Objective function for synthesizeNTF, with its gradient.
+
+    Returns the same value as ``ds_synNTFobj1``, namely the in-band rms
+    gain of the NTF in dB, together with its exact gradient with respect to
+    the normalized zero positions x. The NTF is evaluated on a grid of N
+    points in the signal band in a vectorized way.
+    """
+    f1, f2 = ds_f1f2(osr, f0)
+    w = 2*np.pi*np.linspace(f1, f2, N)[:, np.newaxis]
+    th = 2*np.pi*(f0+0.5/osr*x)
+    # Squared magnitude of the factors due to the zeros in x and to their
+    # conjugates, with its logarithmic derivative wrt the zero angles
+    hz, dl = _uc_zero_pairs(w, th)
+    # Fixed zeros from padding, and poles
+    if f0 > 0:
+        zf = np.exp(2j*np.pi*f0)*np.ones(len(p)//2-len(x))
+        zf = np.concatenate((zf, zf.conj()))
+    else:
+        zf = np.ones(len(p)-2*len(x))
+    uc = np.exp(1j*w)
+    h2 = (np.prod(np.abs(uc-zf)**2, axis=1) /
+          np.prod(np.abs(uc-p)**2, axis=1))
+    h2 = h2*hz
+    s = np.sum(h2)
+    ds = h2.dot(dl)*np.pi/osr
+    return 10*np.log10(s/N), 10/np.log(10)*ds/s
+
+
+def _hinf_poles(zs, orders, H_infs, f0s):
+    """
+    Determine the NTF poles giving the desired H_inf, for many NTFs at once.
+
+    For each NTF, the poles are parametrized by a spread parameter x and
+    the value of x which results in the desired H_inf is found by a secant
+    iteration. The iterations for all the NTFs are practiced together in
+    a vectorized way, each NTF leaving the iteration on convergence.
+
+    Parameters
+    ----------
+    zs : list of arrays
+        the NTF zeros
+    orders : list of ints
+        the number of NTF poles
+    H_infs : list of reals
+        the max allowed peak values of the NTFs
+    f0s : list of reals
+        the center frequencies, 0 for LP NTFs
+
+    Returns
+    -------
+    ps : list of arrays
+        the NTF poles
+    """
+    m = len(zs)
+    orders = np.asarray(orders, dtype=int)
+    H_infs = np.asarray(H_infs, dtype=float)
+    f0s = np.asarray(f0s, dtype=float)
+    lp = f0s == 0
+    z_inf = np.where(f0s > 0.25, 1., -1.)
+    ps = [np.zeros(n) for n in orders]
+    # Parametrization of the poles: mb2 = c+s*x**(2/order)*exp(1j*w)/2
+    nmax = max(orders.max(), 1)
+    idx = np.arange(nmax)
+    valid = idx < orders[:, np.newaxis]
+    nn = np.maximum(orders, 1)[:, np.newaxis]
+    w = np.where(lp[:, np.newaxis], 2*idx+3, 2*idx+1)*np.pi/nn
+    ejw = np.exp(1j*w)
+    c = np.where(lp, 1., np.cos(2*np.pi*f0s))[:, np.newaxis]
+    sg = np.where(lp, -1., 1.)[:, np.newaxis]
+    zv = np.asarray([np.prod(zi-np.asarray(z)) for zi, z in zip(z_inf, zs)])
+    x = np.where(lp, 0.3**(orders-1.), 0.3**(orders//2-1.))
+    active = np.ones(m, dtype=bool)
+    # For LP NTFs, the achievable H_inf is limited
+    # !!! The limit is actually lower for opt=1 and low OSR
+    out = lp & (H_infs >= 2.**orders)
+    for i in np.nonzero(out)[0]:
+        warn('Unable to achieve specified Hinf, '
+             'setting all NTF poles to zero', PyDsmApproximationWarning)
+    active[out] = False
+    fprev = np.zeros(m)
+    delta_x = np.zeros(m)
+    Hinf_itn_limit = 100
+    for itn in range(1, Hinf_itn_limit+1):
+        a = np.nonzero(active)[0]
+        if a.size == 0:
+            break
+        mb2 = c[a]+sg[a]*0.5*(x[a, np.newaxis]**(2./nn[a]))*ejw[a]
+        p = mb2-np.sqrt(mb2**2-1)
+        # Reflect poles to be inside the unit circle
+        ob = np.abs(p) > 1
+        p[ob] = 1/p[ob]
+        den = np.prod(np.where(valid[a], z_inf[a, np.newaxis]-p, 1.),
+                      axis=1)
+        f = np.real(zv[a]/den)-H_infs[a]
+        if itn == 1:
+            dx = -f/100
+        else:
+            dx = -f*delta_x[a]/(f-fprev[a])
+        xplus = x[a]+dx
+        x[a] = np.where(xplus > 0, xplus, x[a]*0.1)
+        delta_x[a] = dx
+        fprev[a] = f
+        for j, i in enumerate(a):
+            ps[i] = p[j, :orders[i]]
+        done = (np.abs(f) < 1e-10) | (np.abs(dx) < 1e-10)
+        diverged = ~done & (x[a] > 1e6)
+        for i in a[diverged]:
+            warn('Unable to achieve specified Hinf, '
+                 'setting all NTF poles to zero.',
+                 PyDsmApproximationWarning)
+            ps[i] = np.zeros(orders[i])
+        active[a[done | diverged]] = False
+        if itn == Hinf_itn_limit:
+            for i in np.nonzero(active)[0]:
+                warn('Iteration limit exceeded.', PyDsmApproximationWarning)
+    # The following is not exactly what delsig does.
+    # We do not have an identical cplxpair
+    return [cplxpair(p) for p in ps]
+
+
+def _ntf1_zeros(order, osr, opt, f0):
+    """
+    Determine the initial NTF zeros for synthesizeNTF1.
+
+    Returns the order to use for the pole placement and the zeros.
+    """
     if f0 != 0:
         # Bandpass design-- halve the order temporarily.
         order = order//2
@@ -89,6 +215,12 @@ def synthesizeNTF1(order, osr, opt, H_inf, f0):
         z = np.exp(1j*z)
     else:
         z = opt
+    return order, z
+
+
+def synthesizeNTF1(order, osr, opt, H_inf, f0):
+    # Determine the zeros.
+    order, z = _ntf1_zeros(order, osr, opt, f0)
 
     zp = z[np.angle(z) > 0]
     x0 = (np.angle(zp)-2*np.pi*f0) * osr / np.pi
@@ -98,103 +230,14 @@ def synthesizeNTF1(order, osr, opt, H_inf, f0):
 
     p = np.zeros(order)
     k = 1
-    Hinf_itn_limit = 100
-    fprev = 0
+    ftol = 1e-10
+    z_inf = 1 if f0 > 0.25 else -1
 
     opt_iteration = 5   # Max number of zero-optimizing/Hinf iterations
     while opt_iteration > 0:
         # Iteratively determine the poles by finding the value of the x
         # parameter which results in the desired H_inf
-        ftol = 1e-10
-        if f0 > 0.25:
-            z_inf = 1
-        else:
-            z_inf = -1
-        if f0 == 0:
-            # Lowpass design
-            HinfLimit = 2**order
-            # !!! The limit is actually lower for opt=1 and low OSR
-            if H_inf >= HinfLimit:
-                warn('Unable to achieve specified Hinf, '
-                     'setting all NTF poles to zero',
-                     PyDsmApproximationWarning)
-                p = np.zeros(order)
-            else:
-                x = 0.3**(order-1)   # starting guess
-                for itn in range(1, Hinf_itn_limit+1):
-                    me2 = -0.5*(x**(2./order))
-                    w = (2*np.arange(1, order+1)+1)*np.pi/order
-                    mb2 = 1+me2*np.exp(1j*w)
-                    p = mb2 - np.sqrt(mb2**2-1)
-                    # Reflect poles to be inside the unit circle
-                    out = abs(p) > 1
-                    p[out] = 1/p[out]
-                    # The following is not exactly what delsig does.
-                    # We do not have an identical cplxpair
-                    p = cplxpair(p)
-                    f = np.real(evalTF((z, p, k), z_inf))-H_inf
-                    if itn == 1:
-                        delta_x = -f/100
-                    else:
-                        delta_x = -f*delta_x/(f-fprev)
-
-                    xplus = x+delta_x
-                    if xplus > 0:
-                        x = xplus
-                    else:
-                        x = x*0.1
-                    fprev = f
-                    if abs(f) < 1e-10 or abs(delta_x) < 1e-10:
-                        break
-                    if x > 1e6:
-                        warn('Unable to achieve specified Hinf, '
-                             'setting all NTF poles to zero.',
-                             PyDsmApproximationWarning)
-                        p = np.zeros(order)
-                        break
-                    if itn == Hinf_itn_limit:
-                        warn('Iteration limit exceeded.',
-                             PyDsmApproximationWarning)
-        else:
-            # Bandpass design
-            x = 0.3**(order//2-1)   # starting guess (not very good for f0~0)
-            if f0 > 0.25:
-                z_inf = 1.
-            else:
-                z_inf = -1.
-            c2pif0 = np.cos(2*np.pi*f0)
-            for itn in range(1, Hinf_itn_limit+1):
-                e2 = 0.5*x**(2./order)
-                w = (2*np.arange(order)+1)*np.pi/order
-                mb2 = c2pif0 + e2*np.exp(1j*w)
-                p = mb2 - np.sqrt(mb2**2-1)
-                # Reflect poles to be inside the unit circle
-                out = abs(p) > 1
-                p[out] = 1/p[out]
-                # The following is not exactly what delsig does.
-                p = cplxpair(p)
-                f = np.real(evalTF((z, p, k), z_inf))-H_inf
-                if itn == 1:
-                    delta_x = -f/100
-                else:
-                    delta_x = -f*delta_x/(f-fprev)
-                xplus = x+delta_x
-                if xplus > 0:
-                    x = xplus
-                else:
-                    x = x*0.1
-                fprev = f
-                if abs(f) < 1e-10 or abs(delta_x) < 1e-10:
-                    break
-                if x > 1e6:
-                    warn('Unable to achieve specified Hinf, '
-                         'setting all NTF poles to zero.',
-                         PyDsmApproximationWarning)
-                    p = np.zeros(order)
-                    break
-                if itn == Hinf_itn_limit:
-                    warn('Iteration limit exceeded.',
-                         PyDsmApproximationWarning)
+        p = _hinf_poles([z], [order], [H_inf], [f0])[0]
 
         # ---- Zero optimization part
         if (opt.size == 1 and opt < 3) or opt.size > 1 or x0.size < 1:
@@ -211,8 +254,8 @@ def synthesizeNTF1(order, osr, opt, H_inf, f0):
             # options = optimset(options,'LargeScale','off');
             # options = optimset(options,'Display','off');
             # %options = optimset(options,'Display','iter');
-            opt_result = fmin_l_bfgs_b(ds_synNTFobj1, x0, args=(p, osr, f0),
-                                       approx_grad=True,
+            opt_result = fmin_l_bfgs_b(_synNTFobj1_grad, x0,
+                                       args=(p, osr, f0),
                                        bounds=list(zip(lb, ub)))
             x = opt_result[0]
             x0 = x
@@ -53,8 +53,10 @@ Transfer function management a la DELSIG.
 """
 
 import numpy as np
+from functools import lru_cache
+from itertools import zip_longest
 
-__all__ = ["evalTF", "evalRPoly"]
+__all__ = ["evalTF", "evalRPoly", "evalTFBatch", "ucGrid"]
 
 
 def evalTF(tf, x):
@@ -118,10 +120,161 @@ def evalRPoly(roots, x, k=1):
     y : ndarray
         value of polynomial at the given complex values.
     """
-    y = k*np.ones_like(x)
-    roots = np.asarray(roots)
+    x = np.asarray(x)
+    roots = np.asarray(roots).reshape(-1)
     # Remove roots at infinity
     roots = roots[np.logical_not(np.isinf(roots))]
-    for i in range(roots.size):
-        y = y*(x-roots[i])
-    return y
+    if roots.size == 0:
+        return k*np.ones_like(x)
+    return k*np.prod(x[..., np.newaxis]-roots, axis=-1)
+
+
+@lru_cache(maxsize=32)
+def _uc_grid(n, f1, f2):
+    z = np.exp(2j*np.pi*np.linspace(f1, f2, n))
+    z.flags.writeable = False
+    return z
+
+
+def ucGrid(n, f1=0., f2=0.5):
+    """
+    Points on the unit circle at uniformly spaced normalized frequencies.
+
+    The grids are cached, so that repeated evaluations of transfer
+    functions on the same frequencies do not recompute the exponentials.
+
+    Parameters
+    ----------
+    n : int
+        number of points
+    f1 : real, optional
+        first normalized frequency. Defaults to 0.
+    f2 : real, optional
+        last normalized frequency. Defaults to 0.5.
+
+    Returns
+    -------
+    z : ndarray
+        read-only array of the values exp(2j*pi*f) at the n frequencies f
+        uniformly spaced in [f1, f2].
+    """
+    return _uc_grid(int(n), float(f1), float(f2))
+
+
+def _stack_roots(rr):
+    # Stack root lists of different length, padding with roots at infinity
+    n = max([np.size(r) for r in rr])
+    out = np.full((len(rr), n), np.inf, dtype=complex)
+    for i, r in enumerate(rr):
+        out[i, :np.size(r)] = np.asarray(r).reshape(-1)
+    return out
+
+
+def _stack_coeffs(cc):
+    # Stack polynomial coefficients, padding with leading zeros
+    cc = [np.asarray(c).reshape(-1) for c in cc]
+    n = max([c.size for c in cc])
+    out = np.zeros((len(cc), n), dtype=np.result_type(*cc))
+    for i, c in enumerate(cc):
+        out[i, n-c.size:] = c
+    return out
+
+
+def _root_factors(roots, x):
+    # The (x-root) factors, one root at a time for all the transfer
+    # functions, roots at infinity giving unitary factors
+    shape = (roots.shape[0],)+(1,)*x.ndim
+    for r in roots.T:
+        r = r.reshape(shape)
+        inf = np.isinf(r)
+        yield np.where(inf, 1., x-np.where(inf, 0., r))
+
+
+def evalTFBatch(tfs, x, mode='direct'):
+    """
+    Evaluates many transfer functions at once.
+
+    All the transfer functions are evaluated at all the points by
+    broadcasting. The transfer functions are only looped over once, to
+    stack their definitions, and the evaluation loops over the roots or
+    the coefficients, each step processing all the transfer functions and
+    all the points together.
+
+    Parameters
+    ----------
+    tfs : list of tuples, tuple of arrays or ndarray
+        transfer functions to evaluate. Either a list of transfer
+        functions in zpk or ba form, or a stacked zpk triple, where the
+        zeros and the poles are 2D arrays with a row per transfer function
+        and the gains are a vector, or an array of second order sections
+        with shape (m, ns, 6) in the format used by ``scipy.signal``.
+    x : array_like of complex
+        values where the transfer functions are to be evaluated. Use
+        :func:`ucGrid` to get cached points on the unit circle.
+    mode : string, optional
+        either ``direct`` (default), computing numerator and denominator
+        separately, or ``sections``, multiplying the ratios of zero and
+        pole factors one at a time, so that the intermediate results
+        cannot overflow for high order transfer functions. Not used for
+        second order sections, that are always evaluated one section at a
+        time.
+
+    Returns
+    -------
+    y : ndarray
+        values of the transfer functions, with shape (m,)+x.shape, m
+        being the number of transfer functions.
+
+    Notes
+    -----
+    Lists of zpk transfer functions with a different number of zeros or
+    poles are padded with roots at infinity, that are ignored as in
+    :func:`evalRPoly`.
+    """
+    x = np.asarray(x, dtype=complex)
+    if isinstance(tfs, np.ndarray) and tfs.ndim == 3:
+        # Second order sections, evaluated in z**-1
+        sos = tfs.reshape(tfs.shape[:2]+(1,)*x.ndim+(6,))
+        xi = 1./x
+        num = sos[..., 0]+xi*(sos[..., 1]+xi*sos[..., 2])
+        den = sos[..., 3]+xi*(sos[..., 4]+xi*sos[..., 5])
+        return np.prod(num/den, axis=1)
+    if (isinstance(tfs, tuple) and len(tfs) == 3 and
+            isinstance(tfs[0], np.ndarray) and tfs[0].ndim == 2):
+        z = np.asarray(tfs[0], dtype=complex)
+        p = np.asarray(tfs[1], dtype=complex)
+        k = np.asarray(tfs[2]).reshape(-1)
+    elif len(tfs[0]) == 3:
+        z = _stack_roots([tf[0] for tf in tfs])
+        p = _stack_roots([tf[1] for tf in tfs])
+        k = np.asarray([tf[2] for tf in tfs])
+    elif len(tfs[0]) == 2:
+        b = _stack_coeffs([tf[0] for tf in tfs])
+        a = _stack_coeffs([tf[1] for tf in tfs])
+        shape = (b.shape[0],)+(1,)*x.ndim
+        num = np.zeros((b.shape[0],)+x.shape, dtype=complex)
+        den = np.zeros((a.shape[0],)+x.shape, dtype=complex)
+        for c in b.T:
+            num = num*x+c.reshape(shape)
+        for c in a.T:
+            den = den*x+c.reshape(shape)
+        return num/den
+    else:
+        raise ValueError('Unsupported transfer function specification')
+    y = np.ones((k.size,)+x.shape, dtype=complex)
+    y *= k.reshape((k.size,)+(1,)*x.ndim)
+    if mode == 'direct':
+        den = np.ones_like(y)
+        for f in _root_factors(z, x):
+            y *= f
+        for f in _root_factors(p, x):
+            den *= f
+        return y/den
+    elif mode == 'sections':
+        for fz, fp in zip_longest(_root_factors(z, x), _root_factors(p, x)):
+            if fz is not None:
+                y *= fz
+            if fp is not None:
+                y /= fp
+        return y
+    raise ValueError('Unsupported evaluation mode {}'.format(mode))
@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2012-2024, Sergio Callegari
+# All rights reserved.
+
+# This file is part of PyDSM.
+
+# PyDSM is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# PyDSM is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with PyDSM.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Throughput of the simulator over a matrix of modulator shapes.
+
+Each benchmark runs :func:`pydsm.delsig.simulateDSM` with one backend on
+one modulator shape, sweeping one axis at a time away from a base case
+(order 5 lowpass NTF, one input, one quantizer, 8192 samples, nothing
+stored, zpk specification). The throughput in samples per second is
+recorded in the benchmark ``extra_info``, so that it ends up in the JSON
+file written by ``--benchmark-json``. Runs can then be compared against
+a stored baseline by the ``compare_benchmarks.py`` script in this
+directory.
+"""
+
+from __future__ import division, print_function
+
+import numpy as np
+import warnings
+import pytest
+from scipy.signal import zpk2ss
+from scipy import linalg
+from pydsm.delsig import simulateDSM, synthesizeNTF
+from pydsm.exceptions import PyDsmSlowPathWarning
+
+try:
+    import pytest_benchmark
+    BENCHMARK_AVAILABLE = True
+except ImportError:
+    BENCHMARK_AVAILABLE = False
+
+# Base case and sweeps, one axis at a time
+_BASE = {'order': 5, 'nq': 1, 'nu': 1, 'N': 8192, 'store': (),
+         'form': 'zpk'}
+_SWEEPS = ([{'order': o} for o in (2, 8)] +
+           [{'nq': nq, 'nu': nu, 'form': 'abcd'}
+            for nq, nu in ((1, 1), (1, 2), (2, 1), (2, 2), (4, 4))] +
+           [{'N': 2**17}] +
+           [{'store': s} for s in (('xn',), ('xmax',), ('y',),
+                                   ('xn', 'xmax', 'y'))])
+
+_BACKENDS = ['scipy_blas', 'cblas', 'scipy']
+
+# Simulated length for the slow pure python backend
+_SCIPY_MAX_N = 1024
+
+
+def _case_id(case):
+    return '-'.join(
+        '{}={}'.format(k, '+'.join(v) or 'none' if k == 'store' else v)
+        for k, v in sorted(case.items()))
+
+
+def _cases():
+    cases = [dict(_BASE)]
+    for sweep in _SWEEPS:
+        case = dict(_BASE)
+        case.update(sweep)
+        if case not in cases:
+            cases.append(case)
+    params = []
+    for backend in _BACKENDS:
+        for case in cases:
+            marks = [pytest.mark.slow] if backend == 'scipy' else []
+            params.append(pytest.param(
+                backend, case, marks=marks,
+                id='{}-{}'.format(backend, _case_id(case))))
+    return params
+
+
+def _ntf_abcd(ntf, nu, nq):
+    """
+    ABCD matrix of nq independent modulators, each with the given NTF.
+
+    Each loop is realized as in the zpk path of the simulator, with a
+    unit STF, and is driven by input number i % nu.
+    """
+    order = len(ntf[0])
+    A, B2, C, D2 = zpk2ss(ntf[1], ntf[0], -1)
+    Sinv = (linalg.orth(np.hstack((np.transpose(C), np.eye(order)))) /
+            np.linalg.norm(C))
+    S = linalg.inv(Sinv)
+    if np.dot(C, Sinv)[0, 0] < 0:
+        S = -S
+        Sinv = -Sinv
+    A = np.real(np.dot(np.dot(S, A), Sinv))
+    B2 = np.real(np.dot(S, B2)).reshape(-1)
+    n = order*nq
+    ABCD = np.zeros((n+nq, n+nu+nq))
+    for i in range(nq):
+        s = slice(i*order, (i+1)*order)
+        ABCD[s, s] = A
+        ABCD[s, n+i % nu] = -B2
+        ABCD[s, n+nu+i] = B2
+        ABCD[n+i, i*order] = 1.
+        ABCD[n+i, n+i % nu] = 1.
+    return ABCD
+
+
+@pytest.mark.skipif(not BENCHMARK_AVAILABLE,
+                    reason="pytest-benchmark is not installed")
+@pytest.mark.benchmark(group="simulator-matrix")
+class Benchmark_simulateDSM_matrix(object):
+
+    @pytest.mark.parametrize("backend, case", _cases())
+    def benchmark_simulateDSM_matrix(self, benchmark, backend, case):
+        """Benchmark simulateDSM on a modulator shape"""
+        ntf = synthesizeNTF(case['order'], 32, 1)
+        N = case['N'] if backend != 'scipy' else min(case['N'],
+                                                     _SCIPY_MAX_N)
+        nu, nq = case['nu'], case['nq']
+        # Inputs at different frequencies, within the stable range
+        ff = 85.+10.*np.arange(nu)
+        u = 0.4/nu*np.sin(2.*np.pi*ff[:, np.newaxis]/8192*np.arange(N))
+        if nu == 1:
+            u = u[0]
+        if case['form'] == 'zpk':
+            arg2 = ntf
+            nlev = 2
+        else:
+            arg2 = _ntf_abcd(ntf, nu, nq)
+            nlev = [2]*nq if nq > 1 else 2
+        kwargs = {'store_'+s: True for s in case['store']}
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", category=PyDsmSlowPathWarning)
+            try:
+                simulateDSM(u[..., :16], arg2, nlev, backend=backend,
+                            **kwargs)
+            except RuntimeError:
+                pytest.skip("Simulator backend {} not available".format(
+                    backend))
+            v, xn, xmax, y = benchmark(simulateDSM, u, arg2, nlev,
+                                       backend=backend, **kwargs)
+        assert v.shape == ((nq, N) if nq > 1 else (N,))
+        benchmark.extra_info['N'] = N
+        # No timings are taken with --benchmark-disable
+        if benchmark.stats is not None:
+            benchmark.extra_info['samples_per_sec'] = (
+                N/benchmark.stats.stats.median)
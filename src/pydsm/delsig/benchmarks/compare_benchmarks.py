@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2012-2024, Sergio Callegari
+# All rights reserved.
+
+# This file is part of PyDSM.
+
+# PyDSM is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# PyDSM is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with PyDSM.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Compare the throughput of two benchmark runs.
+
+Usage::
+
+    python compare_benchmarks.py BASELINE.json CURRENT.json [-t THRESHOLD]
+
+Both files are written by pytest-benchmark with ``--benchmark-json``,
+e.g. by::
+
+    python -c "import pydsm.delsig; pydsm.delsig.bench(extra_argv=[
+               '-k', 'matrix', '--benchmark-json=current.json'])"
+
+Benchmarks are matched by their full name (module, class and test).
+Their throughput is the ``samples_per_sec`` entry of their
+``extra_info`` if present, as recorded by
+``benchmark_simulateDSM_matrix.py``, or the number of operations per
+second otherwise. The script lists the throughput ratios and exits with
+status 1 if any benchmark is slower than the baseline by more than the
+threshold (a fraction, defaulting to 0.1), and with status 2 if the runs
+have no benchmark in common. Benchmarks present in one run only are
+listed and otherwise ignored.
+"""
+
+from __future__ import division, print_function
+
+import sys
+import json
+import argparse
+
+
+def throughput(bench):
+    """Throughput of a benchmark from its pytest-benchmark JSON record"""
+    extra = bench.get('extra_info', {})
+    if 'samples_per_sec' in extra:
+        return extra['samples_per_sec']
+    return bench['stats']['ops']
+
+
+def load(fname):
+    """Map benchmark names to throughput from a pytest-benchmark JSON file"""
+    with open(fname) as f:
+        data = json.load(f)
+    return {b['fullname']: throughput(b) for b in data['benchmarks']}
+
+
+def compare(baseline, current, threshold=0.1):
+    """
+    Compare throughputs.
+
+    Parameters
+    ----------
+    baseline, current : dict
+        throughputs by benchmark name, as returned by :func:`load`.
+    threshold : float
+        maximum tolerated relative slowdown.
+
+    Returns
+    -------
+    rows : list of tuples
+        name, baseline and current throughput, ratio and whether the
+        benchmark regressed, for the benchmarks in both runs.
+    missing : list of str
+        names of the benchmarks in one run only.
+    """
+    rows = []
+    for name in sorted(set(baseline) & set(current)):
+        ratio = current[name]/baseline[name]
+        rows.append((name, baseline[name], current[name], ratio,
+                     ratio < 1.-threshold))
+    missing = sorted(set(baseline) ^ set(current))
+    return rows, missing
+
+
+def _short(name):
+    # Benchmark name without the path of its module
+    return name.rsplit('::', 1)[-1]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Compare the throughput of two benchmark runs.')
+    parser.add_argument('baseline', help='JSON file of the baseline run')
+    parser.add_argument('current', help='JSON file of the current run')
+    parser.add_argument('-t', '--threshold', type=float, default=0.1,
+                        help='maximum tolerated relative slowdown '
+                        '(default 0.1)')
+    args = parser.parse_args(argv)
+    rows, missing = compare(load(args.baseline), load(args.current),
+                            args.threshold)
+    print('{:>10} {:>10} {:>6}  {}'.format('baseline', 'current', 'ratio',
+                                          'benchmark'))
+    for name in missing:
+        print('{:>28}  {}'.format('unmatched', _short(name)))
+    for name, b, c, ratio, bad in rows:
+        print('{:10.4g} {:10.4g} {:6.3f}  {}{}'.format(
+            b, c, ratio, _short(name), '  REGRESSION' if bad else ''))
+    if not rows:
+        print('No benchmarks in common')
+        return 2
+    regressions = sum(r[-1] for r in rows)
+    print('{} benchmarks compared, {} regressions beyond {:.0%}'.format(
+        len(rows), regressions, args.threshold))
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
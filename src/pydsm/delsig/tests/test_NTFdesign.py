@@ -22,7 +22,8 @@ from __future__ import division, print_function
 
 import numpy as np
 
-from pydsm.delsig import synthesizeNTF, synthesizeChebyshevNTF, clans
+from pydsm.delsig import (synthesizeNTF, synthesizeNTFBatch,
+                          synthesizeChebyshevNTF, clans)
 from pydsm.relab import cplxpair
 
 __all__ = ["TestSynthesizeNTF", "TestSynthesizeChebyshevNTF",
@@ -90,6 +91,18 @@ class TestSynthesizeNTF:
         np.testing.assert_almost_equal(z, e_z, 4)
         np.testing.assert_almost_equal(p, e_p, 4)
 
+    def test_batch(self):
+        orders = [3, 4, 5, 6, 6, 8]
+        osrs = [64, 32, 16, 64, 64, 32]
+        opts = [0, 1, 2, 1, 3, 4]
+        f0s = [0, 0, 0, 0.3, 0.2, 0.125]
+        ntfs = synthesizeNTFBatch(orders, osrs, opts, 1.5, f0s)
+        for ntf, spec in zip(ntfs, zip(orders, osrs, opts, f0s)):
+            z, p, k = synthesizeNTF(*spec[:3], H_inf=1.5, f0=spec[3])
+            np.testing.assert_almost_equal(ntf[2], k, 12)
+            np.testing.assert_almost_equal(ntf[0], z, 12)
+            np.testing.assert_almost_equal(ntf[1], p, 12)
+
 
 class TestSynthesizeChebyshevNTF:
 
@@ -21,7 +21,8 @@
 from __future__ import division, print_function
 
 import numpy as np
-from pydsm.delsig import clans
+from pydsm.delsig import clans, evalTF
+from pydsm.ir import impulse_response
 from pydsm.relab import cplxpair
 
 __all__ = ["TestClans"]
@@ -54,5 +55,18 @@ class TestClans:
         np.testing.assert_almost_equal(z, e_z, 6)
         np.testing.assert_almost_equal(p, e_p, 6)
 
+    def test_clans_multistart(self):
+        """Test function for clans in multistart mode"""
+        z0, p0, k0 = clans(5, 32, 5, .95, 1)
+        z1, p1, k1 = clans(5, 32, 5, .95, 1, multistart=4, workers=2)
+        f0 = np.abs(evalTF((z0, p0, k0), np.exp(1j*np.pi/32)))
+        f1 = np.abs(evalTF((z1, p1, k1), np.exp(1j*np.pi/32)))
+        g1 = np.sum(np.abs(impulse_response((z1, p1, k1), m=100)))-1
+        assert f1 <= f0
+        assert g1 <= 5+1e-6
+        # Deterministic seeding
+        z2, p2, k2 = clans(5, 32, 5, .95, 1, multistart=4)
+        np.testing.assert_equal(cplxpair(p1), cplxpair(p2))
+
 if __name__ == '__main__':
     run_module_suite()
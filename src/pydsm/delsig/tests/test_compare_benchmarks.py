@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2012-2024, Sergio Callegari
+# All rights reserved.
+
+# This file is part of PyDSM.
+
+# PyDSM is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# PyDSM is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with PyDSM.  If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import division, print_function
+
+import json
+import importlib.util
+import importlib_resources
+import pytest
+
+__all__ = ["TestCompareBenchmarks"]
+
+
+def _load_script():
+    # The script lives among the benchmarks, that are not a package
+    with importlib_resources.as_file(
+            importlib_resources.files('pydsm.delsig')
+            .joinpath('benchmarks/compare_benchmarks.py')) as fname:
+        spec = importlib.util.spec_from_file_location('compare_benchmarks',
+                                                      fname)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    return module
+
+
+def _run(names, sps=None, ops=None):
+    # Minimal pytest-benchmark JSON record
+    bb = []
+    for i, name in enumerate(names):
+        b = {'fullname': 'm.py::C::' + name, 'extra_info': {},
+             'stats': {'ops': ops[i] if ops else 1.}}
+        if sps:
+            b['extra_info']['samples_per_sec'] = sps[i]
+        bb.append(b)
+    return {'benchmarks': bb}
+
+
+class TestCompareBenchmarks:
+
+    @classmethod
+    def setup_class(cls):
+        cls.cb = _load_script()
+
+    def test_throughput(self):
+        r = _run(['a'], sps=[10.], ops=[3.])['benchmarks'][0]
+        assert self.cb.throughput(r) == 10.
+        r = _run(['a'], ops=[3.])['benchmarks'][0]
+        assert self.cb.throughput(r) == 3.
+
+    def test_compare(self):
+        base = {'a': 100., 'b': 100., 'c': 100., 'd': 100.}
+        cur = {'a': 120., 'b': 95., 'c': 85., 'e': 1.}
+        rows, missing = self.cb.compare(base, cur, threshold=0.1)
+        assert [r[0] for r in rows] == ['a', 'b', 'c']
+        assert [r[-1] for r in rows] == [False, False, True]
+        assert rows[2][1:4] == (100., 85., pytest.approx(0.85))
+        assert missing == ['d', 'e']
+        rows, missing = self.cb.compare(base, cur, threshold=0.2)
+        assert not any(r[-1] for r in rows)
+
+    def test_exit_codes(self, tmp_path, capsys):
+        def write(name, data):
+            fname = tmp_path / name
+            fname.write_text(json.dumps(data))
+            return str(fname)
+
+        base = write('base.json', _run(['a', 'b'], sps=[100., 100.]))
+        same = write('same.json', _run(['a', 'b'], sps=[98., 101.]))
+        slow = write('slow.json', _run(['a', 'b'], sps=[80., 101.]))
+        other = write('other.json', _run(['c'], sps=[100.]))
+        assert self.cb.main([base, same]) == 0
+        assert self.cb.main([base, slow]) == 1
+        assert 'REGRESSION' in capsys.readouterr().out
+        assert self.cb.main([base, slow, '-t', '0.25']) == 0
+        assert self.cb.main([base, other]) == 2
@@ -21,8 +21,11 @@
 from __future__ import division, print_function
 
 import numpy as np
+import warnings
 import importlib_resources
-from pydsm.delsig import simulateDSM
+import scipy.signal as sp
+from pydsm.delsig import simulateDSM, synthesizeNTF
+from pydsm.exceptions import PyDsmSlowPathWarning
 
 __all__ = ["TestSimulateDSM"]
 
@@ -50,3 +53,42 @@ class TestSimulateDSM:
         u = 0.5*np.sin(2.*np.pi*f/N*np.arange(N))
         v, d1, d2, d3 = simulateDSM(u, H)
         np.testing.assert_equal(v, d)
+
+    def test_multi_quantizer(self):
+        # Independent loops with the same NTF, driven by their own input
+        ntf = synthesizeNTF(5, 32, 1)
+        A, B2, C, D2 = (np.real(x) for x in sp.zpk2ss(ntf[1], ntf[0], -1))
+
+        def abcd(nq):
+            ABCD = np.zeros((6*nq, 7*nq))
+            for i in range(nq):
+                ABCD[5*i:5*i+5, 5*i:5*i+5] = A
+                ABCD[5*i:5*i+5, 5*nq+i] = -B2[:, 0]
+                ABCD[5*i:5*i+5, 6*nq+i] = B2[:, 0]
+                ABCD[5*nq+i, 5*i:5*i+5] = C[0]
+                ABCD[5*nq+i, 5*nq+i] = 1.
+            return ABCD
+
+        N = 500
+        u = 0.5*np.sin(2.*np.pi*85/8192*np.arange(N))
+        e_v = simulateDSM(u, abcd(1))[0]
+        res = []
+        for backend in ['scipy', 'scipy_blas', 'cblas']:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", category=PyDsmSlowPathWarning)
+                try:
+                    res.append(simulateDSM(
+                        np.vstack((u, 0.5*u)), abcd(2), [2, 2],
+                        backend=backend, store_xn=True, store_xmax=True,
+                        store_y=True))
+                except RuntimeError:
+                    # cblas backend not available
+                    pass
+        v, xn, xmax, y = res[0]
+        assert v.shape == (2, N)
+        np.testing.assert_equal(v[0], e_v)
+        for r in res[1:]:
+            np.testing.assert_equal(r[0], v)
+            for x, e_x in zip(r[1:], (xn, xmax, y)):
+                np.testing.assert_allclose(x, e_x, rtol=0,
+                                           atol=1E-6*np.max(np.abs(e_x)))
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2026, Sergio Callegari
+# All rights reserved.
+
+# This file is part of PyDSM.
+
+# PyDSM is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# PyDSM is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with PyDSM.  If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import division, print_function
+
+import numpy as np
+import scipy.signal as sp
+from pydsm.delsig import (evalTF, evalRPoly, evalTFBatch, ucGrid,
+                          synthesizeNTF)
+
+__all__ = ["TestEvalTF"]
+
+
+class TestEvalTF:
+
+    @classmethod
+    def setup_class(cls):
+        cls.ntfs = [synthesizeNTF(order, 64, 1) for order in [3, 4, 5, 6]]
+        cls.z = ucGrid(256)
+        cls.e_h = np.asarray([evalTF(ntf, cls.z) for ntf in cls.ntfs])
+
+    def test_evalRPoly(self):
+        rr = [0.5, -0.25+0.5j, np.inf]
+        x = np.asarray([0.1, 1j, 2.])
+        e_y = 2*(x-rr[0])*(x-rr[1])
+        np.testing.assert_allclose(evalRPoly(rr, x, 2), e_y)
+        np.testing.assert_allclose(evalRPoly([], x, 3), 3*np.ones(3))
+
+    def test_ucGrid(self):
+        z = ucGrid(5, 0.1, 0.2)
+        np.testing.assert_allclose(
+            z, np.exp(2j*np.pi*np.linspace(0.1, 0.2, 5)))
+        assert ucGrid(5, 0.1, 0.2) is z
+        assert not z.flags.writeable
+
+    def test_batch_zpk(self):
+        h = evalTFBatch(self.ntfs, self.z)
+        np.testing.assert_allclose(h, self.e_h, rtol=1e-12)
+        h = evalTFBatch(self.ntfs, self.z, mode='sections')
+        np.testing.assert_allclose(h, self.e_h, rtol=1e-12)
+
+    def test_batch_stacked_zpk(self):
+        zz = np.asarray([self.ntfs[2][0]]*3)
+        pp = np.asarray([self.ntfs[2][1]]*3)
+        kk = np.ones(3)
+        h = evalTFBatch((zz, pp, kk), self.z.reshape(16, 16))
+        assert h.shape == (3, 16, 16)
+        np.testing.assert_allclose(h[1].reshape(-1), self.e_h[2],
+                                   rtol=1e-12)
+
+    def test_batch_tuple(self):
+        # Tuples of three transfer functions are not stacked zpk triples
+        h = evalTFBatch(tuple(self.ntfs[:3]), self.z)
+        np.testing.assert_allclose(h, self.e_h[:3], rtol=1e-12)
+        ba = tuple(sp.zpk2tf(*ntf) for ntf in [self.ntfs[0]]*3)
+        h = evalTFBatch(ba, self.z)
+        np.testing.assert_allclose(h, [self.e_h[0]]*3, rtol=0, atol=1e-10)
+
+    def test_batch_ba(self):
+        ba = [sp.zpk2tf(*ntf) for ntf in self.ntfs]
+        h = evalTFBatch(ba, self.z)
+        # Polynomial form is inaccurate in relative terms close to the zeros
+        np.testing.assert_allclose(h, self.e_h, rtol=0, atol=1e-10)
+
+    def test_batch_list_coeffs(self):
+        x = np.asarray([0.1, 1j, -2.])
+        ba = [([1, -1], [1, -0.5]), ([1], [1., 0.25])]
+        h = evalTFBatch(ba, x)
+        np.testing.assert_allclose(h, [evalTF(tf, x) for tf in ba])
+
+    def test_batch_sos(self):
+        sos = np.asarray([sp.zpk2sos(*ntf) for ntf in self.ntfs[:2]])
+        h = evalTFBatch(sos, self.z)
+        np.testing.assert_allclose(h, self.e_h[:2], rtol=0, atol=1e-12)
+
+    def test_batch_sections_high_order(self):
+        z = np.exp(1j*np.linspace(0.1, 3, 400))
+        p = 0.99*z
+        x = np.asarray([50.])
+        with np.errstate(over='ignore', invalid='ignore'):
+            h = evalTFBatch([(z, p, 1)], x, mode='sections')
+        assert np.isfinite(h).all()
+        np.testing.assert_allclose(np.abs(h), np.prod(np.abs((x-z)/(x-p))))
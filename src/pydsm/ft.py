@@ -37,6 +37,14 @@ Functions
     dtft_hermitian  -- DTFT specialized to hermitian vectors
     idtft -- inverse discrete time Fourier transform
     idtft_hermitian -- IDTFT specialized to hermitian vectors
+
+Classes
+-------
+
+.. autosummary::
+   :toctree: generated/
+
+    DTFT  -- callable DTFT of a vector, evaluated on arrays of frequencies
 """
 
 from __future__ import division, print_function
@@ -48,7 +56,7 @@ __import__("scipy.integrate")
 from .utilities import digested_options
 
 __all__ = ["fft_centered", "dtft", "dtft_hermitian", "idtft",
-           "idtft_hermitian"]
+           "idtft_hermitian", "DTFT"]
 
 
 def fft_centered(x, fs=1):
@@ -87,6 +95,140 @@ def fft_centered(x, fs=1):
     return(ff, X)
 
 
+class DTFT(object):
+    """
+    Discrete time Fourier transform of a vector, as a callable object.
+
+    The object stores the vector and its time basis, so that it can be
+    evaluated repeatedly and on arrays of frequencies at once.
+
+    Parameters
+    ----------
+    x :  array_like
+        the 1-D vector to compute the DTFT upon
+    fs : real, optional
+        sample frequency for the input vector (defaults to 1)
+    t0 : real, optional
+        the time when x[0] is sampled (defaults to 0). This is expressed
+        in sample intervals.
+    hermitian : bool, optional
+        if True, x is taken as the positive side of a hermitian vector and
+        the DTFT is real, as in :func:`dtft_hermitian`. Defaults to False.
+
+    Notes
+    -----
+    Calling the object with an array of frequencies returns an array of
+    the same shape. Few frequencies are dealt with by a product with the
+    basis of complex exponentials, many of them by a Horner scheme, that
+    takes a vector operation per sample of x.
+    For frequencies on a uniform grid, method :meth:`uniform` is much
+    faster, since it uses a zero padded FFT or a chirp-z transform.
+    """
+
+    _horner_min = 32
+
+    def __init__(self, x, fs=1, t0=0, hermitian=False):
+        self.hermitian = hermitian
+        self.fs = float(fs)
+        if hermitian:
+            self.x = np.asarray(x).real.astype(float)
+            self.t0 = 0.
+        else:
+            self.x = np.asarray(x)
+            self.t0 = float(t0)
+        self.nn = np.arange(len(self.x))-self.t0
+
+    def _finish(self, v):
+        # From the plain DTFT of x to the hermitian one
+        if self.hermitian:
+            return 2*v.real-self.x[0]
+        return v
+
+    def basis(self, f):
+        """
+        Compute the DTFT basis at some frequencies.
+
+        Parameters
+        ----------
+        f : array_like
+            1-D vector of frequencies
+
+        Returns
+        -------
+        b : ndarray
+            matrix with a row per frequency, such that the DTFT at the
+            frequencies is the product of b and x (before the hermitian
+            correction, if any)
+        """
+        f = np.asarray(f, dtype=float).reshape(-1)
+        return np.exp(-2j*np.pi/self.fs*np.outer(f, self.nn))
+
+    def __call__(self, f):
+        f = np.asarray(f, dtype=float)
+        ff = f.reshape(-1)
+        if ff.size < self._horner_min:
+            v = self.basis(ff).dot(self.x)
+        else:
+            # Horner scheme in z**-1, avoiding the exponentials of the basis
+            zi = np.exp(-2j*np.pi/self.fs*ff)
+            v = np.zeros(ff.size, dtype=complex)
+            for c in self.x[::-1]:
+                v *= zi
+                v += c
+            v *= np.exp(2j*np.pi/self.fs*self.t0*ff)
+        v = self._finish(v).reshape(f.shape)
+        return v[()] if v.ndim == 0 else v
+
+    def uniform(self, f1, f2, n):
+        """
+        Evaluate the DTFT on a uniform grid of frequencies.
+
+        Parameters
+        ----------
+        f1 : real
+            first frequency
+        f2 : real
+            last frequency
+        n : int
+            number of frequencies, uniformly spaced in [f1, f2] as
+            in ``numpy.linspace``
+
+        Returns
+        -------
+        X : ndarray
+            the values of the DTFT at the frequencies
+
+        Notes
+        -----
+        When the grid is a subset of the bins of an FFT at least as long as
+        the vector, a zero padded FFT is used. Otherwise, the computation
+        relies on the chirp-z transform.
+        """
+        if n == 1:
+            return np.atleast_1d(self(f1))
+        d = (f2-f1)/(n-1)
+        m = len(self.x)
+        M = self.fs/d if d != 0 else 0
+        k1 = f1/d if d != 0 else 0
+        if (d > 0 and np.isclose(M, round(M), rtol=0, atol=1e-9) and
+                np.isclose(k1, round(k1), rtol=0, atol=1e-9)):
+            M = int(round(M))
+            L = max(M, m)
+            L = M*(-(-L//M))
+            from scipy.fft import fft
+            v = fft(self.x, L)[(np.arange(n)*(L//M) +
+                                int(round(k1))*(L//M)) % L]
+        else:
+            w = np.exp(-2j*np.pi*d/self.fs)
+            a = np.exp(2j*np.pi*f1/self.fs)
+            from scipy.signal import czt
+            v = czt(self.x, n, w, a)
+        ff = f1+d*np.arange(n)
+        if self.t0 != 0:
+            v = v*np.exp(2j*np.pi*ff/self.fs*self.t0)
+        return self._finish(v)
+
+
 def dtft(x, fs=1, t0=0):
     """
     Computes the discrete time Fourier transform (DTFT).
@@ -100,8 +242,10 @@ def dtft(x, fs=1, t0=0):
 
     Returns
     -------
-    X : callable
-        a function of frequency as in X(f), corresponding to the DTFT of x
+    X : DTFT
+        a callable object, as in X(f), corresponding to the DTFT of x. It
+        accepts arrays of frequencies and can be evaluated on uniform
+        frequency grids by FFT (see :class:`DTFT`).
 
     Other Parameters
     ----------------
@@ -111,7 +255,7 @@ def dtft(x, fs=1, t0=0):
         the time when x[0] is sampled (defaults to 0). This is expressed
         in sample intervals.
     """
-    return lambda f: np.sum(x*np.exp(-2j*np.pi*f/fs*(np.arange(len(x))-t0)))
+    return DTFT(x, fs, t0)
 
 
 def dtft_hermitian(x, fs=1):
@@ -129,18 +273,17 @@ def dtft_hermitian(x, fs=1):
 
     Returns
     -------
-    X : callable
-        a real function of frequency as in X(f), corresponding to the DTFT
-        of x
+    X : DTFT
+        a callable object, as in X(f), corresponding to the real DTFT
+        of x. It accepts arrays of frequencies and can be evaluated on
+        uniform frequency grids by FFT (see :class:`DTFT`).
 
     Other Parameters
     ----------------
     fs : real, optional
         sample frequency for the input vector (defaults to 1)
     """
-    x = x.real
-    return lambda f: \
-        x[0]+np.sum(x[1:]*2*np.cos(2*np.pi*f/fs*np.arange(1, len(x))))
+    return DTFT(x, fs, hermitian=True)
 
 
 def _idtft(Ff, t, fs=1, **quad_opts):
@@ -151,6 +294,13 @@ def _idtft(Ff, t, fs=1, **quad_opts):
     return rr+1j*ri
 
 
+def _idtft_vec(Ff, tt, fs=1, **quad_opts):
+    tt = np.asarray(tt, dtype=float)
+    return sp.integrate.quad_vec(
+        lambda f: Ff(f*fs)*np.exp(2j*np.pi*f*tt), -0.5, 0.5,
+        norm='max', **quad_opts)[0]
+
+
 def idtft(Ff, tt, fs=1, **options):
     """Compute the inverse discrete time Fourier transform (IDTFT)
 
@@ -170,27 +320,48 @@ def idtft(Ff, tt, fs=1, **options):
     ----------------
     fs : real, optional
         the sample frequency for the output sequence (defaults to 1)
+    method : string, optional
+        either ``vector`` (default) or ``quad``. With ``vector``, a single
+        adaptive integration of a complex vector valued function is
+        practiced for all the time values, so that Ff is evaluated once per
+        quadrature node. With ``quad``, two scalar integrations (for the
+        real and imaginary parts) are practiced for each time value.
     quad_opts : dictionary
-        Parameters to be passed to the ``quad`` function used internally as
-        an integrator. Allowed options are ``epsabs``, ``epsrel``, ``limit``,
-        ``points``. Do not use other options since they could break the
-        integrator in unexpected ways. Defaults can be set by changing the
-        function ``default_options`` attribute.
+        Parameters to be passed to the ``quad`` or ``quad_vec`` function
+        used internally as an integrator. Allowed options are ``epsabs``,
+        ``epsrel``, ``limit``, ``points``. Do not use other options since
+        they could break the integrator in unexpected ways. Defaults can be
+        set by changing the function ``default_options`` attribute.
+
+    Notes
+    -----
+    With the ``vector`` method, the tolerances apply to the largest error
+    over the time values and ``limit`` bounds the number of subintervals
+    shared by all of them.
 
     See Also
     --------
     scipy.integrate.quad : integrator used internally.
         For the meaning of the integrator parameters.
+    scipy.integrate.quad_vec : vector valued integrator used internally.
     """
     # Manage optional parameters
-    opts = digested_options(options, idtft.default_options, [], ['quad_opts'])
+    opts = digested_options(options, idtft.default_options, ['method'],
+                            ['quad_opts'])
     # Do the computation
+    if opts['method'] == 'vector':
+        x = _idtft_vec(Ff, tt, fs, **opts['quad_opts'])
+        return x[()] if np.isscalar(tt) else x
+    elif opts['method'] != 'quad':
+        raise ValueError('Unsupported integration method {}'.format(
+            opts['method']))
     if np.isscalar(tt):
         return _idtft(Ff, tt, fs, **opts['quad_opts'])
     else:
         return np.asarray([_idtft(Ff, t, fs, **opts['quad_opts']) for t in tt])
 
-idtft.default_options = {"quad_opts": {"epsabs": 1E-12,
+idtft.default_options = {"method": "vector",
+                         "quad_opts": {"epsabs": 1E-12,
                                        "epsrel": 1E-9,
                                        "limit": 100,
                                        "points": None}}
@@ -201,6 +372,13 @@ def _idtft_hermitian(Ff, t, fs=1, **quad_opts):
                                0, 0.5, **quad_opts)[0]
 
 
+def _idtft_hermitian_vec(Ff, tt, fs=1, **quad_opts):
+    tt = np.asarray(tt, dtype=float)
+    return 2*sp.integrate.quad_vec(
+        lambda f: np.real(Ff(f*fs))*np.cos(2*np.pi*f*tt), 0, 0.5,
+        norm='max', **quad_opts)[0]
+
+
 def idtft_hermitian(Ff, tt, fs=1, **options):
     """Compute the inverse discrete time Fourier transform (IDTFT) for a
     hermitian function of frequency.
@@ -226,21 +404,42 @@ def idtft_hermitian(Ff, tt, fs=1, **options):
     ----------------
     fs : real, optional
         the sample frequency for the output sequence (defaults to 1)
+    method : string, optional
+        either ``vector`` (default) or ``quad``. With ``vector``, a single
+        adaptive integration of the real vector valued function
+        Re(Ff(f)) cos(2 pi f t) is practiced over [0, 1/2] for all the time
+        values at once, so that Ff is evaluated once per quadrature node.
+        With ``quad``, one scalar integration of the same cosine integrand
+        is practiced for each time value.
     quad_opts : dictionary
-        Parameters to be passed to the ``quad`` function used internally as
-        an integrator. Allowed options are ``epsabs``, ``epsrel``, ``limit``,
-        ``points``. Do not use other options since they could break the
-        integrator in unexpected ways. Defaults can be set by changing the
-        function ``default_options`` attribute.
+        Parameters to be passed to the ``quad`` or ``quad_vec`` function
+        used internally as an integrator. Allowed options are ``epsabs``,
+        ``epsrel``, ``limit``, ``points``. Do not use other options since
+        they could break the integrator in unexpected ways. Defaults can be
+        set by changing the function ``default_options`` attribute.
+
+    Notes
+    -----
+    With the ``vector`` method, the tolerances apply to the largest error
+    over the time values and ``limit`` bounds the number of subintervals
+    shared by all of them.
 
     See Also
     --------
     scipy.integrate.quad : integrator used internally.
         For the meaning of the integrator parameters.
+    scipy.integrate.quad_vec : vector valued integrator used internally.
     """
     # Manage optional parameters
-    opts = digested_options(options, idtft.default_options, [], ['quad_opts'])
+    opts = digested_options(options, idtft.default_options, ['method'],
+                            ['quad_opts'])
     # Do the computation
+    if opts['method'] == 'vector':
+        x = _idtft_hermitian_vec(Ff, tt, fs, **opts['quad_opts'])
+        return x[()] if np.isscalar(tt) else x
+    elif opts['method'] != 'quad':
+        raise ValueError('Unsupported integration method {}'.format(
+            opts['method']))
     if np.isscalar(tt):
         return _idtft_hermitian(Ff, tt, fs, **opts['quad_opts'])
     else:
@@ -23,8 +23,8 @@ Computation of the impulse response of a DT filter (:mod:`pydsm.ir`)
 ====================================================================
 
 Compute (approximating by truncation) the impulse response
-of a discrete time filter, trying to (roughly) guess the appropriate
-truncation.
+of a discrete time filter, truncating it where the energy left in the
+tail of the response is negligible.
 
 .. currentmodule:: pydsm.ir
 
@@ -36,15 +36,19 @@ Functions
 
     guess_ir_length  -- Guess appropriate truncation length
     impulse_response  -- Compute impulse response of DT filter
+    impulse_responses  -- Compute impulse responses of many DT filters
 """
 
 from __future__ import division, print_function
 
 import numpy as np
 import scipy as sp
+from warnings import warn
+from .exceptions import PyDsmApproximationWarning
 __import__("scipy.signal")
+__import__("scipy.linalg")
 
-__all__ = ["impulse_response", "guess_ir_length"]
+__all__ = ["impulse_response", "impulse_responses", "guess_ir_length"]
 
 
 def impulse_response(h, m=None, db=80):
@@ -65,28 +69,223 @@ def impulse_response(h, m=None, db=80):
     ----------------
     m : int, optional
         the number of samples after which the impulse response should be
-        truncated. Defaults to None, which means *try to guess*
+        truncated. Defaults to None, which means that the response is
+        truncated as soon as the energy in its tail is attenuated by db
+        with respect to the energy of the whole response.
     db : real, optional
-        a hint about how to guess the length where the impuls response
-        should be truncated (defaults to 80)
+        the attenuation of the energy in the tail of the truncated impulse
+        response (defaults to 80)
 
     Notes
     -----
-    The guess about the lenght where the impulse response can be truncated
-    is extremely rough. See :func:`guess_ir_length` in this module for
-    further info.
+    The filter is realized as a cascade of second order sections, unless m
+    is given and the filter order is low enough for its nd form to be
+    accurate, which is cheaper. If m is not given, the response is
+    computed block by block until the energy left in the tail, that is
+    known exactly from the filter state and observability gramian, is
+    small enough. Then the response is cut at the first sample where this
+    happens. This requires the filter to be stable.
+
+    If the tail cannot be made small enough within 2**24 samples, the
+    response is truncated there with a warning.
+
+    See Also
+    --------
+    impulse_responses : for a batch of filters.
+    """
+    return _impulse_response(h, m, db)
+
+
+def impulse_responses(hh, m=None, db=80):
     """
-    if len(h) == 3:
+    Computes the impulse responses of many filters
+
+    Parameters
+    ----------
+    hh : sequence of tuple_like
+        the filter definitions, each either in zpk or in nd form.
+
+    Returns
+    -------
+    irs : list of ndarrays
+        the truncated impulse responses. Unless m is given, each one has
+        its own length.
+
+    Other Parameters
+    ----------------
+    m : int, optional
+        the number of samples after which the impulse responses should be
+        truncated. Defaults to None, which means that each response is
+        truncated as soon as the energy in its tail is attenuated by db
+        with respect to the energy of the whole response.
+    db : real, optional
+        the attenuation of the energy in the tail of the truncated impulse
+        responses (defaults to 80)
+
+    Notes
+    -----
+    The filters are processed one after the other, as in
+    :func:`impulse_response`.
+    """
+    return [_impulse_response(h, m, db) for h in hh]
+
+
+# Maximum length of the impulse responses truncated by their tail energy
+_MAX_IR_LENGTH = 2**24
+
+# Maximum filter order for which the fixed length responses are computed
+# in nd form rather than by second order sections
+_ND_MAX_ORDER = 4
+
+
+def _quadratics(rr):
+    """
+    Group roots into real polynomials of degree up to two.
+
+    Returns the groups of roots and the coefficients of the corresponding
+    monic polynomials of degree two, or None if the roots do not
+    come in conjugate pairs. Complex pairs come first, then the real roots
+    paired in order of magnitude.
+    """
+    rr = np.asarray(rr, dtype=complex).reshape(-1)
+    tol = 100*np.finfo(float).eps*np.maximum(np.abs(rr), 1.)
+    isreal = np.abs(rr.imag) <= tol
+    cc = rr[~isreal & (rr.imag > 0)]
+    ccn = rr[~isreal & (rr.imag < 0)]
+    if len(cc) != len(ccn):
+        return None
+    cc = cc[np.argsort(cc.real)]
+    ccn = np.conj(ccn[np.argsort(ccn.real)])
+    if len(cc) and np.max(np.abs(cc-ccn)) > 1E-8*np.max(np.abs(cc)):
+        return None
+    re = np.sort(rr[isreal].real)
+    re = re[np.argsort(np.abs(re), kind='stable')]
+    # Pad the real roots with a root in zero
+    re = np.append(re, np.zeros(len(re) % 2)).reshape(-1, 2)
+    groups = [np.asarray([c, np.conj(c)]) for c in cc]
+    groups += list(re.astype(complex))
+    polys = np.empty((len(groups), 3))
+    polys[:, 0] = 1.
+    polys[:, 1] = np.concatenate((-2*cc.real, -re[:, 0]-re[:, 1]))
+    polys[:, 2] = np.concatenate((np.abs(cc)**2, re[:, 0]*re[:, 1]))
+    return groups, list(polys)
+
+
+def _zpk2sos(z, p, k):
+    """
+    Convert a real filter from zpk to sos form.
+
+    A lightweight alternative to scipy.signal.zpk2sos for the impulse
+    response computation. The pole sections are taken from the one closest
+    to the unit circle and each one gets the section of the nearest zeros.
+    Returns None if the roots do not come in conjugate pairs.
+    """
+    zq = _quadratics(z)
+    pq = _quadratics(p)
+    if zq is None or pq is None:
+        return None
+    zg, zs = zq
+    pg, ps = pq
+    n = max(len(zs), len(ps), 1)
+    zs += [np.asarray([1., 0., 0.])]*(n-len(zs))
+    zg += [np.zeros(0)]*(n-len(zg))
+    ps += [np.asarray([1., 0., 0.])]*(n-len(ps))
+    pg += [np.zeros(0)]*(n-len(pg))
+    sos = np.empty((n, 6))
+    free = list(range(n))
+    for i in np.argsort([-np.max(np.abs(g), initial=0.) for g in pg]):
+        d = [np.min(np.abs(zg[j][:, np.newaxis]-pg[i]), initial=np.inf)
+             for j in free]
+        j = free.pop(int(np.argmin(d)))
+        # Sections closest to the unit circle last
+        sos[len(free), :3] = zs[j]
+        sos[len(free), 3:] = ps[i]
+    sos[0, :3] *= np.real(k)
+    return sos
+
+
+def _sos(h):
+    # Filter in zpk and sos form
+    if len(h) == 2:
+        h = sp.signal.tf2zpk(*h)
+    sos = _zpk2sos(*h)
+    if sos is None:
+        # Roots not in conjugate pairs, keep the real part of the filter
         (b, a) = sp.signal.zpk2tf(*h)
-        b = b.real
-        a = a.real
-    else:
-        (b, a) = h
-    if m is None:
-        m = guess_ir_length(h, db)
-    ins = np.zeros(m)
-    ins[0] = 1
-    return sp.signal.lfilter(b, a, ins)
+        sos = sp.signal.tf2sos(b.real, a.real)
+    return h, sos
+
+
+def _sos_ss(sos):
+    """
+    State space realization of a cascade of second order sections.
+
+    The state is the one used by scipy.signal.sosfilt (the two delays of
+    each transposed direct form II section). Returns the state matrix and
+    the output vector for the zero input evolution.
+    """
+    n = 2*len(sos)
+    A = np.zeros((n, n))
+    # Input of the current section as a function of the state
+    u = np.zeros(n)
+    for i, (b0, b1, b2, a0, a1, a2) in enumerate(sos):
+        y = b0*u
+        y[2*i] += 1.
+        A[2*i] = b1*u-a1*y
+        A[2*i, 2*i+1] += 1.
+        A[2*i+1] = b2*u-a2*y
+        u = y
+    return A, u
+
+
+def _impulse_response(h, m, db):
+    if m is not None:
+        ins = np.zeros(m)
+        ins[0] = 1
+        order = max(np.size(h[0]), np.size(h[1]))-(len(h) == 2)
+        if order <= _ND_MAX_ORDER:
+            # Low order, filter directly in nd form, which is the cheapest
+            if len(h) == 3:
+                (b, a) = sp.signal.zpk2tf(*h)
+                b = b.real
+                a = a.real
+            else:
+                (b, a) = h
+            return sp.signal.lfilter(b, a, ins)
+        return sp.signal.sosfilt(_sos(h)[1], ins)
+    h, sos = _sos(h)
+    if np.any(np.abs(h[1]) >= 1):
+        raise ValueError('Cannot truncate the impulse response '
+                         'of an unstable filter')
+    A, C = _sos_ss(sos)
+    # Observability gramian, the energy of the zero input response from
+    # state x being x Q x
+    Q = sp.linalg.solve_discrete_lyapunov(A.T, np.outer(C, C),
+                                          method='bilinear')
+    zi = np.zeros((len(sos), 2))
+    y, zi = sp.signal.sosfilt(sos, [1.], zi=zi)
+    x = zi.reshape(-1)
+    tail = max(x.dot(Q).dot(x), 0.)
+    tol = 10.**(-db/10.)*(y[0]**2+tail)
+    yy = [y]
+    length = 1
+    block = max(guess_ir_length(h, db), 16)
+    while tail > tol:
+        if length >= _MAX_IR_LENGTH:
+            warn('Impulse response truncated at {} samples'.format(length),
+                 PyDsmApproximationWarning)
+            break
+        y, zi = sp.signal.sosfilt(sos, np.zeros(block), zi=zi)
+        x = zi.reshape(-1)
+        tail = max(x.dot(Q).dot(x), 0.)
+        yy.append(y)
+        length += block
+        block = min(2*block, _MAX_IR_LENGTH-length)
+    y = np.concatenate(yy)
+    # Tail energies after each sample, accumulated backwards
+    tails = tail+np.cumsum(y[::-1]**2)[::-1]
+    cut = np.flatnonzero(tails[1:] <= tol)
+    return y[:cut[0]+1] if len(cut) else y
 
 
 def guess_ir_length(h, db=80):
@@ -37,6 +37,7 @@ Functions returning ISO 226 contours
 
    iso226_spl_contour -- Equal loudness contour (tabled)
    iso226_spl_itpl  -- Interpolated equal loudness contour
+   iso226_spl_itpl2d  -- Interpolated equal loudness contours (phon, freq)
 
 
 Functions computing loudness/acoustic pressure
@@ -76,6 +77,11 @@ this module includes the possibility of delivering some modified ISO contours
 where the tabled data is augmented by creating a new data point at 20 kHz
 where the behavior found at 20 Hz is replicated.
 
+The interpolated contours are cached, so that asking repeatedly for the
+same loudness level is cheap. When the contours for many loudness levels
+are needed, :func:`iso226_spl_itpl2d` evaluates all of them in a single
+vectorized call.
+
 .. [1] ISO 226:2003 "Acoustics - Normal equal-loudness-level contours"
 .. [2] Jeff Tackett, "ISO 226 Equal-Loudness-Level Contour Signal,"
    2005
@@ -90,11 +96,12 @@ where the behavior found at 20 Hz is replicated.
 from __future__ import division, print_function
 
 import numpy as np
+from functools import lru_cache
 from scipy.interpolate import InterpolatedUnivariateSpline
 
 __all__ = ["tabled_f", "tabled_alpha_f", "tabled_L_U", "tabled_T_f",
            "tabled_L_p", "tabled_L_N",
-           "iso226_spl_contour", "iso226_spl_itpl"]
+           "iso226_spl_contour", "iso226_spl_itpl", "iso226_spl_itpl2d"]
 
 # Tabled ISO 226 parameters
 tbl_f = np.asarray(
@@ -188,13 +195,17 @@ def tabled_T_f(hfe=False):
     return np.append(tbl_T_f, tbl_T_f[0]) if hfe else tbl_T_f
 
 
-# Check that it works fine when L_N is array
+def _hfe(t):
+    # Augment tables along the frequency axis with the 20 kHz data point
+    return np.concatenate((t, t[..., :1]), axis=-1)
+
+
 def tabled_A_f(L_N, hfe=False):
     """Table of A_f values for given loundess in ISO 226.
 
     Parameters
     ----------
-    L_N : float
+    L_N : float or array of floats
         percieved loudness level in phons
     hfe : bool
         whether the table should be augmented with a data point
@@ -203,7 +214,8 @@ def tabled_A_f(L_N, hfe=False):
     Returns
     -------
     A_f : array of floats
-        the A_f table.
+        the A_f table. If L_N is an array, the table has an additional
+        last axis for the frequencies.
 
     Notes
     -----
@@ -211,12 +223,12 @@ def tabled_A_f(L_N, hfe=False):
     are measured in dBs by referring to a reference pressure level P0 (close
     to the hearing threshold at 1 kHz and set to 20 uPa RMS).
     """
+    L_N = np.asarray(L_N, dtype=float)[..., np.newaxis]
     A_f = (4.47E-3*(10.0**(0.025*L_N)-1.15) +
            (0.4*10.0**((tbl_T_f+tbl_L_U)/10.0-9.0))**tbl_alpha_f)
-    return np.append(A_f, A_f[0]) if hfe else A_f
+    return _hfe(A_f) if hfe else A_f
 
 
-# Check that it works fine when L_N is array
 def tabled_L_p(L_N, hfe=False):
     """Table of sound pressure levels for given loudness in ISO 226.
 
@@ -224,7 +236,7 @@ def tabled_L_p(L_N, hfe=False):
 
     Parameters
     ----------
-    L_N : float
+    L_N : float or array of floats
         percieved loudness level in phons
     hfe : bool
         whether the table should be augmented with a data point
@@ -234,7 +246,8 @@ def tabled_L_p(L_N, hfe=False):
     -------
     L_p : array of floats
         the sound pressure level table. Sound pressure levels are returned
-        in DB_SPL
+        in DB_SPL. If L_N is an array, the table has an additional last
+        axis for the frequencies.
 
     Notes
     -----
@@ -243,7 +256,7 @@ def tabled_L_p(L_N, hfe=False):
     to the hearing threshold at 1 kHz and set to 20 uPa RMS).
     """
     L_p = (10.0/tbl_alpha_f)*np.log10(tabled_A_f(L_N))-tbl_L_U + 94.0
-    return np.append(L_p, L_p[0]) if hfe else L_p
+    return _hfe(L_p) if hfe else L_p
 
 
 # Check that it works fine when L_P is array
@@ -372,6 +385,88 @@ def iso226_spl_itpl(L_N=40, hfe=False, k=3):
 
     The valid input phon range is 0-90 dB_SPL. Above 80 dB, only the
     frequency range 20-4000 Hz is significant.
+
+    The interpolation objects are cached by L_N, hfe and k, so the same
+    object is returned when the function is called again with the same
+    arguments. It should not be modified.
     """
+    return _spl_itpl(float(L_N), bool(hfe), int(k))
+
+
+@lru_cache(maxsize=256)
+def _spl_itpl(L_N, hfe, k):
     ff, yy = iso226_spl_contour(L_N, hfe)
     return InterpolatedUnivariateSpline(ff, yy, k=k)
+
+
+class _SplItpl2D(object):
+    # Equal loudness contours interpolated in frequency, for many
+    # loudness levels at once. The interpolating spline is linear in the
+    # tabled data, so the contours are obtained by a product of the
+    # tables of sound pressure levels and the cardinal splines.
+
+    def __init__(self, hfe, k):
+        self.hfe = hfe
+        ff = tabled_f(hfe)
+        self.basis = [InterpolatedUnivariateSpline(ff, e, k=k)
+                      for e in np.eye(len(ff))]
+
+    def __call__(self, L_N, f):
+        L_N = np.asarray(L_N, dtype=float)
+        if np.any(L_N < 0) or np.any(L_N > 90):
+            raise ValueError('Parameter L_N out of bounds [0-90].')
+        f = np.asarray(f, dtype=float)
+        bf = np.asarray([b(f.reshape(-1)) for b in self.basis])
+        spl = tabled_L_p(L_N, self.hfe).dot(bf)
+        return spl.reshape(L_N.shape+f.shape)
+
+
+def iso226_spl_itpl2d(hfe=False, k=3):
+    """Generates an interpolation of the equal loudness contours.
+
+    This function returns an interpolation object describing the equal
+    loudness contours for any phon level, according to ISO 226 sect 4.1.
+
+    Parameters
+    ----------
+    hfe : bool
+        whether the table should be augmented with a data point
+        at 20 kHz (High-Frequency-Enhanced table)
+    k : int
+        interpolation order
+
+    Returns
+    -------
+    itpl : bivariate interpolation object
+        function-like object that takes loudness levels L_N (in phons) and
+        frequencies f as its inputs and returns the equivalent sound
+        pressure levels. The output has shape ``L_N.shape+f.shape``, its
+        entry ``[i, j]`` being the level at ``L_N[i]`` and ``f[j]``.
+
+    Notes
+    -----
+    The contours are interpolated in frequency exactly as in
+    :func:`iso226_spl_itpl` and computed by the ISO 226 formulas in the
+    loudness level, so that ``iso226_spl_itpl2d()(L_N, f)`` matches
+    ``iso226_spl_itpl(L_N)(f)`` for any L_N.
+
+    The valid input phon range is 0-90 dB_SPL. Above 80 dB, only the
+    frequency range 20-4000 Hz is significant.
+
+    The interpolation objects are cached by hfe and k.
+
+    Examples
+    --------
+    Contours from 20 to 80 phons, as a 7 x 200 array:
+
+    >>> import numpy as np
+    >>> from pydsm.iso226 import iso226_spl_itpl2d
+    >>> spl = iso226_spl_itpl2d()(np.arange(20, 81, 10),
+    ...                           np.logspace(np.log10(20), 4, 200))
+    """
+    return _spl_itpl2d(bool(hfe), int(k))
+
+
+@lru_cache(maxsize=None)
+def _spl_itpl2d(hfe, k):
+    return _SplItpl2D(hfe, k)
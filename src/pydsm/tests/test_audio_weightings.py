@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2012-2024, Sergio Callegari
+# All rights reserved.
+
+# This file is part of PyDSM.
+
+# PyDSM is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# PyDSM is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with PyDSM.  If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import division, print_function
+
+import numpy as np
+import pytest
+from pydsm import audio_weightings as aw
+from pydsm.delsig import evalTFBatch
+
+__all__ = ["TestAudioWeightings"]
+
+
+class TestAudioWeightings:
+
+    @classmethod
+    def setup_class(cls):
+        cls.f = np.logspace(1, np.log10(20E3), 200)
+
+    def check_zpk(self, zpk, x, name, normal=True, rtol=1E-12):
+        h = evalTFBatch([zpk], x, mode='sections')[0]
+        w = getattr(aw, name+'_weighting')(self.f, normal, power=False)
+        np.testing.assert_allclose(np.abs(h), w, rtol=rtol)
+
+    def test_analog_zpk(self):
+        for name in 'abcdf':
+            zpk = aw.analog_zpk(name)
+            self.check_zpk(zpk, 2j*np.pi*self.f, name)
+            assert aw.analog_zpk(name.upper()) is zpk
+            assert not zpk[1].flags.writeable
+        for name in 'abc':
+            self.check_zpk(aw.analog_zpk(name, normal=False),
+                           2j*np.pi*self.f, name, normal=False)
+
+    def test_a_zpk(self):
+        # The A-weighting pole is at 737.9 Hz, as in the formula
+        h = evalTFBatch([aw.a_zpk], 2j*np.pi*self.f, mode='sections')[0]
+        w = aw.a_weighting(self.f, False, power=False)
+        np.testing.assert_allclose(np.abs(h), w, rtol=1E-12)
+        assert np.isclose(np.sort(-aw.a_zpk[1])[3]/(2*np.pi), 737.9)
+
+    def test_digital_zpk(self):
+        fs = 2*64*22.05E3
+        x = np.exp(2j*np.pi*self.f/fs)
+        for name in 'abcdf':
+            for method, rtol in [('bilinear', 1E-2), ('matched', 1E-2)]:
+                zpk = aw.digital_zpk(name, fs, method)
+                self.check_zpk(zpk, x, name, rtol=rtol)
+                assert aw.digital_zpk(name, fs, method) is zpk
+                assert np.all(np.abs(zpk[1]) < 1)
+        # Discretization error is small where the weighting is defined
+        self.check_zpk(aw.digital_zpk('a', fs), x, 'a', rtol=5E-4)
+        np.testing.assert_allclose(
+            np.abs(evalTFBatch([aw.digital_zpk('a', 48E3)],
+                               np.exp(2j*np.pi*1000./48E3))), 1.)
+
+    def test_bad_args(self):
+        for args in [('g', 48E3), ('a', 1E3), ('a', 48E3, 'impulse')]:
+            with pytest.raises(ValueError):
+                aw.digital_zpk(*args)
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2026, Sergio Callegari
+# All rights reserved.
+
+# This file is part of PyDSM.
+
+# PyDSM is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# PyDSM is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with PyDSM.  If not, see <https://www.gnu.org/licenses/>.
+from __future__ import division, print_function
+
+import numpy as np
+from pydsm.correlations import raw_acorr, raw_xcorr
+
+__all__ = ["TestCorrelations"]
+
+
+class TestCorrelations:
+
+    def setUp(self):
+        pass
+
+    @staticmethod
+    def _e_xcorr(x, y, N):
+        mx = len(x)
+        my = len(y)
+        return np.asarray([np.dot(y[k:min(my, mx+k)], x[0:min(my-k, mx)])
+                           for k in range(N+1)])
+
+    def test_acorr_methods(self):
+        x = np.random.RandomState(0).randn(1000)
+        e_q = self._e_xcorr(x, x, 40)
+        for method in ['direct', 'fft', 'auto']:
+            np.testing.assert_allclose(raw_acorr(x, 40, method), e_q,
+                                       rtol=0, atol=1e-10)
+        np.testing.assert_allclose(raw_acorr([1, 2, 3], 3, 'fft'),
+                                   [14, 8, 3, 0], rtol=0, atol=1e-12)
+
+    def test_xcorr_methods(self):
+        rs = np.random.RandomState(1)
+        x = rs.randn(500)+1j*rs.randn(500)
+        y = rs.randn(300)
+        for a, b in [(x, y), (y, x)]:
+            e_q = self._e_xcorr(a, b, 30)
+            for method in ['direct', 'fft']:
+                np.testing.assert_allclose(raw_xcorr(a, b, 30, method), e_q,
+                                           rtol=0, atol=1e-10)
+
+    def test_batch(self):
+        xx = np.random.RandomState(2).randn(3, 400)
+        for method in ['direct', 'fft']:
+            q = raw_acorr(xx, 20, method)
+            assert q.shape == (3, 21)
+            for x, qq in zip(xx, q):
+                np.testing.assert_allclose(qq, self._e_xcorr(x, x, 20),
+                                           rtol=0, atol=1e-10)
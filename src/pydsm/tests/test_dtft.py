@@ -48,3 +48,41 @@ class TestDTFT:
         Ff = dtft_hermitian(xx)
         xx2 = idtft_hermitian(Ff, np.arange(10))
         np.testing.assert_allclose(xx, xx2, atol=1E-12)
+
+    def test_dtft_array(self):
+        xx = np.random.RandomState(0).randn(20)
+        ff = np.linspace(-0.5, 1, 100)
+        for fs, t0 in [(1, 0), (3., 2.5)]:
+            Ff = dtft(xx, fs, t0)
+            e_X = [np.sum(xx*np.exp(-2j*np.pi*f*fs/fs*(np.arange(20)-t0)))
+                   for f in ff]
+            np.testing.assert_allclose(Ff(ff*fs), e_X, rtol=0, atol=1e-12)
+            np.testing.assert_allclose(Ff(ff[:5]*fs), e_X[:5],
+                                       rtol=0, atol=1e-12)
+            assert np.isscalar(Ff(0.1))
+            assert Ff(ff.reshape(10, 10)).shape == (10, 10)
+
+    def test_dtft_uniform(self):
+        xx = np.random.RandomState(1).randn(20)
+        Ff = dtft(xx, 2., 1.)
+        Gg = dtft_hermitian(xx, 2.)
+        for f1, f2, n in [(0, 2., 65), (-1., 1., 16), (0.01, 0.3, 50)]:
+            ff = np.linspace(f1, f2, n)
+            np.testing.assert_allclose(Ff.uniform(f1, f2, n), Ff(ff),
+                                       rtol=0, atol=1e-12)
+            np.testing.assert_allclose(Gg.uniform(f1, f2, n), Gg(ff),
+                                       rtol=0, atol=1e-12)
+
+    def test_idtft_methods(self):
+        xx = np.arange(1, 11)
+        Ff = dtft(xx)
+        Gg = dtft_hermitian(xx)
+        tt = np.arange(10)
+        for method in ['vector', 'quad']:
+            np.testing.assert_allclose(idtft(Ff, tt, method=method), xx,
+                                       atol=1E-12)
+            np.testing.assert_allclose(
+                idtft_hermitian(Gg, tt, method=method), xx, atol=1E-12)
+        x3 = idtft(Ff, 3, method='vector')
+        assert np.isscalar(x3)
+        np.testing.assert_allclose(x3, 4, atol=1E-12)
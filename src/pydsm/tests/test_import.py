@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2026, Sergio Callegari
+# All rights reserved.
+
+# This file is part of PyDSM.
+
+# PyDSM is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# PyDSM is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with PyDSM.  If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import division, print_function
+
+import sys
+import subprocess
+import pydsm
+
+__all__ = ["TestImport"]
+
+
+def _modules_after(statement):
+    # Modules loaded by a fresh interpreter running the statement
+    code = statement+"; import sys; print(' '.join(sys.modules))"
+    out = subprocess.run([sys.executable, "-c", code], check=True,
+                         capture_output=True, text=True).stdout
+    return set(out.split())
+
+
+class TestImport:
+
+    def test_import_is_lazy(self):
+        mm = _modules_after("import pydsm")
+        for m in ["numpy", "scipy", "matplotlib", "pydsm.delsig",
+                  "pydsm.NTFdesign"]:
+            assert m not in mm
+
+    def test_simulator_import(self):
+        mm = _modules_after("from pydsm.simulation import simulateDSM")
+        for m in ["matplotlib", "scipy.signal", "scipy.optimize",
+                  "pydsm.delsig._plot",
+                  "pydsm.delsig._simulateDSM_scipy_blas"]:
+            assert m not in mm
+
+    def test_public_names(self):
+        for pkg in [pydsm.delsig, pydsm.NTFdesign]:
+            for name in pkg.__all__:
+                assert callable(getattr(pkg, name))
+                assert name in dir(pkg)
+        assert pydsm.NTFdesign.weighting.ntf_fir_weighting is \
+            pydsm.NTFdesign.ntf_fir_weighting
+        assert pydsm.simulation.simulateDSM is pydsm.delsig.simulateDSM
@@ -21,14 +21,24 @@
 from __future__ import division, print_function
 
 import numpy as np
+import pytest
 from scipy import signal
-from pydsm.ir import impulse_response
+from pydsm.ir import impulse_response, impulse_responses, guess_ir_length
 from pydsm.delsig import evalTF
 from pydsm.relab import db
 
 __all__ = ["TestIR"]
 
 
+def _lfilter_ir(h, m):
+    # Reference impulse response by direct filtering in nd form
+    if len(h) == 3:
+        h = signal.zpk2tf(*h)
+    ins = np.zeros(m)
+    ins[0] = 1
+    return signal.lfilter(h[0], h[1], ins)
+
+
 class TestIR:
 
     def setUp(self):
@@ -60,3 +70,50 @@ class TestIR:
         zpk = (np.roots(fir), np.zeros(4), 1)
         ir = impulse_response(zpk, db=80)
         np.testing.assert_allclose(fir, ir)
+
+    def test_ir_tail_energy(self):
+        # Clustered poles, where the guessed length is too short
+        zpk = ([0.5, -0.5], [0.99, 0.99, 0.99, 0.99], 1.)
+        ins = np.zeros(10000)
+        ins[0] = 1
+        e_ir = signal.lfilter(*signal.zpk2tf(*zpk), x=ins)
+        e_tot = np.sum(e_ir**2)
+        for db_tail in [60, 80, 120]:
+            ir = impulse_response(zpk, db=db_tail)
+            m = len(ir)
+            assert m > guess_ir_length(zpk, db_tail)
+            np.testing.assert_allclose(ir, e_ir[:m], rtol=1E-5)
+            assert np.sum(e_ir[m:]**2) <= 10**(-db_tail/10.)*e_tot
+            assert np.sum(e_ir[m-1:]**2) > 10**(-db_tail/10.)*e_tot
+
+    def test_ir_batch(self):
+        hh = [signal.butter(3, 0.01, output='zpk'),
+              signal.cheby1(6, 1, 0.05, output='zpk'),
+              signal.butter(2, 0.2),
+              ([], [], 2.)]
+        irs = impulse_responses(hh)
+        assert len(irs) == 4
+        for h, ir in zip(hh, irs):
+            np.testing.assert_allclose(ir, _lfilter_ir(h, len(ir)),
+                                       rtol=1e-5, atol=1e-12)
+        np.testing.assert_allclose(irs[3], [2.])
+        irs = impulse_responses(hh, m=50)
+        for h, ir in zip(hh, irs):
+            assert len(ir) == 50
+            np.testing.assert_allclose(ir, _lfilter_ir(h, 50), rtol=1e-5,
+                                       atol=1e-12)
+
+    def test_ir_fixed_length_high_order(self):
+        # The nd form is inaccurate here, sections must be used
+        h = signal.butter(8, 0.01, output='zpk')
+        ins = np.zeros(2000)
+        ins[0] = 1
+        e_ir = signal.sosfilt(signal.zpk2sos(*h), ins)
+        ir = impulse_response(h, m=2000)
+        np.testing.assert_allclose(ir, e_ir, rtol=0,
+                                   atol=1e-10*np.max(np.abs(e_ir)))
+
+    def test_ir_unstable(self):
+        with pytest.raises(ValueError):
+            impulse_response(([], [1.01], 1.))
+        assert len(impulse_response(([], [1.01], 1.), m=10)) == 10
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2012-2024, Sergio Callegari
+# All rights reserved.
+
+# This file is part of PyDSM.
+
+# PyDSM is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# PyDSM is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with PyDSM.  If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import division, print_function
+
+import numpy as np
+import pytest
+from pydsm.iso226 import (iso226_spl_itpl, iso226_spl_itpl2d,
+                          iso226_spl_contour, tabled_L_p)
+
+__all__ = ["TestIso226"]
+
+
+class TestIso226:
+
+    def test_tabled_L_p_array(self):
+        L_N = np.asarray([[10., 40.], [60., 90.]])
+        for hfe in [False, True]:
+            L_p = tabled_L_p(L_N, hfe)
+            assert L_p.shape == L_N.shape+(30 if hfe else 29,)
+            np.testing.assert_array_equal(L_p[1, 0], tabled_L_p(60., hfe))
+
+    def test_itpl_cache(self):
+        itpl = iso226_spl_itpl(40, True)
+        assert iso226_spl_itpl(40., True) is itpl
+        assert iso226_spl_itpl(40., False) is not itpl
+        ff, yy = iso226_spl_contour(40, True)
+        np.testing.assert_allclose(itpl(ff), yy, atol=1E-10)
+
+    def test_itpl2d(self):
+        L_N = np.linspace(0, 90, 10)
+        f = np.logspace(np.log10(20), np.log10(20E3), 100)
+        for hfe in [False, True]:
+            itpl = iso226_spl_itpl2d(hfe)
+            assert iso226_spl_itpl2d(hfe) is itpl
+            spl = itpl(L_N, f)
+            assert spl.shape == (10, 100)
+            for i, l in enumerate(L_N):
+                np.testing.assert_allclose(
+                    spl[i], iso226_spl_itpl(l, hfe)(f), rtol=0, atol=1E-10)
+        assert np.shape(itpl(40., 1000.)) == ()
+        with pytest.raises(ValueError):
+            itpl([40., 100.], f)
@@ -195,6 +195,47 @@ def digested_options(opts, defaults, keys=[], multikeys=[], emptycheck=True):
     return out
 
 
+def _uc_zero_pairs(om, th):
+    """
+    Squared magnitude of conjugate zero pairs on the unit circle.
+
+    The zeros are at exp(+/-1j*th). For each angular frequency in the
+    column om, returns the squared magnitude of the product of the factors
+    due to the zeros, together with its logarithmic derivative with
+    respect to each angle in th. A zero on a frequency gives no
+    contribution to the derivative, since the magnitude is null there.
+    """
+    a = 2-2*np.cos(om-th)
+    b = 2-2*np.cos(om+th)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        dl = (np.where(a > 0, -2*np.sin(om-th)/a, 0.) +
+              np.where(b > 0, 2*np.sin(om+th)/b, 0.))
+    return np.prod(a, axis=1)*np.prod(b, axis=1), dl
+
+
+def _parallel_map(fn, args, workers=1):
+    """
+    Map a function over a list of argument tuples, possibly in parallel.
+
+    With workers equal to 1 the calls are sequential. Otherwise, they are
+    distributed on a pool of threads (with as many threads as processors if
+    workers is None), so that closures can be used as fn. The results are
+    returned in the order of args.
+
+    Since threads are used, the calls only run in parallel when fn spends
+    its time in code releasing the GIL, such as large numpy operations or
+    solvers. For the small, interpreter bound cost functions of the
+    optimizers in this package, the pool provides concurrency rather than
+    a speedup, and the sequential default is normally the fastest.
+    """
+    args = list(args)
+    if workers == 1 or len(args) <= 1:
+        return [fn(*a) for a in args]
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(lambda a: fn(*a), args))
+
+
 # Following two functions are deprecated
 
 def db(x, signal_type='voltage', R=1):